@@ -7,6 +7,12 @@ import sys
 
 def main() -> None:
     """Main CLI entry point."""
+    # Plain `burrow serve` is how the MCP client launches the server; start it
+    # without building the parser tree. Anything else falls through to argparse.
+    if sys.argv[1:] == ["serve"]:
+        _serve()
+        return
+
     parser = argparse.ArgumentParser(
         prog="burrow",
         description="Burrow MCP - Home automation with Claude integration",
@@ -136,8 +142,7 @@ def main() -> None:
         sys.exit(1)
 
     if args.command == "serve":
-        from main import main as serve_main
-        asyncio.run(serve_main())
+        _serve()
 
     elif args.command == "discover":
         if args.discover_type is None:
@@ -152,6 +157,12 @@ def main() -> None:
         run_config_command(args)
 
 
+def _serve() -> None:
+    """Run the MCP server."""
+    from main import run
+    run()
+
+
 async def run_discovery(args: argparse.Namespace) -> None:
     """Run device discovery."""
     if args.discover_type == "lifx":
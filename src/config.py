@@ -1,15 +1,20 @@
 """Configuration loading for Burrow MCP."""
 
+import copy
+from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HouseConfig(BaseModel):
     """House-level configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = "Home"
     timezone: str = "America/New_York"
 
@@ -17,6 +22,8 @@ class HouseConfig(BaseModel):
 class RoomConfig(BaseModel):
     """Room configuration from config file."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     floor: int | None = None
@@ -25,6 +32,8 @@ class RoomConfig(BaseModel):
 class DeviceConfig(BaseModel):
     """Device configuration from config file."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     type: str
@@ -56,10 +65,23 @@ class SceneConfig(BaseModel):
 class BurrowConfig(BaseModel):
     """Main configuration model."""
 
+    model_config = ConfigDict(frozen=True)
+
     house: HouseConfig = Field(default_factory=HouseConfig)
     rooms: list[RoomConfig] = Field(default_factory=list)
     devices: list[DeviceConfig] = Field(default_factory=list)
     scenes: list[SceneConfig] = Field(default_factory=list)
+    # Seconds a device's refreshed state is reused by refresh_all; override
+    # per device with `refresh_ttl` in the device's config block
+    refresh_ttl: float = 2.0
+
+    @cached_property
+    def devices_by_type(self) -> dict[str, list[DeviceConfig]]:
+        """Device configs grouped by type, in config order."""
+        by_type: dict[str, list[DeviceConfig]] = defaultdict(list)
+        for device in self.devices:
+            by_type[device.type].append(device)
+        return dict(by_type)
 
 
 class SecretsConfig(BaseModel):
@@ -80,6 +102,11 @@ class SecretsConfig(BaseModel):
     tmdb_api_key: str | None = None
 
 
+# Config directories already located, keyed by (cwd, home). Only directories
+# that exist are remembered, so one created later (e.g. by init) is still found.
+_config_dir_cache: dict[tuple[Path, Path], Path] = {}
+
+
 def find_config_dir() -> Path:
     """Find the config directory.
 
@@ -89,26 +116,40 @@ def find_config_dir() -> Path:
     3. ~/.config/burrow
     """
     cwd = Path.cwd()
+    home = Path.home()
+    cached = _config_dir_cache.get((cwd, home))
+    if cached is not None:
+        return cached
 
-    if (cwd / "config").is_dir():
-        return cwd / "config"
+    for candidate in (cwd / "config", cwd.parent / "config", home / ".config" / "burrow"):
+        if candidate.is_dir():
+            _config_dir_cache[(cwd, home)] = candidate
+            return candidate
 
-    if (cwd.parent / "config").is_dir():
-        return cwd.parent / "config"
+    return cwd / "config"
 
-    home_config = Path.home() / ".config" / "burrow"
-    if home_config.is_dir():
-        return home_config
 
-    return cwd / "config"
+# libyaml's C loader is several times faster than the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML keyed by path, reused while the file's mtime and size are unchanged
+_yaml_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
 
 
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file, returning empty dict if not found."""
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path) as f:
+            cached = (key, yaml.load(f, Loader=_YamlLoader) or {})
+        _yaml_cache[path] = cached
+    return copy.deepcopy(cached[1])
 
 
 def load_config(config_dir: Path | None = None) -> BurrowConfig:
@@ -1,14 +1,24 @@
-"""Device implementations for Burrow MCP."""
+"""Device implementations for Burrow MCP.
+
+Backend modules are imported on first use, so a deployment only loads the
+integrations its config names.
+"""
+
+from collections.abc import Iterable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from devices.appletv import AppleTVDevice, create_appletv_device
-from devices.august import AugustLock, create_august_lock
-from devices.govee import GoveeLight, create_govee_light
-from devices.lifx import LifxLight, create_lifx_light
 from devices.manager import DeviceManager
-from devices.ring import RingCamera, create_ring_camera
-from devices.roomba import RoombaVacuum, create_roomba_vacuum
-from devices.roomba_cloud import RoombaCloudVacuum, create_roomba_cloud_vacuum
-from devices.tuya import TuyaPlug, create_tuya_plug
+
+if TYPE_CHECKING:
+    from devices.appletv import AppleTVDevice, create_appletv_device
+    from devices.august import AugustLock, create_august_lock
+    from devices.govee import GoveeLight, create_govee_light
+    from devices.lifx import LifxLight, create_lifx_light
+    from devices.ring import RingCamera, create_ring_camera
+    from devices.roomba import RoombaVacuum, create_roomba_vacuum
+    from devices.roomba_cloud import RoombaCloudVacuum, create_roomba_cloud_vacuum
+    from devices.tuya import TuyaPlug, create_tuya_plug
 
 __all__ = [
     "AppleTVDevice",
@@ -30,20 +40,59 @@ __all__ = [
     "create_tuya_plug",
 ]
 
-# Device type to factory mapping
+# Public name to defining module, resolved by __getattr__
+_LAZY_EXPORTS = {
+    "AppleTVDevice": "devices.appletv",
+    "AugustLock": "devices.august",
+    "GoveeLight": "devices.govee",
+    "LifxLight": "devices.lifx",
+    "RingCamera": "devices.ring",
+    "RoombaVacuum": "devices.roomba",
+    "RoombaCloudVacuum": "devices.roomba_cloud",
+    "TuyaPlug": "devices.tuya",
+    "create_appletv_device": "devices.appletv",
+    "create_august_lock": "devices.august",
+    "create_govee_light": "devices.govee",
+    "create_lifx_light": "devices.lifx",
+    "create_ring_camera": "devices.ring",
+    "create_roomba_vacuum": "devices.roomba",
+    "create_roomba_cloud_vacuum": "devices.roomba_cloud",
+    "create_tuya_plug": "devices.tuya",
+}
+
+# Device type to factory name
 DEVICE_FACTORIES = {
-    "lifx": create_lifx_light,
-    "govee": create_govee_light,
-    "tuya": create_tuya_plug,
-    "august": create_august_lock,
-    "roomba": create_roomba_vacuum,           # Local MQTT control (older iRobot app)
-    "roomba_cloud": create_roomba_cloud_vacuum,  # Cloud API (newer Roomba Home app)
-    "ring": create_ring_camera,
-    "appletv": create_appletv_device,         # AppleTV media device
+    "lifx": "create_lifx_light",
+    "govee": "create_govee_light",
+    "tuya": "create_tuya_plug",
+    "august": "create_august_lock",
+    "roomba": "create_roomba_vacuum",           # Local MQTT control (older iRobot app)
+    "roomba_cloud": "create_roomba_cloud_vacuum",  # Cloud API (newer Roomba Home app)
+    "ring": "create_ring_camera",
+    "appletv": "create_appletv_device",         # AppleTV media device
 }
 
 
-def register_all_factories(manager: DeviceManager) -> None:
-    """Register all device factories with a device manager."""
-    for device_type, factory in DEVICE_FACTORIES.items():
-        manager.register_device_factory(device_type, factory)
+def __getattr__(name: str) -> Any:
+    """Import backend classes and factories on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
+
+
+def register_all_factories(
+    manager: DeviceManager, device_types: Iterable[str] | None = None
+) -> None:
+    """Register device factories with a device manager.
+
+    Args:
+        manager: Device manager to register with
+        device_types: Only import and register these types (default: all)
+    """
+    wanted = None if device_types is None else set(device_types)
+    manager.register_device_factories({
+        device_type: __getattr__(factory_name)
+        for device_type, factory_name in DEVICE_FACTORIES.items()
+        if wanted is None or device_type in wanted
+    })
@@ -6,6 +6,8 @@ https://pyatv.dev/
 
 import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -21,12 +23,36 @@ from utils.retry import CircuitBreaker, CircuitBreakerOpen, retry_async
 
 logger = logging.getLogger(__name__)
 
-# Circuit breaker for AppleTV operations (shared across all AppleTV devices)
-_appletv_circuit_breaker = CircuitBreaker(
-    failure_threshold=5,
-    recovery_timeout=60.0,
-    half_open_max_calls=2,
-)
+# Circuit breakers for AppleTV operations, one per device ID. Each AppleTV is
+# a separate box on the LAN, so one failing unit must not block the others.
+_appletv_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def _circuit_breaker_for(device_id: str) -> CircuitBreaker:
+    """Get the circuit breaker for an AppleTV, creating it on first use."""
+    breaker = _appletv_circuit_breakers.get(device_id)
+    if breaker is None:
+        breaker = _appletv_circuit_breakers[device_id] = CircuitBreaker(
+            failure_threshold=5,
+            recovery_timeout=60.0,
+            half_open_max_calls=2,
+        )
+    return breaker
+
+
+# Seconds an installed-app list is reused before asking the AppleTV again
+APP_LIST_TTL = 3600.0
+
+# Timeouts for successive scans when looking for a known AppleTV; a device
+# that is up usually answers the first, short scan
+SCAN_TIMEOUTS = (2.0, 4.0, 8.0)
+
+# Seconds close() waits for pyatv to finish closing a connection
+CLOSE_TIMEOUT = 2.0
+
+# Backoff between reconnect attempts after the connection drops (seconds)
+RECONNECT_INITIAL_DELAY = 1.0
+RECONNECT_MAX_DELAY = 300.0
 
 # Map pyatv device states to our PlaybackState
 PYATV_STATE_MAP = {
@@ -39,7 +65,36 @@ PYATV_STATE_MAP = {
 }
 
 
-@dataclass
+class _PushListener:
+    """Applies pyatv play status pushes and connection events to an AppleTVDevice."""
+
+    def __init__(self, device: "AppleTVDevice"):
+        self._device = device
+
+    def playstatus_update(self, updater: Any, playstatus: Any) -> None:
+        """Update the device from a pushed play status."""
+        self._device._apply_playing(playstatus)
+
+    def playstatus_error(self, updater: Any, exception: Exception) -> None:
+        """Fall back to polling once the push stream fails."""
+        logger.warning(
+            f"Push updates failed for AppleTV {self._device.id}, polling instead: {exception}"
+        )
+        self._device._push_listener = None
+
+    def connection_lost(self, exception: Exception) -> None:
+        """Reconnect in the background as soon as the connection drops."""
+        logger.warning(f"Lost connection to AppleTV {self._device.id}: {exception}")
+        self._device._connected = False
+        self._device._push_listener = None
+        self._device.status = DeviceStatus.OFFLINE
+        self._device._schedule_reconnect()
+
+    def connection_closed(self) -> None:
+        """Ignore closes we asked for."""
+
+
+@dataclass(slots=True)
 class AppleTVDevice(MediaDevice):
     """AppleTV implementation using pyatv library.
 
@@ -48,7 +103,7 @@ class AppleTVDevice(MediaDevice):
     - Currently playing content info
     - Remote control (play, pause, skip)
     - App launching
-    - Viewing history tracking (via periodic polling)
+    - Viewing history tracking (via push updates, polling as a fallback)
     """
 
     device_type: DeviceType = field(default=DeviceType.MEDIA, init=False)
@@ -57,25 +112,42 @@ class AppleTVDevice(MediaDevice):
     _atv: Any = field(default=None, repr=False)  # pyatv AppleTV instance
     _connected: bool = False
     _push_listener: Any = field(default=None, repr=False)
-    _last_content_hash: str | None = None  # Track content changes
-
-    async def _run_with_retry(self, coro: Any) -> Any:
-        """Run an async operation with retry and circuit breaker."""
-        if _appletv_circuit_breaker.is_open:
+    _reconnect_task: asyncio.Task | None = field(default=None, repr=False)
+    _last_content_hash: tuple[Any, ...] | None = None  # Identity of the applied content
+    _app_list: list[dict[str, str]] | None = field(default=None, repr=False)
+    _app_list_fetched_at: float = 0.0
+    # Apps keyed by lowercased id and name, for exact-match launches
+    _app_lookup: dict[str, dict[str, str]] = field(default_factory=dict, repr=False)
+    # Apps keyed by each lowercased word of their name
+    _app_tokens: dict[str, dict[str, str]] = field(default_factory=dict, repr=False)
+    # (lowercased name, app) pairs, for substring matches
+    _app_names: list[tuple[str, dict[str, str]]] = field(default_factory=list, repr=False)
+
+    async def _run_with_retry(
+        self, func: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Any:
+        """Run an async operation with retry and circuit breaker.
+
+        ``func`` is called afresh on every attempt, since a coroutine can
+        only be awaited once.
+        """
+        breaker = _circuit_breaker_for(self.id)
+        if breaker.is_open:
             raise CircuitBreakerOpen("AppleTV circuit breaker is open")
 
         try:
             result = await retry_async(
-                lambda: coro,
+                func,
+                *args,
                 max_attempts=3,
                 initial_delay=0.5,
                 max_delay=5.0,
                 retryable_exceptions=(OSError, TimeoutError, ConnectionError),
             )
-            _appletv_circuit_breaker.record_success()
+            breaker.record_success()
             return result
         except Exception:
-            _appletv_circuit_breaker.record_failure()
+            breaker.record_failure()
             raise
 
     async def _ensure_connected(self) -> bool:
@@ -105,55 +177,102 @@ class AppleTVDevice(MediaDevice):
         np = self.now_playing
         return f"{np.app}:{np.title}:{np.series_name}:{np.season}:{np.episode}"
 
+    def _start_push_updates(self) -> None:
+        """Subscribe to play status pushes so refresh() can skip polling."""
+        listener = _PushListener(self)
+        try:
+            self._atv.listener = listener
+            self._atv.push_updater.listener = listener
+            self._atv.push_updater.start()
+        except Exception as e:
+            logger.warning(f"Push updates unavailable for AppleTV {self.id}, polling instead: {e}")
+            return
+        # pyatv holds listeners weakly; keeping it here keeps it alive
+        self._push_listener = listener
+
+    def _apply_playing(self, playing: Any) -> None:
+        """Update playback state from a pyatv Playing object."""
+        if not playing:
+            self.playback_state = PlaybackState.IDLE
+            self.now_playing = None
+            self._last_content_hash = None
+            self.status = DeviceStatus.ONLINE
+            return
+
+        # Map device state
+        state_str = str(playing.device_state).rpartition(".")[2].lower()
+        self.playback_state = PYATV_STATE_MAP.get(state_str, PlaybackState.IDLE)
+
+        app_info = self._atv.metadata.app
+        content_hash = (
+            app_info.identifier if app_info else None,
+            app_info.name if app_info else None,
+            playing.title,
+            playing.series_name,
+            playing.season_number,
+            playing.episode_number,
+            playing.artist,
+            playing.album,
+            playing.genre,
+            playing.total_time,
+            getattr(playing, "media_type", None),
+        )
+        if content_hash == self._last_content_hash and self.now_playing is not None:
+            # Same content as last time: only the position moves
+            self.now_playing.position = playing.position
+            self.current_app = self.now_playing.app
+            self.status = DeviceStatus.ONLINE
+            return
+        self._last_content_hash = content_hash
+
+        # Get current app
+        if app_info:
+            self.current_app = normalize_app_name(app_info.identifier or app_info.name or "Unknown")
+        else:
+            self.current_app = None
+
+        # Build now playing info
+        self.now_playing = NowPlaying(
+            title=playing.title,
+            artist=playing.artist,
+            album=playing.album,
+            series_name=playing.series_name,
+            season=playing.season_number,
+            episode=playing.episode_number,
+            genre=playing.genre,
+            media_type=self._determine_media_type(playing),
+            app=self.current_app,
+            duration=playing.total_time,
+            position=playing.position,
+        )
+
+        self.status = DeviceStatus.ONLINE
+        logger.debug(
+            "Refreshed AppleTV %s: state=%s, app=%s, title=%s",
+            self.id,
+            self.playback_state,
+            self.current_app,
+            playing.title,
+        )
+
     async def refresh(self) -> None:
+        """Bring state up to date.
+
+        While push updates are running the cached state is already current,
+        so no request is sent. Otherwise this polls the AppleTV.
+        """
+        if self._push_listener is not None and self._connected:
+            return
+        await self.force_refresh()
+
+    async def force_refresh(self) -> None:
         """Fetch current state from AppleTV."""
         if not await self._ensure_connected():
             self.status = DeviceStatus.OFFLINE
             return
 
         try:
-            # Get playing status
-            playing = self._atv.metadata.playing
-
-            if playing:
-                # Map device state
-                state_str = str(playing.device_state).lower().split(".")[-1]
-                self.playback_state = PYATV_STATE_MAP.get(
-                    state_str, PlaybackState.IDLE
-                )
-
-                # Get current app
-                app_info = self._atv.metadata.app
-                if app_info:
-                    self.current_app = normalize_app_name(app_info.identifier or app_info.name or "Unknown")
-                else:
-                    self.current_app = None
-
-                # Build now playing info
-                self.now_playing = NowPlaying(
-                    title=playing.title,
-                    artist=playing.artist,
-                    album=playing.album,
-                    series_name=playing.series_name,
-                    season=playing.season_number,
-                    episode=playing.episode_number,
-                    genre=playing.genre,
-                    media_type=self._determine_media_type(playing),
-                    app=self.current_app,
-                    duration=playing.total_time,
-                    position=playing.position,
-                )
-
-                self.status = DeviceStatus.ONLINE
-                logger.debug(
-                    f"Refreshed AppleTV {self.id}: state={self.playback_state.value}, "
-                    f"app={self.current_app}, title={playing.title}"
-                )
-            else:
-                self.playback_state = PlaybackState.IDLE
-                self.now_playing = None
-                self.status = DeviceStatus.ONLINE
-
+            self._apply_playing(await self._atv.metadata.playing())
         except CircuitBreakerOpen:
             logger.warning(f"Circuit breaker open for AppleTV {self.id}")
             self.status = DeviceStatus.OFFLINE
@@ -171,104 +290,70 @@ class AppleTVDevice(MediaDevice):
         if playing.artist and playing.album:
             return "music"
 
-        # Check media type from pyatv if available
-        if hasattr(playing, "media_type"):
-            mt = str(playing.media_type).lower()
+        # Check media type from pyatv if available. Series info was ruled out
+        # above, so video here is a movie.
+        media_type = getattr(playing, "media_type", None)
+        if media_type is not None:
+            mt = str(media_type).lower()
             if "tv" in mt or "video" in mt:
-                return "tvshow" if playing.series_name else "movie"
+                return "movie"
             if "music" in mt or "audio" in mt:
                 return "music"
 
         return "unknown"
 
-    async def play(self) -> None:
-        """Resume/start playback."""
+    async def _remote_command(
+        self,
+        command: str,
+        action: str,
+        done: str,
+        state: PlaybackState | None = None,
+    ) -> None:
+        """Send a remote control command.
+
+        Args:
+            command: pyatv remote_control method name
+            action: What the command does, for the failure log
+            done: Success log message
+            state: Playback state to record once the command succeeds
+        """
         if not await self._ensure_connected():
             raise RuntimeError(f"AppleTV {self.id} not connected")
 
         try:
-            await self._run_with_retry(self._atv.remote_control.play())
-            self.playback_state = PlaybackState.PLAYING
-            self.status = DeviceStatus.ONLINE
-            logger.info(f"Started playback on AppleTV {self.id}")
-
+            await self._run_with_retry(getattr(self._atv.remote_control, command))
         except CircuitBreakerOpen:
             self.status = DeviceStatus.OFFLINE
             raise RuntimeError(f"AppleTV {self.id} temporarily unavailable")
         except Exception as e:
-            logger.error(f"Failed to play on AppleTV {self.id}: {e}")
+            logger.error(f"Failed to {action} on AppleTV {self.id}: {e}")
             raise
 
-    async def pause(self) -> None:
-        """Pause playback."""
-        if not await self._ensure_connected():
-            raise RuntimeError(f"AppleTV {self.id} not connected")
+        if state is not None:
+            self.playback_state = state
+        self.status = DeviceStatus.ONLINE
+        logger.info(f"{done} on AppleTV {self.id}")
 
-        try:
-            await self._run_with_retry(self._atv.remote_control.pause())
-            self.playback_state = PlaybackState.PAUSED
-            self.status = DeviceStatus.ONLINE
-            logger.info(f"Paused playback on AppleTV {self.id}")
+    async def play(self) -> None:
+        """Resume/start playback."""
+        await self._remote_command("play", "play", "Started playback", PlaybackState.PLAYING)
 
-        except CircuitBreakerOpen:
-            self.status = DeviceStatus.OFFLINE
-            raise RuntimeError(f"AppleTV {self.id} temporarily unavailable")
-        except Exception as e:
-            logger.error(f"Failed to pause AppleTV {self.id}: {e}")
-            raise
+    async def pause(self) -> None:
+        """Pause playback."""
+        await self._remote_command("pause", "pause", "Paused playback", PlaybackState.PAUSED)
 
     async def stop(self) -> None:
         """Stop playback."""
-        if not await self._ensure_connected():
-            raise RuntimeError(f"AppleTV {self.id} not connected")
-
-        try:
-            await self._run_with_retry(self._atv.remote_control.stop())
-            self.playback_state = PlaybackState.STOPPED
-            self.now_playing = None
-            self.status = DeviceStatus.ONLINE
-            logger.info(f"Stopped playback on AppleTV {self.id}")
-
-        except CircuitBreakerOpen:
-            self.status = DeviceStatus.OFFLINE
-            raise RuntimeError(f"AppleTV {self.id} temporarily unavailable")
-        except Exception as e:
-            logger.error(f"Failed to stop AppleTV {self.id}: {e}")
-            raise
+        await self._remote_command("stop", "stop", "Stopped playback", PlaybackState.STOPPED)
+        self.now_playing = None
 
     async def skip_forward(self) -> None:
         """Skip to next track/episode."""
-        if not await self._ensure_connected():
-            raise RuntimeError(f"AppleTV {self.id} not connected")
-
-        try:
-            await self._run_with_retry(self._atv.remote_control.next())
-            self.status = DeviceStatus.ONLINE
-            logger.info(f"Skipped forward on AppleTV {self.id}")
-
-        except CircuitBreakerOpen:
-            self.status = DeviceStatus.OFFLINE
-            raise RuntimeError(f"AppleTV {self.id} temporarily unavailable")
-        except Exception as e:
-            logger.error(f"Failed to skip forward on AppleTV {self.id}: {e}")
-            raise
+        await self._remote_command("next", "skip forward", "Skipped forward")
 
     async def skip_backward(self) -> None:
         """Skip to previous track/episode."""
-        if not await self._ensure_connected():
-            raise RuntimeError(f"AppleTV {self.id} not connected")
-
-        try:
-            await self._run_with_retry(self._atv.remote_control.previous())
-            self.status = DeviceStatus.ONLINE
-            logger.info(f"Skipped backward on AppleTV {self.id}")
-
-        except CircuitBreakerOpen:
-            self.status = DeviceStatus.OFFLINE
-            raise RuntimeError(f"AppleTV {self.id} temporarily unavailable")
-        except Exception as e:
-            logger.error(f"Failed to skip backward on AppleTV {self.id}: {e}")
-            raise
+        await self._remote_command("previous", "skip backward", "Skipped backward")
 
     async def launch_app(self, app_id: str) -> None:
         """Launch a specific app."""
@@ -276,22 +361,21 @@ class AppleTVDevice(MediaDevice):
             raise RuntimeError(f"AppleTV {self.id} not connected")
 
         try:
-            # Find matching app from available apps
-            apps = await self.get_app_list()
-            matching_app = None
-
-            for app in apps:
-                if app_id.lower() in app.get("name", "").lower() or \
-                   app_id.lower() == app.get("id", "").lower():
-                    matching_app = app
-                    break
+            # Find matching app: exact id or name, then a word of the name,
+            # then a name substring
+            await self.get_app_list()
+            query = app_id.lower()
+            matching_app = self._app_lookup.get(query) or self._app_tokens.get(query)
+
+            if matching_app is None:
+                matching_app = next(
+                    (app for name, app in self._app_names if query in name), None
+                )
 
             if not matching_app:
                 raise ValueError(f"App '{app_id}' not found on AppleTV {self.id}")
 
-            await self._run_with_retry(
-                self._atv.apps.launch_app(matching_app["id"])
-            )
+            await self._run_with_retry(self._atv.apps.launch_app, matching_app["id"])
             self.current_app = normalize_app_name(matching_app["name"])
             self.status = DeviceStatus.ONLINE
             logger.info(f"Launched {matching_app['name']} on AppleTV {self.id}")
@@ -305,13 +389,29 @@ class AppleTVDevice(MediaDevice):
             logger.error(f"Failed to launch app on AppleTV {self.id}: {e}")
             raise
 
+    def _invalidate_app_list(self) -> None:
+        """Forget the cached app list so the next request fetches it."""
+        self._app_list = None
+        self._app_lookup = {}
+        self._app_tokens = {}
+        self._app_names = []
+
     async def get_app_list(self) -> list[dict[str, str]]:
-        """Get list of installed apps."""
+        """Get list of installed apps.
+
+        The list is cached for ``APP_LIST_TTL`` seconds and dropped on close.
+        """
         if not await self._ensure_connected():
             return []
 
+        if (
+            self._app_list is not None
+            and time.monotonic() - self._app_list_fetched_at < APP_LIST_TTL
+        ):
+            return list(self._app_list)
+
         try:
-            app_list = await self._run_with_retry(self._atv.apps.app_list())
+            app_list = await self._run_with_retry(self._atv.apps.app_list)
 
             apps = []
             for app in app_list:
@@ -324,7 +424,22 @@ class AppleTVDevice(MediaDevice):
             # Update available apps list
             self.available_apps = [a["friendly_name"] for a in apps]
 
-            return apps
+            # Index lowercased names once per fetch; earlier apps win ties
+            lookup: dict[str, dict[str, str]] = {}
+            tokens: dict[str, dict[str, str]] = {}
+            for app in reversed(apps):
+                for key in (app["name"], app["id"]):
+                    if key:
+                        lookup[key.lower()] = app
+                for token in (app["name"] or "").lower().split():
+                    tokens[token] = app
+            self._app_lookup = lookup
+            self._app_tokens = tokens
+            self._app_names = [(app["name"].lower(), app) for app in apps if app["name"]]
+            self._app_list = apps
+            self._app_list_fetched_at = time.monotonic()
+
+            return list(apps)
 
         except CircuitBreakerOpen:
             logger.warning(f"Circuit breaker open for AppleTV {self.id}")
@@ -335,17 +450,46 @@ class AppleTVDevice(MediaDevice):
 
     async def close(self) -> None:
         """Close connection to AppleTV."""
+        task = self._reconnect_task
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            self._reconnect_task = None
+        self._invalidate_app_list()
         if self._atv:
             try:
-                self._atv.close()
+                if self._push_listener is not None:
+                    self._atv.push_updater.stop()
+                    self._push_listener = None
                 self._connected = False
+                # pyatv returns the tasks that finish closing; don't let a dead
+                # socket hold up reconnects or shutdown
+                pending = self._atv.close()
+                if pending:
+                    _, still_open = await asyncio.wait(pending, timeout=CLOSE_TIMEOUT)
+                    if still_open:
+                        logger.warning(f"AppleTV {self.id} did not close within {CLOSE_TIMEOUT}s")
                 logger.info(f"Closed connection to AppleTV {self.id}")
             except Exception as e:
                 logger.warning(f"Error closing AppleTV {self.id}: {e}")
 
+    def _schedule_reconnect(self) -> None:
+        """Start reconnecting in the background unless already doing so."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        """Reconnect with exponential backoff until the AppleTV responds."""
+        delay = RECONNECT_INITIAL_DELAY
+        while self._ip or self._identifier:
+            await self.reconnect()
+            if self._connected and self.status == DeviceStatus.ONLINE:
+                return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
     async def reconnect(self) -> None:
         """Attempt to reconnect to AppleTV."""
-        _appletv_circuit_breaker.reset()
+        _circuit_breaker_for(self.id).reset()
         self._connected = False
         await self.close()
 
@@ -353,17 +497,15 @@ class AppleTVDevice(MediaDevice):
         try:
             import pyatv
 
-            if self._ip:
-                atvs = await pyatv.scan(hosts=[self._ip], timeout=10)
-            elif self._identifier:
-                atvs = await pyatv.scan(identifier=self._identifier, timeout=10)
-            else:
+            if not self._ip and not self._identifier:
                 logger.error(f"No IP or identifier for AppleTV {self.id}")
                 return
+            atvs = await _scan_for_appletv(self._ip, self._identifier)
 
             if atvs:
-                self._atv = await pyatv.connect(atvs[0], asyncio.get_event_loop())
+                self._atv = await pyatv.connect(atvs[0], asyncio.get_running_loop())
                 await self.refresh()
+                self._start_push_updates()
                 logger.info(f"Reconnected to AppleTV {self.id}")
             else:
                 logger.warning(f"Could not find AppleTV {self.id} on network")
@@ -374,6 +516,23 @@ class AppleTVDevice(MediaDevice):
             self.status = DeviceStatus.OFFLINE
 
 
+async def _scan_for_appletv(ip: str | None, identifier: str | None) -> list[Any]:
+    """Scan for one AppleTV, by IP if known, retrying with longer timeouts.
+
+    Returns as soon as a scan finds it, or an empty list if none do.
+    """
+    import pyatv
+
+    for timeout in SCAN_TIMEOUTS:
+        if ip:
+            atvs = await pyatv.scan(hosts=[ip], timeout=timeout)
+        else:
+            atvs = await pyatv.scan(identifier=identifier, timeout=timeout)
+        if atvs:
+            return atvs
+    return []
+
+
 async def create_appletv_device(
     device_config: DeviceConfig, secrets: SecretsConfig
 ) -> AppleTVDevice:
@@ -416,10 +575,7 @@ async def create_appletv_device(
 
     try:
         # Scan for the device
-        if ip:
-            atvs = await pyatv.scan(hosts=[ip], timeout=10)
-        else:
-            atvs = await pyatv.scan(identifier=identifier, timeout=10)
+        atvs = await _scan_for_appletv(ip, identifier)
 
         if not atvs:
             logger.warning(f"AppleTV {device_config.id} not found on network")
@@ -437,12 +593,13 @@ async def create_appletv_device(
                 atv_conf.set_credentials(pyatv.Protocol[protocol.upper()], cred)
 
         # Connect to AppleTV
-        device._atv = await pyatv.connect(atv_conf, asyncio.get_event_loop())
+        device._atv = await pyatv.connect(atv_conf, asyncio.get_running_loop())
         device._connected = True
         device._identifier = atv_conf.identifier
 
-        # Get initial state
+        # Get initial state, then keep it current from pushes
         await device.refresh()
+        device._start_push_updates()
 
         # Get app list
         await device.get_app_list()
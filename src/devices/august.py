@@ -27,7 +27,7 @@ _august_circuit_breaker = CircuitBreaker(
 TOKEN_CACHE_PATH = Path.home() / ".cache" / "burrow" / "august_token.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class AugustLock(Lock):
     """August lock implementation using yalexs library."""
 
@@ -29,6 +29,29 @@ _govee_circuit_breaker = CircuitBreaker(
     half_open_max_calls=2,
 )
 
+# HTTP client shared across all Govee devices so connections and TLS sessions
+# to the API host are pooled. Closed once the last device releases it.
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_users: set[str] = set()
+
+
+def _acquire_client(device_id: str) -> httpx.AsyncClient:
+    """Get the shared Govee HTTP client, registering the device as a user."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(timeout=10.0)
+    _shared_client_users.add(device_id)
+    return _shared_client
+
+
+async def _release_client(device_id: str) -> None:
+    """Release a device's use of the shared client, closing it if unused."""
+    global _shared_client
+    _shared_client_users.discard(device_id)
+    if not _shared_client_users and _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color to RGB tuple."""
@@ -45,7 +68,7 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
-@dataclass
+@dataclass(slots=True)
 class GoveeLight(Light):
     """Govee light implementation using cloud API."""
 
@@ -54,12 +77,7 @@ class GoveeLight(Light):
     _device_id: str | None = None
     _model: str | None = None
     _client: httpx.AsyncClient | None = field(default=None, repr=False)
-    _rate_limiter: Any = field(default=None, repr=False)
-
-    def __post_init__(self) -> None:
-        """Initialize rate limiter reference."""
-        super().__post_init__()
-        self._rate_limiter = get_service_rate_limiter()
+    _rate_limiter: Any = field(default_factory=get_service_rate_limiter, repr=False)
 
     def _get_headers(self) -> dict[str, str]:
         """Get API headers."""
@@ -70,8 +88,8 @@ class GoveeLight(Light):
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure HTTP client exists."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0)
+        if self._client is None or self._client.is_closed:
+            self._client = _acquire_client(self.id)
         return self._client
 
     async def _rate_limited_request(
@@ -244,10 +262,10 @@ class GoveeLight(Light):
                 await self.set_power(True)
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Release the shared HTTP client."""
         if self._client:
-            await self._client.aclose()
             self._client = None
+            await _release_client(self.id)
 
     async def reconnect(self) -> None:
         """Attempt to reconnect by refreshing state."""
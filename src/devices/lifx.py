@@ -1,9 +1,15 @@
 """LIFX light implementation for Burrow MCP."""
 
 import asyncio
+import colorsys
 import logging
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from config import DeviceConfig, SecretsConfig
 from models.base import DeviceStatus, DeviceType
@@ -19,7 +25,30 @@ _lifx_circuit_breaker = CircuitBreaker(
     half_open_max_calls=2,
 )
 
+# lifxlan is blocking, so LIFX calls run on their own small thread pool rather
+# than the loop's default executor; a burst of bulb refreshes can then never
+# starve other devices' to_thread work.
+_lifx_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="lifx")
+
+# LAN discovery results shared by all create_lifx_light calls, so configuring
+# several bulbs without an IP only broadcasts GetService once.
+_DISCOVERY_TTL = 60.0
+_discovered_lights: list[Any] = []
+_discovered_at: float | None = None
+# One lock per event loop: an asyncio.Lock is bound to the loop that first
+# waits on it, and tests and the CLI each run their own loop
+_discovery_locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    WeakKeyDictionary()
+)
+
+# LIFX brightness runs 0-65535; Burrow uses percent
+_LIFX_BRI_SCALE = 65535 / 100
+
+# How long a known HSBK value is trusted before setters re-read it from the bulb
+_HSBK_CACHE_TTL = 1.0
 
+
+@lru_cache(maxsize=256)
 def hex_to_hsbk(hex_color: str) -> tuple[int, int, int, int]:
     """Convert hex color to LIFX HSBK format.
 
@@ -28,37 +57,21 @@ def hex_to_hsbk(hex_color: str) -> tuple[int, int, int, int]:
 
     Returns:
         Tuple of (hue, saturation, brightness, kelvin) in LIFX scale
-    """
-    hex_color = hex_color.lstrip("#")
-
-    r = int(hex_color[0:2], 16) / 255.0
-    g = int(hex_color[2:4], 16) / 255.0
-    b = int(hex_color[4:6], 16) / 255.0
-
-    max_c = max(r, g, b)
-    min_c = min(r, g, b)
-    diff = max_c - min_c
-
-    if diff == 0:
-        h = 0
-    elif max_c == r:
-        h = (60 * ((g - b) / diff) + 360) % 360
-    elif max_c == g:
-        h = (60 * ((b - r) / diff) + 120) % 360
-    else:
-        h = (60 * ((r - g) / diff) + 240) % 360
 
-    s = 0 if max_c == 0 else (diff / max_c)
-    v = max_c
-
-    hue = int((h / 360.0) * 65535)
-    saturation = int(s * 65535)
-    brightness = int(v * 65535)
-    kelvin = 3500
-
-    return hue, saturation, brightness, kelvin
+    Raises:
+        ValueError: If the color is not exactly six hex digits
+    """
+    digits = hex_color.lstrip("#")
+    if len(digits) != 6 or not all(c in string.hexdigits for c in digits):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    rgb = int(digits, 16)
+    h, s, v = colorsys.rgb_to_hsv(
+        (rgb >> 16) / 255.0, ((rgb >> 8) & 0xFF) / 255.0, (rgb & 0xFF) / 255.0
+    )
+    return int(h * 65535), int(s * 65535), int(v * 65535), 3500
 
 
+@lru_cache(maxsize=256)
 def hsbk_to_hex(hue: int, saturation: int, brightness: int) -> str:
     """Convert LIFX HSBK to hex color.
 
@@ -70,35 +83,17 @@ def hsbk_to_hex(hue: int, saturation: int, brightness: int) -> str:
     Returns:
         Hex color string
     """
-    h = (hue / 65535.0) * 360
-    s = saturation / 65535.0
-    v = brightness / 65535.0
-
-    c = v * s
-    x = c * (1 - abs((h / 60) % 2 - 1))
-    m = v - c
-
-    if h < 60:
-        r, g, b = c, x, 0
-    elif h < 120:
-        r, g, b = x, c, 0
-    elif h < 180:
-        r, g, b = 0, c, x
-    elif h < 240:
-        r, g, b = 0, x, c
-    elif h < 300:
-        r, g, b = x, 0, c
-    else:
-        r, g, b = c, 0, x
+    r, g, b = colorsys.hsv_to_rgb(hue / 65535.0, saturation / 65535.0, brightness / 65535.0)
+    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
 
-    r = int((r + m) * 255)
-    g = int((g + m) * 255)
-    b = int((b + m) * 255)
 
-    return f"#{r:02x}{g:02x}{b:02x}"
+async def _run_in_lifx_thread(func: Any, *args: Any) -> Any:
+    """Run a blocking lifxlan call on the dedicated LIFX executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_lifx_executor, partial(func, *args))
 
 
-@dataclass
+@dataclass(slots=True)
 class LifxLight(Light):
     """LIFX light implementation."""
 
@@ -106,10 +101,28 @@ class LifxLight(Light):
     _lifx_device: Any = field(default=None, repr=False)
     _mac: str | None = None
     _ip: str | None = None
+    _last_hsbk: tuple[int, int, int, int] | None = field(default=None, repr=False)
+    _hsbk_ts: float = field(default=0.0, repr=False)
+
+    def _remember_hsbk(self, hsbk: list[int] | tuple[int, ...]) -> None:
+        """Record the bulb's current HSBK as last read or written."""
+        hue, saturation, brightness, kelvin = hsbk
+        self._last_hsbk = (hue, saturation, brightness, kelvin)
+        self._hsbk_ts = time.monotonic()
+
+    async def _get_hsbk(self) -> tuple[int, int, int, int] | None:
+        """Get the bulb's HSBK, reusing a recent read or write if available."""
+        if self._last_hsbk is not None and time.monotonic() - self._hsbk_ts < _HSBK_CACHE_TTL:
+            return self._last_hsbk
+        color = await self._run_with_retry(self._lifx_device.get_color)
+        if color:
+            self._remember_hsbk(color)
+            return self._last_hsbk
+        return None
 
     async def _run_sync(self, func: Any, *args: Any) -> Any:
-        """Run a synchronous LIFX function in a thread."""
-        return await asyncio.to_thread(func, *args)
+        """Run a synchronous LIFX function on the LIFX thread pool."""
+        return await _run_in_lifx_thread(func, *args)
 
     async def _run_with_retry(self, func: Any, *args: Any) -> Any:
         """Run a LIFX function with retry and circuit breaker.
@@ -143,13 +156,18 @@ class LifxLight(Light):
             return
 
         try:
-            power = await self._run_with_retry(self._lifx_device.get_power)
+            # get_color() issues a single LightGet; lifxlan caches the power level
+            # from the LightState reply, so no separate get_power round-trip is needed.
+            color = await self._run_with_retry(self._lifx_device.get_color)
+            power = getattr(self._lifx_device, "power_level", None)
+            if power is None:
+                power = await self._run_with_retry(self._lifx_device.get_power)
             self.is_on = power > 0
 
-            color = await self._run_with_retry(self._lifx_device.get_color)
             if color:
+                self._remember_hsbk(color)
                 hue, saturation, brightness, kelvin = color
-                self.brightness = int((brightness / 65535.0) * 100)
+                self.brightness = int(brightness / _LIFX_BRI_SCALE)
                 self.color_temp = kelvin
 
                 if saturation > 1000:
@@ -189,19 +207,24 @@ class LifxLight(Light):
         if self._lifx_device is None:
             raise RuntimeError(f"LIFX device {self.id} not connected")
 
+        if brightness <= 0:
+            # Zero brightness is just "off"; no need to read hue/saturation
+            await self.set_power(False)
+            self.brightness = 0
+            return
+
         try:
-            brightness = max(0, min(100, brightness))
+            brightness = min(100, brightness)
 
-            color = await self._run_with_retry(self._lifx_device.get_color)
+            color = await self._get_hsbk()
             if color:
                 hue, saturation, _, kelvin = color
-                lifx_brightness = int((brightness / 100.0) * 65535)
-                await self._run_with_retry(
-                    self._lifx_device.set_color, [hue, saturation, lifx_brightness, kelvin]
-                )
+                hsbk = [hue, saturation, int(brightness * _LIFX_BRI_SCALE), kelvin]
+                await self._run_with_retry(self._lifx_device.set_color, hsbk)
+                self._remember_hsbk(hsbk)
 
             self.brightness = brightness
-            if brightness > 0 and not self.is_on:
+            if not self.is_on:
                 await self.set_power(True)
             self.status = DeviceStatus.ONLINE
         except CircuitBreakerOpen:
@@ -222,10 +245,9 @@ class LifxLight(Light):
             raise ValueError(f"LIFX device {self.id} does not support color")
 
         try:
-            hue, saturation, brightness, kelvin = hex_to_hsbk(color)
-            await self._run_with_retry(
-                self._lifx_device.set_color, [hue, saturation, brightness, kelvin]
-            )
+            hsbk = list(hex_to_hsbk(color))
+            await self._run_with_retry(self._lifx_device.set_color, hsbk)
+            self._remember_hsbk(hsbk)
             self.color = color
             self.status = DeviceStatus.ONLINE
 
@@ -248,12 +270,12 @@ class LifxLight(Light):
         try:
             kelvin = max(1500, min(9000, kelvin))
 
-            color = await self._run_with_retry(self._lifx_device.get_color)
+            color = await self._get_hsbk()
             if color:
                 _, _, brightness, _ = color
-                await self._run_with_retry(
-                    self._lifx_device.set_color, [0, 0, brightness, kelvin]
-                )
+                hsbk = [0, 0, brightness, kelvin]
+                await self._run_with_retry(self._lifx_device.set_color, hsbk)
+                self._remember_hsbk(hsbk)
 
             self.color_temp = kelvin
             self.color = None
@@ -270,6 +292,41 @@ class LifxLight(Light):
             self.status = DeviceStatus.OFFLINE
             raise
 
+    @classmethod
+    async def set_color_many(cls, lights: list["LifxLight"], color: str) -> None:
+        """Set the same color on several bulbs in one batch.
+
+        Sends unacknowledged (rapid) SetColor/SetPower packets to every bulb from
+        a single executor job instead of waiting out one round-trip per bulb.
+        State is updated locally; the next refresh reconciles any lost packets.
+        """
+        connected = [light for light in lights if light._lifx_device is not None]
+        if not connected:
+            return
+        if _lifx_circuit_breaker.is_open:
+            raise CircuitBreakerOpen("LIFX circuit breaker is open")
+
+        hsbk = list(hex_to_hsbk(color))
+
+        def send_all() -> None:
+            for light in connected:
+                light._lifx_device.set_color(hsbk, 0, True)
+                if not light.is_on:
+                    light._lifx_device.set_power(65535, 0, True)
+
+        try:
+            await _run_in_lifx_thread(send_all)
+            _lifx_circuit_breaker.record_success()
+        except Exception:
+            _lifx_circuit_breaker.record_failure()
+            raise
+
+        for light in connected:
+            light._remember_hsbk(hsbk)
+            light.color = color
+            light.is_on = True
+            light.status = DeviceStatus.ONLINE
+
     async def reconnect(self) -> None:
         """Attempt to reconnect to the LIFX device."""
         # Reset circuit breaker to allow retry
@@ -277,6 +334,40 @@ class LifxLight(Light):
         await self.refresh()
 
 
+def _discovery_lock() -> asyncio.Lock:
+    """Get the discovery lock for the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    lock = _discovery_locks.get(loop)
+    if lock is None:
+        lock = _discovery_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _discover_lights(lifxlan: Any) -> list[Any]:
+    """Discover LIFX lights on the LAN, reusing recent results."""
+    global _discovered_lights, _discovered_at
+
+    async with _discovery_lock():
+        now = time.monotonic()
+        if _discovered_at is None or now - _discovered_at > _DISCOVERY_TTL:
+            lan = lifxlan.LifxLAN()
+            _discovered_lights = await _run_in_lifx_thread(lan.get_lights) or []
+            _discovered_at = now
+        return _discovered_lights
+
+
+async def _probe_all(devices: list[Any], method: str) -> list[str | None]:
+    """Call a blocking getter on every discovered light concurrently.
+
+    Lights that fail to answer yield None instead of aborting the search.
+    """
+    results = await asyncio.gather(
+        *(_run_in_lifx_thread(getattr(device, method)) for device in devices),
+        return_exceptions=True,
+    )
+    return [None if isinstance(r, BaseException) else r for r in results]
+
+
 async def create_lifx_light(device_config: DeviceConfig, secrets: SecretsConfig) -> LifxLight:
     """Factory function to create a LIFX light from config."""
     try:
@@ -300,10 +391,9 @@ async def create_lifx_light(device_config: DeviceConfig, secrets: SecretsConfig)
         light._lifx_device = lifxlan.Light(mac, ip)
         logger.info(f"Created LIFX light {device_config.id} with MAC {mac} at {ip}")
     elif mac:
-        lan = lifxlan.LifxLAN()
-        devices = await asyncio.to_thread(lan.get_lights)
-        for device in devices:
-            device_mac = await asyncio.to_thread(device.get_mac_addr)
+        devices = await _discover_lights(lifxlan)
+        macs = await _probe_all(devices, "get_mac_addr")
+        for device, device_mac in zip(devices, macs):
             if device_mac and device_mac.lower() == mac.lower():
                 light._lifx_device = device
                 logger.info(f"Found LIFX light {device_config.id} by MAC {mac}")
@@ -311,10 +401,9 @@ async def create_lifx_light(device_config: DeviceConfig, secrets: SecretsConfig)
         if light._lifx_device is None:
             logger.warning(f"Could not find LIFX light with MAC {mac}")
     else:
-        lan = lifxlan.LifxLAN()
-        devices = await asyncio.to_thread(lan.get_lights)
-        for device in devices:
-            label = await asyncio.to_thread(device.get_label)
+        devices = await _discover_lights(lifxlan)
+        labels = await _probe_all(devices, "get_label")
+        for device, label in zip(devices, labels):
             if label and label.lower() == device_config.name.lower():
                 light._lifx_device = device
                 logger.info(f"Found LIFX light {device_config.id} by name")
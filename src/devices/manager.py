@@ -2,17 +2,33 @@
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from config import BurrowConfig, DeviceConfig, SecretsConfig
 from models import Device, DeviceStatus, DeviceType, Light, Lock, Plug, Vacuum
 from models.room import Room
 from persistence import StateStore, get_store
 from utils.health import DeviceHealth, HealthMonitor
+from utils.serialization import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent refreshes per device class in refresh_all. LAN devices
+# each occupy a worker thread while blocked on UDP/TCP; cloud backends share
+# vendor rate limits. Classes not listed use the default.
+REFRESH_CONCURRENCY: dict[str, int] = {
+    "LifxLight": 8,
+    "TuyaPlug": 8,
+}
+DEFAULT_REFRESH_CONCURRENCY = 4
+
+# Seconds each device factory may spend connecting during startup
+DEVICE_INIT_TIMEOUT = 15.0
+
 
 class DeviceManager:
     """Manages all devices and rooms."""
@@ -27,7 +43,20 @@ class DeviceManager:
         self.config = config
         self.secrets = secrets
         self._devices: dict[str, Device] = {}
+        # Secondary indexes over _devices, maintained in _add_device
+        self._by_type: dict[DeviceType, dict[str, Device]] = defaultdict(dict)
+        self._by_room: dict[str | None, dict[str, Device]] = defaultdict(dict)
         self._rooms: dict[str, Room] = {}
+        # Monotonic time of each device's last successful refresh
+        self._last_refresh: dict[str, float] = {}
+        self._refresh_ttls: dict[str, float] = {
+            dc.id: float(dc.config["refresh_ttl"])
+            for dc in config.devices
+            if "refresh_ttl" in dc.config
+        }
+        self._refresh_semaphores: dict[str, asyncio.Semaphore] = {}
+        # Strong references to fire-and-forget tasks so they are not collected
+        self._background_tasks: set[asyncio.Task[None]] = set()
         self._device_factories: dict[str, Any] = {}
         self._db_path = db_path
         self._store: StateStore | None = None
@@ -52,8 +81,25 @@ class DeviceManager:
         """
         self._device_factories[device_type] = factory
 
+    def register_device_factories(self, factories: Mapping[str, Any]) -> None:
+        """Register several device factories at once, keyed by device type."""
+        self._device_factories.update(factories)
+
     async def initialize(self) -> None:
         """Initialize all rooms and devices from config."""
+        await self.initialize_all()
+
+    async def initialize_all(
+        self, timeout: float = DEVICE_INIT_TIMEOUT
+    ) -> list[Device | BaseException]:
+        """Initialize all rooms and devices from config.
+
+        Each device factory gets up to ``timeout`` seconds. A failing device is
+        logged and skipped rather than aborting startup.
+
+        Returns:
+            The created device or the exception raised, in config order
+        """
         # Initialize state store
         self._store = await get_store(self._db_path)
 
@@ -74,12 +120,25 @@ class DeviceManager:
             self._rooms[room.id] = room
             logger.info(f"Created room: {room.name}")
 
-        # Create devices
-        for device_config in self.config.devices:
-            await self._create_device(device_config)
+        # Create devices concurrently; factories may perform network discovery,
+        # so startup takes as long as the slowest device rather than the sum.
+        # Devices are registered in config order once all factories finish.
+        results = await asyncio.gather(
+            *(
+                self._create_device(device_config, timeout)
+                for device_config in self.config.devices
+            ),
+            return_exceptions=True,
+        )
+        for device_config, result in zip(self.config.devices, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to create device {device_config.id}: {result}")
+            else:
+                self._add_device(device_config, result)
 
         # Start health monitoring after all devices are created
         await self.start_health_monitoring()
+        return results
 
     async def start_health_monitoring(self) -> None:
         """Start the health monitoring background task."""
@@ -114,6 +173,10 @@ class DeviceManager:
         # Stop health monitoring
         await self.stop_health_monitoring()
 
+        # Let presence updates still in flight finish before closing devices
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
         # Close device connections
         for device in self._devices.values():
             if hasattr(device, "close"):
@@ -125,65 +188,134 @@ class DeviceManager:
 
         # Save all device states
         if self._store:
-            for device in self._devices.values():
-                await self._store.save_device_state(
-                    device.id,
-                    device.device_type.value,
-                    device.to_state_dict(),
-                )
+            await self._store.save_device_states(
+                (device.id, device.device_type.value, device.to_state_dict())
+                for device in self._devices.values()
+            )
 
             # Save room states
-            for room in self._rooms.values():
-                await self._store.save_room_state(room.id, room.occupied)
+            await self._store.save_room_states(
+                (room.id, room.occupied) for room in self._rooms.values()
+            )
 
             logger.info("Persisted device and room states")
 
-    async def _create_device(self, device_config: DeviceConfig) -> Device | None:
-        """Create a device from config."""
+    async def _create_device(self, device_config: DeviceConfig, timeout: float) -> Device:
+        """Create a device from config without registering it."""
         factory = self._device_factories.get(device_config.type)
         if factory is None:
-            logger.warning(f"No factory registered for device type: {device_config.type}")
-            return None
+            raise LookupError(f"No factory registered for device type: {device_config.type}")
 
         try:
-            device = await factory(device_config, self.secrets)
-            self._devices[device.id] = device
+            async with asyncio.timeout(timeout) as deadline:
+                device = await factory(device_config, self.secrets)
+        except TimeoutError:
+            # Only relabel our own deadline; a backend's timeout passes through
+            if not deadline.expired():
+                raise
+            raise TimeoutError(f"timed out after {timeout}s") from None
+        logger.info(f"Created device: {device.name} ({device_config.type})")
+        return device
+
+    def _add_device(self, device_config: DeviceConfig, device: Device) -> None:
+        """Register a created device and add it to its room."""
+        self._devices[device.id] = device
+        self._by_type[device.device_type][device.id] = device
+        self._by_room[device.room_id][device.id] = device
+
+        # Add to room if specified
+        if device_config.room and device_config.room in self._rooms:
+            self._rooms[device_config.room].device_ids.append(device.id)
+
+    def _is_fresh(self, device_id: str, now: float) -> bool:
+        """Check whether a device was refreshed within its TTL."""
+        last = self._last_refresh.get(device_id)
+        if last is None:
+            return False
+        ttl = self._refresh_ttls.get(device_id, self.config.refresh_ttl)
+        return now - last < ttl
+
+    async def _bounded_refresh(self, device: Device) -> None:
+        """Refresh a device, limiting concurrency per device class."""
+        backend = type(device).__name__
+        semaphore = self._refresh_semaphores.get(backend)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(
+                REFRESH_CONCURRENCY.get(backend, DEFAULT_REFRESH_CONCURRENCY)
+            )
+            self._refresh_semaphores[backend] = semaphore
+        async with semaphore:
+            await device.refresh()
 
-            # Add to room if specified
-            if device_config.room and device_config.room in self._rooms:
-                self._rooms[device_config.room].device_ids.append(device.id)
+    async def refresh_all(self, timeout: float = 30.0, force: bool = False) -> None:
+        """Refresh state of all devices with timeout protection.
 
-            logger.info(f"Created device: {device.name} ({device_config.type})")
-            return device
-        except Exception as e:
-            logger.error(f"Failed to create device {device_config.id}: {e}")
-            return None
+        Devices refreshed within their TTL (``refresh_ttl`` in config, overridable
+        per device) are skipped unless ``force`` is set.
 
-    async def refresh_all(self, timeout: float = 30.0) -> None:
-        """Refresh state of all devices with timeout protection.
+        Args:
+            timeout: Maximum time to wait for all refreshes (default 30s)
+            force: Refresh every device regardless of TTL
+        """
+        await self.refresh_devices(self._devices, timeout=timeout, force=force)
+
+    async def refresh_devices(
+        self,
+        device_ids: Iterable[str],
+        timeout: float = 30.0,
+        force: bool = False,
+        record: bool = True,
+    ) -> None:
+        """Refresh several devices concurrently with timeout protection.
+
+        Unknown IDs are ignored; TTL handling matches ``refresh_all``.
 
         Args:
+            device_ids: Devices to refresh
             timeout: Maximum time to wait for all refreshes (default 30s)
+            force: Refresh every device regardless of TTL
+            record: Persist state, update device health, and mark failed
+                devices offline. Background pollers pass False so a routine
+                poll leaves that bookkeeping to the regular refresh.
         """
-        tasks = [device.refresh() for device in self._devices.values()]
+        now = time.monotonic()
+        devices = [
+            device
+            for device_id in device_ids
+            if (device := self._devices.get(device_id)) is not None
+            and (force or not self._is_fresh(device_id, now))
+        ]
+        if not devices:
+            return
+
+        tasks = [self._bounded_refresh(device) for device in devices]
         try:
             async with asyncio.timeout(timeout):
                 results = await asyncio.gather(*tasks, return_exceptions=True)
         except asyncio.TimeoutError:
-            logger.error(f"refresh_all timed out after {timeout}s")
-            # Mark all devices as potentially offline on timeout
-            for device in self._devices.values():
-                device.status = DeviceStatus.OFFLINE
+            logger.error(f"Device refresh timed out after {timeout}s")
+            if record:
+                # Mark all devices as potentially offline on timeout
+                for device in devices:
+                    device.status = DeviceStatus.OFFLINE
+                    self._last_refresh.pop(device.id, None)
+            return
+        if not record:
+            for device, result in zip(devices, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to refresh {device.id}: {result}")
             return
-        for device, result in zip(self._devices.values(), results):
-            if isinstance(result, Exception):
+        for device, result in zip(devices, results):
+            if isinstance(result, BaseException):
                 logger.error(f"Failed to refresh {device.id}: {result}")
                 device.status = DeviceStatus.OFFLINE
+                self._last_refresh.pop(device.id, None)
                 # Record failure in health monitor
                 health = self._health_monitor.get_device_health(device.id)
                 if health:
                     health.record_failure()
             else:
+                self._last_refresh[device.id] = time.monotonic()
                 # Persist updated state
                 await self._persist_device_state(device)
                 # Record success in health monitor
@@ -191,27 +323,39 @@ class DeviceManager:
                 if health:
                     health.record_success()
 
-    async def refresh_device(self, device_id: str) -> bool:
-        """Refresh state of a single device."""
+    async def refresh_device(self, device_id: str, force: bool = True) -> Device | None:
+        """Refresh state of a single device.
+
+        Args:
+            device_id: Device to refresh
+            force: Refresh even if the device is within its TTL
+
+        Returns:
+            The device (marked offline if the refresh failed), or None if no
+            device has that ID
+        """
         device = self._devices.get(device_id)
         if device is None:
-            return False
+            return None
+        if not force and self._is_fresh(device_id, time.monotonic()):
+            return device
         try:
             await device.refresh()
+            self._last_refresh[device_id] = time.monotonic()
             await self._persist_device_state(device)
             # Record success in health monitor
             health = self._health_monitor.get_device_health(device_id)
             if health:
                 health.record_success()
-            return True
         except Exception as e:
             logger.error(f"Failed to refresh {device_id}: {e}")
             device.status = DeviceStatus.OFFLINE
+            self._last_refresh.pop(device_id, None)
             # Record failure in health monitor
             health = self._health_monitor.get_device_health(device_id)
             if health:
                 health.record_failure()
-            return False
+        return device
 
     async def _persist_device_state(self, device: Device) -> None:
         """Persist a device's current state."""
@@ -246,6 +390,55 @@ class DeviceManager:
                 await self._store.save_room_state(room_id, occupied)
                 await self._store.record_presence_event(room_id, occupied, confidence)
 
+    def apply_presence(self, room_id: str, occupied: bool) -> None:
+        """Apply a presence change reported by a sensor callback.
+
+        The room is updated immediately; persisting it runs in the background.
+        """
+        room = self._rooms.get(room_id)
+        if room is None:
+            return
+        room.occupied = occupied
+        room.last_presence_change = time.monotonic()
+        task = asyncio.create_task(self.update_room_presence(room_id, occupied))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        logger.info("Room %s presence: %s", room_id, occupied)
+
+    async def set_group_color(self, room_id: str, color: str) -> dict[str, bool]:
+        """Set every color-capable light in a room to the same color.
+
+        Light classes that provide a ``set_color_many`` classmethod (e.g. LIFX)
+        receive their lights as one batch; others are set concurrently one by one.
+
+        Returns:
+            Mapping of light ID to whether the color was applied
+        """
+        by_class: dict[type, list[Light]] = defaultdict(list)
+        for light in self.get_lights(room_id):
+            if light.supports_color and light.status != DeviceStatus.OFFLINE:
+                by_class[type(light)].append(light)
+
+        results: dict[str, bool] = {}
+        for light_class, lights in by_class.items():
+            set_many = getattr(light_class, "set_color_many", None)
+            if set_many is not None:
+                try:
+                    await set_many(lights, color)
+                    results.update((light.id, True) for light in lights)
+                except Exception as e:
+                    logger.error(f"Batch color change failed for {light_class.__name__}: {e}")
+                    results.update((light.id, False) for light in lights)
+            else:
+                outcomes = await asyncio.gather(
+                    *(light.set_color(color) for light in lights), return_exceptions=True
+                )
+                for light, outcome in zip(lights, outcomes):
+                    if isinstance(outcome, Exception):
+                        logger.error(f"Failed to set color for {light.id}: {outcome}")
+                    results[light.id] = not isinstance(outcome, Exception)
+        return results
+
     # Health monitoring getters
     def get_device_health(self, device_id: str) -> DeviceHealth | None:
         """Get health status for a specific device."""
@@ -274,20 +467,32 @@ class DeviceManager:
         room_id: str | None = None,
         status: DeviceStatus | None = None,
     ) -> list[Device]:
-        """Get devices with optional filters."""
-        devices = list(self._devices.values())
+        """Get devices with optional filters.
 
-        if device_type is not None:
-            devices = [d for d in devices if d.device_type == device_type]
-
-        if room_id is not None:
-            devices = [d for d in devices if d.room_id == room_id]
+        Starts from the smallest applicable index so only the remaining
+        predicates need a scan.
+        """
+        if device_type is not None and room_id is not None:
+            by_type = self._by_type.get(device_type, {})
+            by_room = self._by_room.get(room_id, {})
+            if len(by_type) <= len(by_room):
+                devices = [d for d in by_type.values() if d.room_id == room_id]
+            else:
+                devices = [d for d in by_room.values() if d.device_type == device_type]
+        elif device_type is not None:
+            devices = list(self._by_type.get(device_type, {}).values())
+        elif room_id is not None:
+            devices = list(self._by_room.get(room_id, {}).values())
+        else:
+            devices = list(self._devices.values())
 
         if status is not None:
             devices = [d for d in devices if d.status == status]
 
         return devices
 
+    # Each model class fixes its device_type, so the type index only ever
+    # holds instances of the matching class and the list getters can cast
     def get_light(self, device_id: str) -> Light | None:
         """Get a light by ID."""
         device = self._devices.get(device_id)
@@ -295,8 +500,7 @@ class DeviceManager:
 
     def get_lights(self, room_id: str | None = None) -> list[Light]:
         """Get all lights, optionally filtered by room."""
-        devices = self.get_devices(device_type=DeviceType.LIGHT, room_id=room_id)
-        return [d for d in devices if isinstance(d, Light)]
+        return cast(list[Light], self.get_devices(device_type=DeviceType.LIGHT, room_id=room_id))
 
     def get_plug(self, device_id: str) -> Plug | None:
         """Get a plug by ID."""
@@ -305,8 +509,7 @@ class DeviceManager:
 
     def get_plugs(self, room_id: str | None = None) -> list[Plug]:
         """Get all plugs, optionally filtered by room."""
-        devices = self.get_devices(device_type=DeviceType.PLUG, room_id=room_id)
-        return [d for d in devices if isinstance(d, Plug)]
+        return cast(list[Plug], self.get_devices(device_type=DeviceType.PLUG, room_id=room_id))
 
     def get_lock(self, device_id: str) -> Lock | None:
         """Get a lock by ID."""
@@ -315,8 +518,7 @@ class DeviceManager:
 
     def get_locks(self) -> list[Lock]:
         """Get all locks."""
-        devices = self.get_devices(device_type=DeviceType.LOCK)
-        return [d for d in devices if isinstance(d, Lock)]
+        return cast(list[Lock], self.get_devices(device_type=DeviceType.LOCK))
 
     def get_vacuum(self, device_id: str) -> Vacuum | None:
         """Get a vacuum by ID."""
@@ -325,8 +527,7 @@ class DeviceManager:
 
     def get_vacuums(self) -> list[Vacuum]:
         """Get all vacuums."""
-        devices = self.get_devices(device_type=DeviceType.VACUUM)
-        return [d for d in devices if isinstance(d, Vacuum)]
+        return cast(list[Vacuum], self.get_devices(device_type=DeviceType.VACUUM))
 
     # Room getters
     def get_room(self, room_id: str) -> Room | None:
@@ -349,15 +550,26 @@ class DeviceManager:
 
     def get_room_devices(self, room_id: str) -> list[Device]:
         """Get all devices in a room."""
-        room = self._rooms.get(room_id)
-        if room is None:
+        if room_id not in self._rooms:
             return []
-        return [self._devices[did] for did in room.device_ids if did in self._devices]
+        return list(self._by_room.get(room_id, {}).values())
 
     def count_lights_on(self, room_id: str | None = None) -> int:
         """Count how many lights are on, optionally in a specific room."""
-        lights = self.get_lights(room_id)
-        return sum(1 for light in lights if light.is_on)
+        lights = self._by_type.get(DeviceType.LIGHT, {}).values()
+        return sum(
+            1
+            for light in lights
+            if light.is_on and (room_id is None or light.room_id == room_id)
+        )
+
+    def count_lights_on_by_room(self) -> dict[str, int]:
+        """Count lights that are on in each room, in a single pass."""
+        counts: dict[str, int] = defaultdict(int)
+        for light in self._by_type.get(DeviceType.LIGHT, {}).values():
+            if light.is_on and light.room_id is not None:
+                counts[light.room_id] += 1
+        return dict(counts)
 
     # Device state as dicts for MCP responses
     def device_to_response(self, device: Device) -> dict[str, Any]:
@@ -384,6 +596,10 @@ class DeviceManager:
 
         return response
 
+    def device_to_json(self, device: Device) -> bytes:
+        """Serialize a device response straight to JSON bytes."""
+        return dumps_bytes(self.device_to_response(device))
+
     def room_to_response(self, room: Room) -> dict[str, Any]:
         """Convert a room to a detailed response dict."""
         devices = self.get_room_devices(room.id)
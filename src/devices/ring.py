@@ -29,7 +29,7 @@ _ring_circuit_breaker = CircuitBreaker(
 TOKEN_CACHE_PATH = Path.home() / ".cache" / "burrow" / "ring_token.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class RingCamera(Camera):
     """Ring camera/doorbell implementation using ring-doorbell library."""
 
@@ -187,7 +187,7 @@ class RingCamera(Camera):
 
     def to_state_dict(self) -> dict[str, Any]:
         """Return current state as dict."""
-        state = super().to_state_dict()
+        state = super(RingCamera, self).to_state_dict()
         state.update({
             "battery_percent": self.battery_percent,
             "has_subscription": self.has_subscription,
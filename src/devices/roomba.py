@@ -37,7 +37,7 @@ PHASE_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RoombaVacuum(Vacuum):
     """Roomba vacuum implementation using roombapy library."""
 
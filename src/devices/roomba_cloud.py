@@ -34,7 +34,7 @@ CLOUD_STATE_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RoombaCloudVacuum(Vacuum):
     """Roomba vacuum implementation using iRobot cloud API (irbt library)."""
 
@@ -196,7 +196,7 @@ class RoombaCloudVacuum(Vacuum):
 
     def to_state_dict(self) -> dict[str, Any]:
         """Return current state as dict."""
-        state = super().to_state_dict()
+        state = super(RoombaCloudVacuum, self).to_state_dict()
         state["control_method"] = "cloud"
         return state
 
@@ -20,7 +20,7 @@ _tuya_circuit_breaker = CircuitBreaker(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaPlug(Plug):
     """Tuya smart plug implementation."""
 
@@ -1,9 +1,17 @@
-"""Device discovery utilities for Burrow MCP."""
+"""Device discovery utilities for Burrow MCP.
 
-from discovery.lifx import discover_lifx
-from discovery.mqtt import scan_mqtt
-from discovery.network import scan_network
-from discovery.tuya import discover_tuya
+Scanners are imported on first use, so running one discovery command does not
+load the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from discovery.lifx import discover_lifx
+    from discovery.mqtt import scan_mqtt
+    from discovery.network import scan_network
+    from discovery.tuya import discover_tuya
 
 __all__ = [
     "discover_lifx",
@@ -11,3 +19,19 @@ __all__ = [
     "scan_mqtt",
     "scan_network",
 ]
+
+# Public name to defining module, resolved by __getattr__
+_LAZY_EXPORTS = {
+    "discover_lifx": "discovery.lifx",
+    "discover_tuya": "discovery.tuya",
+    "scan_mqtt": "discovery.mqtt",
+    "scan_network": "discovery.network",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import scanners on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
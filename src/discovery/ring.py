@@ -2,11 +2,13 @@
 
 import asyncio
 import sys
+from typing import TYPE_CHECKING
 
-from config import SecretsConfig
+if TYPE_CHECKING:
+    from config import SecretsConfig
 
 
-async def discover_ring(secrets: SecretsConfig | None = None) -> None:
+async def discover_ring(secrets: "SecretsConfig | None" = None) -> None:
     """Discover Ring devices and guide through authentication.
 
     Args:
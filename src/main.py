@@ -1,24 +1,49 @@
 """Main entry point for Burrow MCP server."""
 
 import asyncio
+import gc
 import logging
+import signal
 import sys
+import time
+from collections.abc import Callable
 
 from config import load_config, load_secrets
 from devices import register_all_factories
 from devices.manager import DeviceManager
 from mcp_server.server import create_server
-from persistence import get_store
+from persistence import close_store, get_store
 from presence import PresenceManager, create_presence_manager
 from recommendation import start_viewing_tracker, stop_viewing_tracker
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stderr)],
-)
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the asctime seconds part once per second."""
+
+    def __init__(self, fmt: str | None = None) -> None:
+        super().__init__(fmt)
+        self._cached_second: int | None = None
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        """Return the same text as Formatter.formatTime, reusing the strftime result."""
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime(self.default_time_format, self.converter(second))
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+_handler = logging.StreamHandler(sys.stderr)
+_handler.setFormatter(CachedTimeFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_handler])
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for background services to stop before giving up on them
+SHUTDOWN_TIMEOUT = 2.0
+
 
 async def main() -> None:
     """Main entry point."""
@@ -35,76 +60,116 @@ async def main() -> None:
 
     # Create device manager
     device_manager = DeviceManager(config, secrets)
-    register_all_factories(device_manager)
+    register_all_factories(device_manager, config.devices_by_type)
+
+    # Create presence manager; it starts listening once rooms exist
+    presence_manager: PresenceManager | None = None
+    if secrets.mqtt:
+        try:
+            presence_manager = create_presence_manager(secrets)
+            presence_manager.add_sensors(
+                (dc.id, dc.room, dc.config["mqtt_topic"])
+                for dc in config.devices_by_type.get("mmwave", ())
+                if dc.config.get("mqtt_topic") and dc.room
+            )
+            presence_manager.set_presence_callback(device_manager.apply_presence)
+        except Exception as e:
+            logger.warning(f"Failed to create presence manager: {e}")
+
+    # Initialize state store for persistence
+    store = await get_store()
 
-    # Initialize devices
+    # Stop on SIGINT/SIGTERM via an event rather than KeyboardInterrupt, which
+    # can land anywhere in the loop (not supported on Windows)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            break
+
+    # Start serving before devices are up so the client handshake and tool
+    # listing overlap device initialization; tool calls wait for mark_ready()
+    server = create_server(config, secrets, device_manager, presence_manager, store, ready=False)
+    server_task = asyncio.create_task(server.run())
+
+    # Initialize devices. This allocates mostly long-lived objects, so skip
+    # cyclic GC passes until it is done, then freeze them out of future
+    # collections
+    gc.disable()
     try:
-        await device_manager.initialize()
-        logger.info(f"Initialized {len(device_manager.get_devices())} devices")
+        results = await device_manager.initialize_all()
+        created = sum(1 for r in results if not isinstance(r, BaseException))
+        logger.info(f"Initialized {created}/{len(results)} devices")
     except Exception as e:
         logger.error(f"Failed to initialize devices: {e}")
+    finally:
+        gc.freeze()
+        gc.enable()
 
-    # Create presence manager
-    presence_manager: PresenceManager | None = None
-    if secrets.mqtt:
+    if presence_manager:
         try:
-            presence_manager = create_presence_manager(secrets)
-            for device_config in config.devices:
-                if device_config.type == "mmwave":
-                    mqtt_topic = device_config.config.get("mqtt_topic", "")
-                    if mqtt_topic and device_config.room:
-                        presence_manager.add_sensor(
-                            device_config.id,
-                            device_config.room,
-                            mqtt_topic,
-                        )
-
-            def on_presence_change(room_id: str, occupied: bool) -> None:
-                # Use device manager's method which also persists state
-                asyncio.create_task(
-                    device_manager.update_room_presence(room_id, occupied)
-                )
-                logger.info(f"Room {room_id} presence: {occupied}")
-
-            presence_manager.set_presence_callback(on_presence_change)
             await presence_manager.start()
             logger.info("Started presence monitoring")
         except Exception as e:
             logger.warning(f"Failed to start presence manager: {e}")
 
-    # Initialize state store for persistence
-    store = await get_store()
-
     # Start viewing tracker for background TV monitoring
     # This tracks what's playing on AppleTVs even when using the remote
-    viewing_tracker = None
     try:
-        viewing_tracker = await start_viewing_tracker(device_manager, store)
+        await start_viewing_tracker(device_manager, store)
         logger.info("Started viewing tracker for TV recommendations")
     except Exception as e:
         logger.warning(f"Failed to start viewing tracker: {e}")
 
-    # Create and run MCP server
-    server = create_server(config, secrets, device_manager, presence_manager, store)
+    server.mark_ready()
 
+    stop_task = asyncio.create_task(stop_event.wait())
     try:
         logger.info("MCP server running...")
-        await server.run()
+        await asyncio.wait({server_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if server_task.done():
+            server_task.result()
+        else:
+            logger.info("Shutting down...")
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     finally:
+        for task in (server_task, stop_task):
+            task.cancel()
+        await asyncio.gather(server_task, stop_task, return_exceptions=True)
+
         # Stop background services
         await stop_viewing_tracker()
         if presence_manager:
-            await presence_manager.stop()
+            try:
+                await asyncio.wait_for(presence_manager.stop(), timeout=SHUTDOWN_TIMEOUT)
+            except TimeoutError:
+                logger.warning("Presence manager did not stop in time")
         # Persist state before shutdown
-        await device_manager.shutdown()
+        try:
+            await device_manager.shutdown()
+        finally:
+            await close_store()
         logger.info("Shutdown complete")
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory if installed, else None for the default loop."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def run() -> None:
     """Synchronous entry point."""
-    asyncio.run(main())
+    with asyncio.Runner(debug=False, loop_factory=_loop_factory()) as runner:
+        runner.run(main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""Shared scaffolding for single-device command handlers."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from devices.manager import DeviceManager
+from mcp_server.handlers.audit_context import log_device_action
+from mcp_server.handlers.schedule_context import add_schedule_context
+from models import Device, DeviceStatus, Light
+from utils.errors import (
+    DEFAULT_DEVICE_TIMEOUT,
+    DeviceTimeoutError,
+    ErrorCategory,
+    ToolError,
+    classify_exception,
+    error_message,
+    execute_with_timeout,
+    get_recovery_suggestion,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def apply_light_settings(
+    light: Light,
+    on: bool,
+    brightness: int | None,
+    color: str | None,
+    kelvin: int | None,
+) -> dict[str, Any]:
+    """Switch one light and apply its settings, reporting failures in the result.
+
+    Used by the room-wide light tools, which keep going when one light fails.
+    """
+    result: dict[str, Any] = {"device_id": light.id}
+
+    # Check if light is offline before attempting operations
+    if light.status == DeviceStatus.OFFLINE:
+        result["success"] = False
+        result["error"] = "Device offline"
+        result["error_category"] = ErrorCategory.DEVICE_OFFLINE.value
+        return result
+
+    try:
+        # Use timeout for each device operation
+        async with asyncio.timeout(DEFAULT_DEVICE_TIMEOUT):
+            await light.set_power(on)
+            if on and brightness is not None:
+                await light.set_brightness(brightness)
+            if on and color is not None and light.supports_color:
+                await light.set_color(color)
+            if on and kelvin is not None:
+                await light.set_color_temp(kelvin)
+
+        result["success"] = True
+    except TimeoutError:
+        result["success"] = False
+        result["error"] = "Device timeout"
+        result["error_category"] = ErrorCategory.TIMEOUT.value
+    except Exception as e:
+        result["success"] = False
+        result["error"] = error_message(e)
+        result["error_category"] = classify_exception(e, light.id).category.value
+
+    return result
+
+
+class DeviceCommandHandlers:
+    """Base for handlers that send one command to one device.
+
+    Subclasses set ``device_kind``, which names the device in error messages.
+    """
+
+    device_kind = "Device"
+
+    def __init__(self, device_manager: DeviceManager):
+        self.device_manager = device_manager
+
+    def _check_device_online(self, device: Any, device_id: str) -> ToolError | None:
+        """Check if device is online, return error if not."""
+        if device.status == DeviceStatus.OFFLINE:
+            return ToolError(
+                category=ErrorCategory.DEVICE_OFFLINE,
+                message=f"{self.device_kind} {device_id} is offline",
+                device_id=device_id,
+                recovery=get_recovery_suggestion(ErrorCategory.DEVICE_OFFLINE),
+            )
+        return None
+
+    async def _run_command(
+        self,
+        device: Device | None,
+        device_id: str,
+        operation: str,
+        command: Callable[[Any], Awaitable[Any]],
+        state: Callable[[Any], dict[str, Any]],
+        action: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        check: Callable[[Any], ToolError | None] | None = None,
+    ) -> dict[str, Any]:
+        """Run a command on a device and build the tool response.
+
+        Args:
+            device: Device from the manager lookup, or None if not found
+            device_id: Requested device ID
+            operation: Device operation name, used for timeouts and logs
+            command: Starts the operation on the device
+            state: Response fields describing the device after the command
+            action: Audit log action name (default: ``operation``)
+            metadata: Command arguments recorded in the audit log
+            check: Extra validation run once the device is known to be online
+        """
+        if device is None:
+            return ToolError(
+                category=ErrorCategory.DEVICE_NOT_FOUND,
+                message=f"{self.device_kind} not found: {device_id}",
+                device_id=device_id,
+                recovery=get_recovery_suggestion(ErrorCategory.DEVICE_NOT_FOUND),
+            ).to_dict()
+
+        if error := self._check_device_online(device, device_id):
+            return error.to_dict()
+
+        if check is not None and (error := check(device)):
+            return error.to_dict()
+
+        kind = self.device_kind.lower()
+        try:
+            previous_state = device.to_state_dict()
+
+            await execute_with_timeout(
+                command(device),
+                timeout=DEFAULT_DEVICE_TIMEOUT,
+                device_id=device_id,
+                operation=operation,
+            )
+
+            await log_device_action(
+                device_id=device_id,
+                action=action or operation,
+                previous_state=previous_state,
+                new_state=device.to_state_dict(),
+                metadata=metadata,
+            )
+
+            response = {
+                "success": True,
+                "device_id": device_id,
+                **state(device),
+                "device_status": device.status.value,
+            }
+            return await add_schedule_context(response, device_id)
+        except (DeviceTimeoutError, TimeoutError) as e:
+            logger.error(f"Timeout running {operation} on {kind} {device_id}: {e}")
+            return ToolError(
+                category=ErrorCategory.TIMEOUT,
+                message=f"{self.device_kind} {device_id} did not respond",
+                device_id=device_id,
+                recovery=get_recovery_suggestion(ErrorCategory.TIMEOUT),
+            ).to_dict()
+        except Exception as e:
+            logger.error(f"Failed to run {operation} on {kind} {device_id}: {e}")
+            error = classify_exception(e, device_id)
+            return error.to_dict()
@@ -103,7 +103,8 @@ async def handle_get_system_status(
 
     # Count occupied rooms
     occupied_rooms = [r for r in rooms if r.occupied]
-    lights_on = sum(device_manager.count_lights_on(r.id) for r in rooms)
+    lights_on_by_room = device_manager.count_lights_on_by_room()
+    lights_on = sum(lights_on_by_room.get(r.id, 0) for r in rooms)
 
     # Group devices by type
     by_type: dict[str, int] = {}
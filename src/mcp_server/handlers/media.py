@@ -16,6 +16,7 @@ from utils.errors import (
     ErrorCategory,
     ToolError,
     classify_exception,
+    error_message,
     execute_with_timeout,
     get_recovery_suggestion,
 )
@@ -446,7 +447,7 @@ class MediaHandlers:
             # App not found
             return ToolError(
                 category=ErrorCategory.INVALID_INPUT,
-                message=str(e),
+                message=error_message(e),
                 device_id=device_id,
                 recovery="Use list_apps to see available apps",
             ).to_dict()
@@ -10,6 +10,10 @@ from utils.errors import DEFAULT_DEVICE_TIMEOUT, execute_with_timeout
 
 logger = logging.getLogger(__name__)
 
+# Filter values to enum members, so bad input needs no exception handling
+_DEVICE_TYPES = {t.value: t for t in DeviceType}
+_DEVICE_STATUSES = {s.value: s for s in DeviceStatus}
+
 
 class QueryHandlers:
     """Handlers for query tools."""
@@ -28,10 +32,11 @@ class QueryHandlers:
         occupied_only = args.get("occupied_only", False)
 
         rooms = self.device_manager.get_rooms(floor=floor, occupied_only=occupied_only)
+        lights_on = self.device_manager.count_lights_on_by_room()
         return {
             "rooms": [
                 room.to_summary_dict(
-                    lights_on=self.device_manager.count_lights_on(room.id),
+                    lights_on=lights_on.get(room.id, 0),
                     device_count=len(room.device_ids),
                 )
                 for room in rooms
@@ -51,20 +56,25 @@ class QueryHandlers:
         """List devices with optional filters."""
         device_type = None
         if "device_type" in args:
-            try:
-                device_type = DeviceType(args["device_type"])
-            except ValueError:
+            device_type = _DEVICE_TYPES.get(args["device_type"])
+            if device_type is None:
                 return {"error": f"Invalid device type: {args['device_type']}"}
 
         status = None
         if "status" in args:
-            try:
-                status = DeviceStatus(args["status"])
-            except ValueError:
+            status = _DEVICE_STATUSES.get(args["status"])
+            if status is None:
                 return {"error": f"Invalid status: {args['status']}"}
 
         room_id = args.get("room_id")
 
+        if args.get("refresh", False):
+            # Refresh before filtering so status reflects the live state
+            candidates = self.device_manager.get_devices(device_type=device_type, room_id=room_id)
+            await self.device_manager.refresh_devices(
+                [d.id for d in candidates], timeout=DEFAULT_DEVICE_TIMEOUT
+            )
+
         devices = self.device_manager.get_devices(
             device_type=device_type, room_id=room_id, status=status
         )
@@ -73,24 +83,26 @@ class QueryHandlers:
     async def get_device_state(self, args: dict[str, Any]) -> dict[str, Any]:
         """Get detailed device state."""
         device_id = args["device_id"]
-        device = self.device_manager.get_device(device_id)
-        if device is None:
-            return {"error": f"Device not found: {device_id}"}
-
+        force = args.get("refresh", False)
         try:
-            await execute_with_timeout(
-                self.device_manager.refresh_device(device_id),
+            device = await execute_with_timeout(
+                self.device_manager.refresh_device(device_id, force=force),
                 timeout=DEFAULT_DEVICE_TIMEOUT,
                 device_id=device_id,
                 operation="refresh",
             )
         except Exception as e:
+            device = self.device_manager.get_device(device_id)
+            if device is None:
+                return {"error": f"Device not found: {device_id}"}
             logger.warning(f"Failed to refresh device {device_id}: {e}")
             # Return cached state with warning
             response = self.device_manager.device_to_response(device)
             response["warning"] = f"Using cached state: {e}"
             return response
 
+        if device is None:
+            return {"error": f"Device not found: {device_id}"}
         return self.device_manager.device_to_response(device)
 
     async def get_presence(self, args: dict[str, Any]) -> dict[str, Any]:
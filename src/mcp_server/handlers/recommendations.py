@@ -6,6 +6,7 @@ from typing import Any
 from persistence import StateStore
 from recommendation import RecommendationEngine
 from recommendation.tv_metadata import TVMetadata, get_streaming_service
+from utils.errors import error_message
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +52,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to get recommendations: {e}")
             return {
                 "error": "Failed to generate recommendations",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def what_to_watch(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -67,7 +68,7 @@ class RecommendationHandlers:
             return {
                 "suggestion": "Browse your streaming apps",
                 "reason": "Couldn't generate a personalized suggestion right now",
-                "error": str(e),
+                "error": error_message(e),
             }
 
     async def get_viewing_history(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -102,7 +103,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to get viewing history: {e}")
             return {
                 "error": "Failed to retrieve viewing history",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def get_viewing_stats(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -162,7 +163,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to get viewing stats: {e}")
             return {
                 "error": "Failed to retrieve viewing statistics",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def rate_content(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -209,7 +210,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to rate content: {e}")
             return {
                 "error": "Failed to save rating",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def seed_favorites(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -235,7 +236,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to seed favorites: {e}")
             return {
                 "error": "Failed to seed favorites",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def follow_show(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -285,7 +286,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to follow show: {e}")
             return {
                 "error": "Failed to follow show",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def unfollow_show(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -315,7 +316,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to unfollow show: {e}")
             return {
                 "error": "Failed to unfollow show",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def get_followed_shows(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -332,7 +333,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to get followed shows: {e}")
             return {
                 "error": "Failed to get followed shows",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def check_new_episodes(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -389,7 +390,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to check new episodes: {e}")
             return {
                 "error": "Failed to check for new episodes",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def discover_content(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -450,7 +451,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to discover content: {e}")
             return {
                 "error": "Failed to discover content",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def find_similar(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -505,7 +506,7 @@ class RecommendationHandlers:
             logger.error(f"Failed to find similar content: {e}")
             return {
                 "error": "Failed to find similar content",
-                "message": str(e),
+                "message": error_message(e),
             }
 
     async def not_that_try_again(self, args: dict[str, Any]) -> dict[str, Any]:
@@ -612,5 +613,5 @@ class RecommendationHandlers:
             logger.error(f"Failed to find alternatives: {e}")
             return {
                 "error": "Failed to find alternatives",
-                "message": str(e),
+                "message": error_message(e),
             }
@@ -2,28 +2,58 @@
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from config import BurrowConfig, SceneAction
+from config import BurrowConfig, SceneAction, SceneConfig
 from devices.manager import DeviceManager
-from models import DeviceStatus, Light, Plug
+from mcp_server.handlers.device_command import apply_light_settings
+from models import DeviceStatus, DeviceType, Light, Plug
 from utils.errors import (
     DEFAULT_DEVICE_TIMEOUT,
     ErrorCategory,
     ToolError,
     classify_exception,
+    error_message,
     get_recovery_suggestion,
 )
 
 logger = logging.getLogger(__name__)
 
 
+async def _apply_light_action(light: Light, action: SceneAction) -> None:
+    """Apply a scene's device settings to a light."""
+    if action.on is not None:
+        await light.set_power(action.on)
+    if action.brightness is not None:
+        await light.set_brightness(action.brightness)
+    if action.color is not None and light.supports_color:
+        await light.set_color(action.color)
+    if action.kelvin is not None:
+        await light.set_color_temp(action.kelvin)
+
+
+async def _apply_plug_action(plug: Plug, action: SceneAction) -> None:
+    """Apply a scene's device settings to a plug."""
+    if action.on is not None:
+        await plug.set_power(action.on)
+
+
+# Device actions by device type; other types are accepted and left untouched
+_DEVICE_ACTIONS: dict[DeviceType, Callable[[Any, SceneAction], Awaitable[None]]] = {
+    DeviceType.LIGHT: _apply_light_action,
+    DeviceType.PLUG: _apply_plug_action,
+}
+
+
 class SceneHandlers:
     """Handlers for scene tools."""
 
     def __init__(self, config: BurrowConfig, device_manager: DeviceManager):
         self.config = config
         self.device_manager = device_manager
+        # Config is frozen, so the index never goes stale
+        self._scenes_by_id: dict[str, SceneConfig] = {s.id: s for s in config.scenes}
 
     async def list_scenes(self, args: dict[str, Any]) -> dict[str, Any]:
         """List available scenes."""
@@ -38,7 +68,7 @@ class SceneHandlers:
         """Activate a scene with detailed status reporting."""
         scene_id = args["scene_id"]
 
-        scene = next((s for s in self.config.scenes if s.id == scene_id), None)
+        scene = self._scenes_by_id.get(scene_id)
         if scene is None:
             return ToolError(
                 category=ErrorCategory.DEVICE_NOT_FOUND,
@@ -64,7 +94,7 @@ class SceneHandlers:
                 results.append({
                     "action": action.type,
                     "success": False,
-                    "error": str(e),
+                    "error": error_message(e),
                     "error_category": error.category.value,
                 })
 
@@ -119,18 +149,17 @@ class SceneHandlers:
         """Execute room_lights action."""
         room_id = action.room
         if room_id == "all":
-            all_results = []
-            total_success = 0
-            total_failed = 0
-            for room in self.device_manager.get_rooms():
-                result = await self._set_room_lights(
-                    room.id, action.on or False, action.brightness, action.color, action.kelvin
+            # Rooms are independent, so set them all at once
+            all_results = await asyncio.gather(
+                *(
+                    self._set_room_lights(
+                        room.id, action.on or False, action.brightness, action.color, action.kelvin
+                    )
+                    for room in self.device_manager.get_rooms()
                 )
-                all_results.append(result)
-                if result.get("success_count", 0) > 0:
-                    total_success += result.get("success_count", 0)
-                if result.get("failed_count", 0) > 0:
-                    total_failed += result.get("failed_count", 0)
+            )
+            total_success = sum(r.get("success_count", 0) for r in all_results)
+            total_failed = sum(r.get("failed_count", 0) for r in all_results)
             return {
                 "action": "room_lights",
                 "room": "all",
@@ -172,46 +201,11 @@ class SceneHandlers:
                 "note": "No lights in room",
             }
 
-        results = []
-        success_count = 0
-        failed_count = 0
-
-        for light in lights:
-            result = {"device_id": light.id}
-
-            # Check if light is offline
-            if light.status == DeviceStatus.OFFLINE:
-                result["success"] = False
-                result["error"] = "Device offline"
-                result["error_category"] = ErrorCategory.DEVICE_OFFLINE.value
-                failed_count += 1
-                results.append(result)
-                continue
-
-            try:
-                async with asyncio.timeout(DEFAULT_DEVICE_TIMEOUT):
-                    await light.set_power(on)
-                    if on and brightness is not None:
-                        await light.set_brightness(brightness)
-                    if on and color is not None and light.supports_color:
-                        await light.set_color(color)
-                    if on and kelvin is not None:
-                        await light.set_color_temp(kelvin)
-
-                result["success"] = True
-                success_count += 1
-            except asyncio.TimeoutError:
-                result["success"] = False
-                result["error"] = "Device timeout"
-                result["error_category"] = ErrorCategory.TIMEOUT.value
-                failed_count += 1
-            except Exception as e:
-                result["success"] = False
-                result["error"] = str(e)
-                result["error_category"] = classify_exception(e, light.id).category.value
-                failed_count += 1
-
-            results.append(result)
+        results = await asyncio.gather(
+            *(apply_light_settings(light, on, brightness, color, kelvin) for light in lights)
+        )
+        success_count = sum(1 for r in results if r["success"])
+        failed_count = len(results) - success_count
 
         return {
             "room_id": room_id,
@@ -253,19 +247,10 @@ class SceneHandlers:
             }
 
         try:
-            async with asyncio.timeout(DEFAULT_DEVICE_TIMEOUT):
-                if isinstance(device, Light):
-                    if action.on is not None:
-                        await device.set_power(action.on)
-                    if action.brightness is not None:
-                        await device.set_brightness(action.brightness)
-                    if action.color is not None and device.supports_color:
-                        await device.set_color(action.color)
-                    if action.kelvin is not None:
-                        await device.set_color_temp(action.kelvin)
-                elif isinstance(device, Plug):
-                    if action.on is not None:
-                        await device.set_power(action.on)
+            apply = _DEVICE_ACTIONS.get(device.device_type)
+            if apply is not None:
+                async with asyncio.timeout(DEFAULT_DEVICE_TIMEOUT):
+                    await apply(device, action)
 
             return {"action": "device", "device": device_id, "success": True}
         except asyncio.TimeoutError:
@@ -281,7 +266,7 @@ class SceneHandlers:
                 "action": "device",
                 "device": device_id,
                 "success": False,
-                "error": str(e),
+                "error": error_message(e),
                 "error_category": classify_exception(e, device_id).category.value,
             }
 
@@ -342,6 +327,6 @@ class SceneHandlers:
                 "action": "lock",
                 "device": device_id,
                 "success": False,
-                "error": str(e),
+                "error": error_message(e),
                 "error_category": classify_exception(e, device_id).category.value,
             }
@@ -1,8 +1,9 @@
 """MCP server implementation for Burrow home automation."""
 
 import asyncio
-import json
 import logging
+from collections.abc import Awaitable, Callable
+from functools import cached_property, partial
 from typing import Any
 
 from mcp.server import Server
@@ -26,7 +27,7 @@ from mcp_server.handlers import (
 )
 from mcp_server.handlers.audit_context import set_store as set_audit_context_store
 from mcp_server.handlers.schedule_context import set_store as set_schedule_context_store
-from mcp_server.tools import get_all_tools
+from mcp_server.tools import get_all_tools, get_argument_validators
 from persistence import StateStore
 from presence import PresenceManager
 from utils.errors import (
@@ -37,12 +38,20 @@ from utils.errors import (
     generate_request_id,
     get_recovery_suggestion,
 )
+from utils.serialization import dumps
 
 logger = logging.getLogger(__name__)
 
 # Timeout for tool handler execution
 TOOL_TIMEOUT = DEFAULT_HANDLER_TIMEOUT
 
+ToolHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+async def _unavailable(message: str, args: dict[str, Any]) -> dict[str, Any]:
+    """Handler for tools whose backing service is not configured."""
+    return {"error": message}
+
 
 class BurrowMcpServer:
     """MCP server for Burrow home automation."""
@@ -54,10 +63,16 @@ class BurrowMcpServer:
         device_manager: DeviceManager,
         presence_manager: PresenceManager | None = None,
         store: StateStore | None = None,
+        ready: bool = True,
     ):
         self.config = config
         self.device_manager = device_manager
         self.store = store
+        # Tool calls wait on this so the server can start serving before
+        # devices finish initializing
+        self._ready = asyncio.Event()
+        if ready:
+            self._ready.set()
 
         # Initialize handlers
         self.query = QueryHandlers(device_manager, presence_manager)
@@ -83,6 +98,9 @@ class BurrowMcpServer:
             self.media = MediaHandlers(device_manager, None)
             self.recommendations = None
 
+        self._dispatch = self._build_dispatch()
+        self._validators = get_argument_validators()
+
         # Set up MCP server
         self.server = Server("burrow")
         self._setup_handlers()
@@ -90,34 +108,35 @@ class BurrowMcpServer:
     def _setup_handlers(self) -> None:
         """Set up MCP tool handlers."""
 
+        tools = get_all_tools()
+
         @self.server.list_tools()
         async def list_tools() -> list:
-            return get_all_tools()
+            return tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             request_id = generate_request_id()
             device_id = arguments.get("device_id")
 
-            logger.info(
-                f"[{request_id}] Tool call: {name} "
-                f"(device={device_id or 'N/A'})"
-            )
+            # Per-call logging defers formatting until a handler emits the record
+            logger.info("[%s] Tool call: %s (device=%s)", request_id, name, device_id or "N/A")
 
             try:
                 # Execute with timeout protection
                 async with asyncio.timeout(TOOL_TIMEOUT):
+                    await self._ready.wait()
                     result = await self._handle_tool(name, arguments)
 
                 # Add request_id to successful responses for tracing
                 if isinstance(result, dict) and "error" not in result:
                     result["request_id"] = request_id
 
-                logger.info(f"[{request_id}] Tool {name} completed successfully")
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                logger.info("[%s] Tool %s completed successfully", request_id, name)
+                return [TextContent(type="text", text=dumps(result))]
 
             except asyncio.TimeoutError:
-                logger.error(f"[{request_id}] Tool {name} timed out after {TOOL_TIMEOUT}s")
+                logger.error("[%s] Tool %s timed out after %ss", request_id, name, TOOL_TIMEOUT)
                 error = ToolError(
                     category=ErrorCategory.TIMEOUT,
                     message=f"Operation timed out after {TOOL_TIMEOUT} seconds",
@@ -125,178 +144,119 @@ class BurrowMcpServer:
                     request_id=request_id,
                     recovery=get_recovery_suggestion(ErrorCategory.TIMEOUT),
                 )
-                return [TextContent(type="text", text=json.dumps(error.to_dict(), indent=2))]
+                return [TextContent(type="text", text=dumps(error.to_dict()))]
 
             except Exception as e:
-                logger.exception(f"[{request_id}] Error handling tool {name}: {e}")
+                logger.exception("[%s] Error handling tool %s: %s", request_id, name, e)
                 error = classify_exception(e, device_id)
                 error.request_id = request_id
-                return [TextContent(type="text", text=json.dumps(error.to_dict(), indent=2))]
+                return [TextContent(type="text", text=dumps(error.to_dict()))]
+
+    def _build_dispatch(self) -> dict[str, ToolHandler]:
+        """Map each tool name to the handler that serves it."""
+        dispatch: dict[str, ToolHandler] = {
+            # Discovery tools
+            "discover_tools": partial(handle_discover_tools, device_manager=self.device_manager),
+            "get_system_status": partial(
+                handle_get_system_status, device_manager=self.device_manager
+            ),
+            # Query tools
+            "list_rooms": self.query.list_rooms,
+            "get_room_state": self.query.get_room_state,
+            "list_devices": self.query.list_devices,
+            "get_device_state": self.query.get_device_state,
+            "get_presence": self.query.get_presence,
+            # Light tools
+            "set_light_power": self.lights.set_light_power,
+            "set_light_brightness": self.lights.set_light_brightness,
+            "set_light_color": self.lights.set_light_color,
+            "set_light_temperature": self.lights.set_light_temperature,
+            "set_room_lights": self.lights.set_room_lights,
+            # Plug tools
+            "set_plug_power": self.plugs.set_plug_power,
+            # Lock tools
+            "lock_door": self.locks.lock_door,
+            "unlock_door": self.locks.unlock_door,
+            # Vacuum tools
+            "start_vacuum": self.vacuum.start_vacuum,
+            "stop_vacuum": self.vacuum.stop_vacuum,
+            "dock_vacuum": self.vacuum.dock_vacuum,
+            # Media tools
+            "get_now_playing": self.media.get_now_playing,
+            "media_play": self.media.media_play,
+            "media_pause": self.media.media_pause,
+            "media_stop": self.media.media_stop,
+            "media_skip_forward": self.media.media_skip_forward,
+            "media_skip_backward": self.media.media_skip_backward,
+            "launch_app": self.media.launch_app,
+            "list_apps": self.media.list_apps,
+            # Scene tools
+            "list_scenes": self.scenes.list_scenes,
+            "activate_scene": self.scenes.activate_scene,
+        }
+
+        # Tools that need the state store, with the error returned without one
+        store_tools: dict[str, tuple[Any, str]] = {
+            # Recommendation tools
+            "get_recommendations": (self.recommendations, "Recommendations not available"),
+            "what_to_watch": (self.recommendations, "Recommendations not available"),
+            "get_viewing_history": (self.recommendations, "Viewing history not available"),
+            "get_viewing_stats": (self.recommendations, "Viewing stats not available"),
+            "rate_content": (self.recommendations, "Rating not available"),
+            "seed_favorites": (self.recommendations, "Favorites not available"),
+            "follow_show": (self.recommendations, "Follow show not available"),
+            "unfollow_show": (self.recommendations, "Unfollow show not available"),
+            "get_followed_shows": (self.recommendations, "Followed shows not available"),
+            "check_new_episodes": (self.recommendations, "Episode check not available"),
+            "discover_content": (self.recommendations, "Discovery not available"),
+            "find_similar": (self.recommendations, "Find similar not available"),
+            "not_that_try_again": (self.recommendations, "Not available"),
+            # Scheduling tools
+            "schedule_action": (self.scheduling, "Scheduling not available"),
+            "list_scheduled_actions": (self.scheduling, "Scheduling not available"),
+            "cancel_scheduled_action": (self.scheduling, "Scheduling not available"),
+            "modify_scheduled_action": (self.scheduling, "Scheduling not available"),
+            # Audit tools
+            "get_device_history": (self.scheduling, "Audit not available"),
+            "get_audit_log": (self.scheduling, "Audit not available"),
+        }
+        for name, (handlers, unavailable) in store_tools.items():
+            if handlers is not None:
+                dispatch[name] = getattr(handlers, name)
+            else:
+                dispatch[name] = partial(
+                    _unavailable, f"{unavailable} (store not initialized)"
+                )
+
+        return dispatch
 
     async def _handle_tool(self, name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Route tool calls to appropriate handlers."""
-        # Discovery tools
-        if name == "discover_tools":
-            return await handle_discover_tools(args, self.device_manager)
-        elif name == "get_system_status":
-            return await handle_get_system_status(args, self.device_manager)
-
-        # Query tools
-        elif name == "list_rooms":
-            return await self.query.list_rooms(args)
-        elif name == "get_room_state":
-            return await self.query.get_room_state(args)
-        elif name == "list_devices":
-            return await self.query.list_devices(args)
-        elif name == "get_device_state":
-            return await self.query.get_device_state(args)
-        elif name == "get_presence":
-            return await self.query.get_presence(args)
-
-        # Light tools
-        elif name == "set_light_power":
-            return await self.lights.set_light_power(args)
-        elif name == "set_light_brightness":
-            return await self.lights.set_light_brightness(args)
-        elif name == "set_light_color":
-            return await self.lights.set_light_color(args)
-        elif name == "set_light_temperature":
-            return await self.lights.set_light_temperature(args)
-        elif name == "set_room_lights":
-            return await self.lights.set_room_lights(args)
-
-        # Plug tools
-        elif name == "set_plug_power":
-            return await self.plugs.set_plug_power(args)
-
-        # Lock tools
-        elif name == "lock_door":
-            return await self.locks.lock_door(args)
-        elif name == "unlock_door":
-            return await self.locks.unlock_door(args)
-
-        # Vacuum tools
-        elif name == "start_vacuum":
-            return await self.vacuum.start_vacuum(args)
-        elif name == "stop_vacuum":
-            return await self.vacuum.stop_vacuum(args)
-        elif name == "dock_vacuum":
-            return await self.vacuum.dock_vacuum(args)
-
-        # Media tools
-        elif name == "get_now_playing":
-            return await self.media.get_now_playing(args)
-        elif name == "media_play":
-            return await self.media.media_play(args)
-        elif name == "media_pause":
-            return await self.media.media_pause(args)
-        elif name == "media_stop":
-            return await self.media.media_stop(args)
-        elif name == "media_skip_forward":
-            return await self.media.media_skip_forward(args)
-        elif name == "media_skip_backward":
-            return await self.media.media_skip_backward(args)
-        elif name == "launch_app":
-            return await self.media.launch_app(args)
-        elif name == "list_apps":
-            return await self.media.list_apps(args)
-
-        # Recommendation tools
-        elif name == "get_recommendations":
-            if not self.recommendations:
-                return {"error": "Recommendations not available (store not initialized)"}
-            return await self.recommendations.get_recommendations(args)
-        elif name == "what_to_watch":
-            if not self.recommendations:
-                return {"error": "Recommendations not available (store not initialized)"}
-            return await self.recommendations.what_to_watch(args)
-        elif name == "get_viewing_history":
-            if not self.recommendations:
-                return {"error": "Viewing history not available (store not initialized)"}
-            return await self.recommendations.get_viewing_history(args)
-        elif name == "get_viewing_stats":
-            if not self.recommendations:
-                return {"error": "Viewing stats not available (store not initialized)"}
-            return await self.recommendations.get_viewing_stats(args)
-        elif name == "rate_content":
-            if not self.recommendations:
-                return {"error": "Rating not available (store not initialized)"}
-            return await self.recommendations.rate_content(args)
-        elif name == "seed_favorites":
-            if not self.recommendations:
-                return {"error": "Favorites not available (store not initialized)"}
-            return await self.recommendations.seed_favorites(args)
-        elif name == "follow_show":
-            if not self.recommendations:
-                return {"error": "Follow show not available (store not initialized)"}
-            return await self.recommendations.follow_show(args)
-        elif name == "unfollow_show":
-            if not self.recommendations:
-                return {"error": "Unfollow show not available (store not initialized)"}
-            return await self.recommendations.unfollow_show(args)
-        elif name == "get_followed_shows":
-            if not self.recommendations:
-                return {"error": "Followed shows not available (store not initialized)"}
-            return await self.recommendations.get_followed_shows(args)
-        elif name == "check_new_episodes":
-            if not self.recommendations:
-                return {"error": "Episode check not available (store not initialized)"}
-            return await self.recommendations.check_new_episodes(args)
-        elif name == "discover_content":
-            if not self.recommendations:
-                return {"error": "Discovery not available (store not initialized)"}
-            return await self.recommendations.discover_content(args)
-        elif name == "find_similar":
-            if not self.recommendations:
-                return {"error": "Find similar not available (store not initialized)"}
-            return await self.recommendations.find_similar(args)
-        elif name == "not_that_try_again":
-            if not self.recommendations:
-                return {"error": "Not available (store not initialized)"}
-            return await self.recommendations.not_that_try_again(args)
-
-        # Scene tools
-        elif name == "list_scenes":
-            return await self.scenes.list_scenes(args)
-        elif name == "activate_scene":
-            return await self.scenes.activate_scene(args)
-
-        # Scheduling tools
-        elif name == "schedule_action":
-            if not self.scheduling:
-                return {"error": "Scheduling not available (store not initialized)"}
-            return await self.scheduling.schedule_action(args)
-        elif name == "list_scheduled_actions":
-            if not self.scheduling:
-                return {"error": "Scheduling not available (store not initialized)"}
-            return await self.scheduling.list_scheduled_actions(args)
-        elif name == "cancel_scheduled_action":
-            if not self.scheduling:
-                return {"error": "Scheduling not available (store not initialized)"}
-            return await self.scheduling.cancel_scheduled_action(args)
-        elif name == "modify_scheduled_action":
-            if not self.scheduling:
-                return {"error": "Scheduling not available (store not initialized)"}
-            return await self.scheduling.modify_scheduled_action(args)
-
-        # Audit tools
-        elif name == "get_device_history":
-            if not self.scheduling:
-                return {"error": "Audit not available (store not initialized)"}
-            return await self.scheduling.get_device_history(args)
-        elif name == "get_audit_log":
-            if not self.scheduling:
-                return {"error": "Audit not available (store not initialized)"}
-            return await self.scheduling.get_audit_log(args)
-
-        return {"error": f"Unknown tool: {name}"}
+        handler = self._dispatch.get(name)
+        if handler is None:
+            return {"error": f"Unknown tool: {name}"}
+        validate = self._validators.get(name)
+        if validate is not None and (problem := validate(args)):
+            return ToolError(
+                category=ErrorCategory.INVALID_INPUT,
+                message=f"Invalid arguments for {name}: {problem}",
+                recovery="Use 'discover_tools' to see each tool's parameters.",
+            ).to_dict()
+        return await handler(args)
+
+    def mark_ready(self) -> None:
+        """Let tool calls through once devices are initialized."""
+        self._ready.set()
+
+    @cached_property
+    def _initialization_options(self) -> Any:
+        """Initialization options, built once for every run of this server."""
+        return self.server.create_initialization_options()
 
     async def run(self) -> None:
         """Run the MCP server."""
         async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream, write_stream, self.server.create_initialization_options()
-            )
+            await self.server.run(read_stream, write_stream, self._initialization_options)
 
 
 def create_server(
@@ -305,6 +265,10 @@ def create_server(
     device_manager: DeviceManager,
     presence_manager: PresenceManager | None = None,
     store: StateStore | None = None,
+    ready: bool = True,
 ) -> BurrowMcpServer:
-    """Create a new Burrow MCP server instance."""
-    return BurrowMcpServer(config, secrets, device_manager, presence_manager, store)
+    """Create a new Burrow MCP server instance.
+
+    Pass ``ready=False`` to hold tool calls until ``mark_ready()`` is called.
+    """
+    return BurrowMcpServer(config, secrets, device_manager, presence_manager, store, ready)
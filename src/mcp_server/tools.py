@@ -9,8 +9,25 @@ Tool definitions follow advanced tool use best practices:
 - Metadata tags for categorization and deferred loading support
 """
 
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
 from mcp.types import Tool
 
+# Returns a description of the first problem with the arguments, or None
+ArgumentValidator = Callable[[dict[str, Any]], str | None]
+
+# JSON Schema types to the Python types json.loads produces for them
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
 
 # Tool category metadata for Tool Search Tool discovery
 # Tags enable efficient tool search without loading full definitions
@@ -91,6 +108,11 @@ TOOL_CATEGORIES = {
 }
 
 
+def _device_id_property(description: str) -> dict:
+    """Schema for a tool's device_id argument."""
+    return {"type": "string", "description": description}
+
+
 def _add_examples(schema: dict, examples: list[dict]) -> dict:
     """Add input examples to a tool schema for programmatic tool calling.
 
@@ -207,6 +229,10 @@ def get_query_tools() -> list[Tool]:
                             "enum": ["online", "offline"],
                             "description": "Filter by online status",
                         },
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Query devices not refreshed recently before listing",
+                        },
                     },
                 },
                 [
@@ -225,16 +251,17 @@ def get_query_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Device identifier",
+                        "device_id": _device_id_property("Device identifier"),
+                        "refresh": {
+                            "type": "boolean",
+                            "description": "Query the device even if it was refreshed recently",
                         },
                     },
                     "required": ["device_id"],
                 },
                 [
                     {"device_id": "living_room_lamp"},
-                    {"device_id": "front_door"},
+                    {"device_id": "front_door", "refresh": True},
                 ],
             ),
         ),
@@ -259,10 +286,7 @@ def get_light_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Light device ID",
-                        },
+                        "device_id": _device_id_property("Light device ID"),
                         "on": {
                             "type": "boolean",
                             "description": "True to turn on, false to turn off",
@@ -283,10 +307,7 @@ def get_light_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Light device ID",
-                        },
+                        "device_id": _device_id_property("Light device ID"),
                         "brightness": {
                             "type": "integer",
                             "minimum": 0,
@@ -309,10 +330,7 @@ def get_light_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Light device ID",
-                        },
+                        "device_id": _device_id_property("Light device ID"),
                         "color": {
                             "type": "string",
                             "description": "Hex color code (e.g. '#FF0000' for red)",
@@ -334,10 +352,7 @@ def get_light_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Light device ID",
-                        },
+                        "device_id": _device_id_property("Light device ID"),
                         "kelvin": {
                             "type": "integer",
                             "minimum": 1500,
@@ -405,10 +420,7 @@ def get_plug_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Plug device ID",
-                        },
+                        "device_id": _device_id_property("Plug device ID"),
                         "on": {
                             "type": "boolean",
                             "description": "True to turn on, false to turn off",
@@ -435,10 +447,7 @@ def get_lock_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Lock device ID",
-                        },
+                        "device_id": _device_id_property("Lock device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -455,10 +464,7 @@ def get_lock_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Lock device ID",
-                        },
+                        "device_id": _device_id_property("Lock device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -480,10 +486,7 @@ def get_vacuum_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Vacuum device ID",
-                        },
+                        "device_id": _device_id_property("Vacuum device ID"),
                         "room_id": {
                             "type": "string",
                             "description": "Specific room to clean (optional)",
@@ -504,10 +507,7 @@ def get_vacuum_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Vacuum device ID",
-                        },
+                        "device_id": _device_id_property("Vacuum device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -523,10 +523,7 @@ def get_vacuum_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Vacuum device ID",
-                        },
+                        "device_id": _device_id_property("Vacuum device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -587,10 +584,7 @@ def get_scheduling_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Target device ID",
-                        },
+                        "device_id": _device_id_property("Target device ID"),
                         "action": {
                             "type": "string",
                             "enum": [
@@ -653,10 +647,7 @@ def get_scheduling_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Filter by device (optional)",
-                        },
+                        "device_id": _device_id_property("Filter by device (optional)"),
                         "include_completed": {
                             "type": "boolean",
                             "description": "Include completed actions",
@@ -737,10 +728,7 @@ def get_audit_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Device to get history for",
-                        },
+                        "device_id": _device_id_property("Device to get history for"),
                         "hours": {
                             "type": "integer",
                             "description": "Hours of history to retrieve",
@@ -804,10 +792,9 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID (e.g., 'living_room_appletv')",
-                        },
+                        "device_id": _device_id_property(
+                            "Media device ID (e.g., 'living_room_appletv')"
+                        ),
                     },
                     "required": ["device_id"],
                 },
@@ -823,10 +810,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -842,10 +826,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -861,10 +842,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -880,10 +858,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -899,10 +874,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -921,10 +893,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                         "app": {
                             "type": "string",
                             "description": "App name or ID (e.g., 'Netflix', 'Hulu', 'Disney+')",
@@ -945,10 +914,7 @@ def get_media_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Media device ID",
-                        },
+                        "device_id": _device_id_property("Media device ID"),
                     },
                     "required": ["device_id"],
                 },
@@ -1034,10 +1000,7 @@ def get_recommendation_tools() -> list[Tool]:
                 {
                     "type": "object",
                     "properties": {
-                        "device_id": {
-                            "type": "string",
-                            "description": "Filter by device (optional)",
-                        },
+                        "device_id": _device_id_property("Filter by device (optional)"),
                         "app": {
                             "type": "string",
                             "description": "Filter by app (e.g., 'Netflix', 'Hulu')",
@@ -1384,8 +1347,13 @@ def get_recommendation_tools() -> list[Tool]:
     ]
 
 
+@cache
 def get_all_tools() -> list[Tool]:
-    """Get all tool definitions."""
+    """Get all tool definitions.
+
+    The definitions are static, so the list is built once and shared between
+    callers, which must not mutate it.
+    """
     return (
         get_discovery_tools()
         + get_query_tools()
@@ -1401,6 +1369,46 @@ def get_all_tools() -> list[Tool]:
     )
 
 
+def compile_argument_validator(schema: dict) -> ArgumentValidator:
+    """Build a checker for the top-level required, type and enum rules of a schema.
+
+    Range limits are left to the handlers, which report them with
+    parameter-specific guidance.
+    """
+    required = tuple(schema.get("required", ()))
+    checks = []
+    for name, prop in schema.get("properties", {}).items():
+        types = _JSON_TYPES.get(prop.get("type", ""))
+        enum = frozenset(prop["enum"]) if "enum" in prop else None
+        if types is not None or enum is not None:
+            checks.append((name, prop.get("type"), types, enum))
+
+    def validate(args: dict[str, Any]) -> str | None:
+        for name in required:
+            if name not in args:
+                return f"missing required argument '{name}'"
+        for name, type_name, types, enum in checks:
+            value = args.get(name)
+            if value is None:
+                continue
+            # bool is an int subclass but never a valid JSON number
+            if types is not None and (
+                not isinstance(value, types) or (isinstance(value, bool) and bool not in types)
+            ):
+                return f"'{name}' must be of type {type_name}"
+            if enum is not None and value not in enum:
+                return f"'{name}' must be one of: {', '.join(sorted(map(str, enum)))}"
+        return None
+
+    return validate
+
+
+@cache
+def get_argument_validators() -> dict[str, ArgumentValidator]:
+    """Get an argument validator for each tool, compiled once from its schema."""
+    return {tool.name: compile_argument_validator(tool.inputSchema) for tool in get_all_tools()}
+
+
 def get_tool_metadata() -> dict:
     """Get metadata for Tool Search Tool compatibility.
 
@@ -1,12 +1,19 @@
 """Base device models for Burrow MCP."""
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 from typing import Any
 
 
+def monotonic_to_iso(timestamp: float) -> str:
+    """Convert a time.monotonic() reading to a local wall-clock ISO string."""
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - timestamp)).isoformat()
+
+
 class DeviceType(Enum):
     """Types of supported devices."""
 
@@ -27,7 +34,7 @@ class DeviceStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(ABC):
     """Base class for all devices.
 
@@ -35,6 +42,11 @@ class Device(ABC):
     - Common device attributes (id, name, type, status)
     - Operation lock for thread-safe state changes
     - Standard lifecycle methods (refresh, close, reconnect)
+
+    Device classes are slotted dataclasses. Subclasses, test doubles included,
+    must also use ``@dataclass(slots=True)``; a plain ``@dataclass`` subclass
+    cannot fill in ``init=False`` defaults. Zero-argument ``super()`` does not
+    work in slotted dataclasses before 3.14, so name the class explicitly.
     """
 
     id: str
@@ -6,7 +6,7 @@ from typing import Any
 from models.base import Device, DeviceType
 
 
-@dataclass
+@dataclass(slots=True)
 class Camera(Device):
     """Base class for camera devices."""
 
@@ -7,7 +7,7 @@ from typing import Any
 from models.base import Device, DeviceType
 
 
-@dataclass
+@dataclass(slots=True)
 class Light(Device):
     """Base class for light devices."""
 
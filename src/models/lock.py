@@ -2,13 +2,13 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from models.base import Device, DeviceType
 
 
-class LockState(Enum):
+class LockState(StrEnum):
     """Lock states."""
 
     LOCKED = "locked"
@@ -17,7 +17,7 @@ class LockState(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Lock(Device):
     """Base class for lock devices."""
 
@@ -38,6 +38,6 @@ class Lock(Device):
     def to_state_dict(self) -> dict[str, Any]:
         """Return current state as dict."""
         return {
-            "lock_state": self.lock_state.value,
+            "lock_state": self.lock_state,
             "battery_percent": self.battery_percent,
         }
@@ -2,13 +2,13 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from models.base import Device, DeviceType
 
 
-class PlaybackState(Enum):
+class PlaybackState(StrEnum):
     """Media playback states."""
 
     IDLE = "idle"
@@ -18,7 +18,7 @@ class PlaybackState(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True)
 class NowPlaying:
     """Information about currently playing content."""
 
@@ -51,7 +51,7 @@ class NowPlaying:
         }.items() if v is not None}
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaDevice(Device):
     """Base class for media devices (AppleTV, Roku, etc.).
 
@@ -107,7 +107,7 @@ class MediaDevice(Device):
     def to_state_dict(self) -> dict[str, Any]:
         """Return current state as dict for MCP responses."""
         state = {
-            "playback_state": self.playback_state.value,
+            "playback_state": self.playback_state,
             "current_app": self.current_app,
         }
 
@@ -171,14 +171,8 @@ STREAMING_SERVICES = {
 
 def normalize_app_name(app_id: str) -> str:
     """Normalize an app identifier to a friendly name."""
-    # Check our mapping first
-    if app_id in STREAMING_SERVICES:
-        return STREAMING_SERVICES[app_id]
-
-    # Try lowercase
-    lower = app_id.lower()
-    if lower in STREAMING_SERVICES:
-        return STREAMING_SERVICES[lower]
-
-    # Return as-is if not found
-    return app_id
+    # Check our mapping first, then try lowercase; return as-is if not found
+    name = STREAMING_SERVICES.get(app_id)
+    if name is None:
+        name = STREAMING_SERVICES.get(app_id.lower(), app_id)
+    return name
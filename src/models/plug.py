@@ -7,7 +7,7 @@ from typing import Any
 from models.base import Device, DeviceType
 
 
-@dataclass
+@dataclass(slots=True)
 class Plug(Device):
     """Base class for smart plug devices."""
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomPresence:
     """Presence information for a single room."""
 
@@ -24,7 +24,7 @@ class RoomPresence:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PresenceState:
     """Overall presence state for the house."""
 
@@ -44,10 +44,10 @@ class PresenceState:
         self, room_id: str, occupied: bool, sensor_id: str | None = None
     ) -> None:
         """Update presence for a room."""
-        if room_id not in self.room_states:
-            self.room_states[room_id] = RoomPresence(room_id=room_id)
+        room_presence = self.room_states.get(room_id)
+        if room_presence is None:
+            room_presence = self.room_states[room_id] = RoomPresence(room_id=room_id)
 
-        room_presence = self.room_states[room_id]
         if room_presence.occupied != occupied:
             room_presence.occupied = occupied
             room_presence.since = datetime.now()
@@ -1,11 +1,12 @@
 """Room model for Burrow MCP."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any
 
+from models.base import monotonic_to_iso
 
-@dataclass
+
+@dataclass(slots=True)
 class Room:
     """Represents a room in the house."""
 
@@ -14,7 +15,22 @@ class Room:
     floor: int | None = None  # 1, 2, etc.
     device_ids: list[str] = field(default_factory=list)
     occupied: bool = False
-    last_presence_change: datetime | None = None
+    # time.monotonic() of the last change; converted to wall time in to_dict
+    last_presence_change: float | None = None
+    # (last_presence_change, ISO string) from the previous to_dict call
+    _presence_iso: tuple[float, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _last_presence_iso(self) -> str | None:
+        """Wall-clock ISO time of the last presence change, formatted once per change."""
+        changed = self.last_presence_change
+        if changed is None:
+            return None
+        cached = self._presence_iso
+        if cached is None or cached[0] != changed:
+            cached = self._presence_iso = (changed, monotonic_to_iso(changed))
+        return cached[1]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -24,9 +40,7 @@ class Room:
             "floor": self.floor,
             "device_ids": self.device_ids,
             "occupied": self.occupied,
-            "last_presence_change": (
-                self.last_presence_change.isoformat() if self.last_presence_change else None
-            ),
+            "last_presence_change": self._last_presence_iso(),
         }
 
     def to_summary_dict(self, lights_on: int = 0, device_count: int | None = None) -> dict[str, Any]:
@@ -2,13 +2,13 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from models.base import Device, DeviceType
 
 
-class VacuumState(Enum):
+class VacuumState(StrEnum):
     """Vacuum states."""
 
     DOCKED = "docked"
@@ -19,7 +19,7 @@ class VacuumState(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Vacuum(Device):
     """Base class for vacuum devices."""
 
@@ -45,6 +45,6 @@ class Vacuum(Device):
     def to_state_dict(self) -> dict[str, Any]:
         """Return current state as dict."""
         return {
-            "vacuum_state": self.vacuum_state.value,
+            "vacuum_state": self.vacuum_state,
             "battery_percent": self.battery_percent,
         }
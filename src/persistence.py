@@ -1,20 +1,31 @@
 """State persistence for Burrow MCP using SQLite."""
 
 import asyncio
-import json
 import logging
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+from utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".local" / "share" / "burrow" / "state.db"
 
+# How long writes may sit in the open transaction before they are committed
+COMMIT_INTERVAL = 0.05
+
+# Longest wait between commit attempts while commits keep failing
+COMMIT_MAX_RETRY_DELAY = 5.0
+
+# Bytes of the database file SQLite may memory-map for reads
+MMAP_SIZE = 64 * 1024 * 1024
+
 
 class StateStore:
     """Persistent state storage using SQLite."""
@@ -22,7 +33,11 @@ class StateStore:
     def __init__(self, db_path: Path | str | None = None):
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self._db: aiosqlite.Connection | None = None
-        self._lock = asyncio.Lock()
+        # Orders writes against each other and the commit loop. Reads share the
+        # one connection and see pending writes, so they do not take it.
+        self._write_lock = asyncio.Lock()
+        self._dirty = asyncio.Event()
+        self._commit_task: asyncio.Task | None = None
 
     async def initialize(self) -> None:
         """Initialize the database and create tables."""
@@ -32,6 +47,12 @@ class StateStore:
         self._db = await aiosqlite.connect(str(self.db_path))
         self._db.row_factory = aiosqlite.Row
 
+        # WAL lets readers proceed during writes; NORMAL sync is durable in WAL mode
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.execute("PRAGMA temp_store=MEMORY")
+        await self._db.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
         # Create tables
         await self._db.execute("""
             CREATE TABLE IF NOT EXISTS device_state (
@@ -209,14 +230,47 @@ class StateStore:
         """)
 
         await self._db.commit()
+        self._commit_task = asyncio.create_task(self._commit_loop())
         logger.info(f"Initialized state database at {self.db_path}")
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Commit pending writes and close the database connection."""
+        if self._commit_task:
+            self._commit_task.cancel()
+            try:
+                await self._commit_task
+            except asyncio.CancelledError:
+                pass
+            self._commit_task = None
         if self._db:
+            await self.flush()
             await self._db.close()
             self._db = None
 
+    async def flush(self) -> None:
+        """Commit any writes still waiting for the commit loop."""
+        if not self._db:
+            return
+
+        async with self._write_lock:
+            if self._dirty.is_set():
+                await self._db.commit()
+                self._dirty.clear()
+
+    async def _commit_loop(self) -> None:
+        """Commit writes in batches instead of once per write."""
+        delay = COMMIT_INTERVAL
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(delay)
+            try:
+                await self.flush()
+            except Exception as e:
+                delay = min(delay * 2, COMMIT_MAX_RETRY_DELAY)
+                logger.error(f"Failed to commit state database, retrying in {delay}s: {e}")
+            else:
+                delay = COMMIT_INTERVAL
+
     # Device state methods
     async def save_device_state(
         self,
@@ -228,9 +282,9 @@ class StateStore:
         if not self._db:
             return
 
-        async with self._lock:
+        async with self._write_lock:
             now = datetime.utcnow().isoformat()
-            state_json = json.dumps(state)
+            state_json = dumps(state)
 
             await self._db.execute(
                 """
@@ -240,21 +294,50 @@ class StateStore:
                 """,
                 (device_id, device_type, state_json, now),
             )
-            await self._db.commit()
+            self._dirty.set()
+
+    async def save_device_states(
+        self, items: Iterable[tuple[str, str, dict[str, Any]]]
+    ) -> None:
+        """Save many device states in one statement.
+
+        Args:
+            items: (device_id, device_type, state) tuples
+        """
+        if not self._db:
+            return
+
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (device_id, device_type, dumps(state), now)
+            for device_id, device_type, state in items
+        ]
+        if not rows:
+            return
+
+        async with self._write_lock:
+            await self._db.executemany(
+                """
+                INSERT OR REPLACE INTO device_state
+                (device_id, device_type, state_json, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                rows,
+            )
+            self._dirty.set()
 
     async def load_device_state(self, device_id: str) -> dict[str, Any] | None:
         """Load device state from database."""
         if not self._db:
             return None
 
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT state_json FROM device_state WHERE device_id = ?",
-                (device_id,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return json.loads(row["state_json"])
+        async with self._db.execute(
+            "SELECT state_json FROM device_state WHERE device_id = ?",
+            (device_id,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            if row:
+                return loads(row["state_json"])
         return None
 
     async def load_all_device_states(self) -> dict[str, dict[str, Any]]:
@@ -263,12 +346,11 @@ class StateStore:
             return {}
 
         states = {}
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT device_id, state_json FROM device_state"
-            ) as cursor:
-                async for row in cursor:
-                    states[row["device_id"]] = json.loads(row["state_json"])
+        async with self._db.execute(
+            "SELECT device_id, state_json FROM device_state"
+        ) as cursor:
+            async for row in cursor:
+                states[row["device_id"]] = loads(row["state_json"])
         return states
 
     # Room state methods
@@ -277,7 +359,7 @@ class StateStore:
         if not self._db:
             return
 
-        async with self._lock:
+        async with self._write_lock:
             now = datetime.utcnow().isoformat()
             await self._db.execute(
                 """
@@ -287,21 +369,45 @@ class StateStore:
                 """,
                 (room_id, 1 if occupied else 0, now),
             )
-            await self._db.commit()
+            self._dirty.set()
+
+    async def save_room_states(self, items: Iterable[tuple[str, bool]]) -> None:
+        """Save many room occupancy states in one statement.
+
+        Args:
+            items: (room_id, occupied) tuples
+        """
+        if not self._db:
+            return
+
+        now = datetime.utcnow().isoformat()
+        rows = [(room_id, 1 if occupied else 0, now) for room_id, occupied in items]
+        if not rows:
+            return
+
+        async with self._write_lock:
+            await self._db.executemany(
+                """
+                INSERT OR REPLACE INTO room_state
+                (room_id, occupied, updated_at)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+            self._dirty.set()
 
     async def load_room_state(self, room_id: str) -> bool | None:
         """Load room occupancy state."""
         if not self._db:
             return None
 
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT occupied FROM room_state WHERE room_id = ?",
-                (room_id,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return bool(row["occupied"])
+        async with self._db.execute(
+            "SELECT occupied FROM room_state WHERE room_id = ?",
+            (room_id,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            if row:
+                return bool(row["occupied"])
         return None
 
     async def load_all_room_states(self) -> dict[str, bool]:
@@ -310,12 +416,11 @@ class StateStore:
             return {}
 
         states = {}
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT room_id, occupied FROM room_state"
-            ) as cursor:
-                async for row in cursor:
-                    states[row["room_id"]] = bool(row["occupied"])
+        async with self._db.execute(
+            "SELECT room_id, occupied FROM room_state"
+        ) as cursor:
+            async for row in cursor:
+                states[row["room_id"]] = bool(row["occupied"])
         return states
 
     # History methods
@@ -329,9 +434,9 @@ class StateStore:
         if not self._db:
             return
 
-        async with self._lock:
+        async with self._write_lock:
             now = datetime.utcnow().isoformat()
-            state_json = json.dumps(state) if state else None
+            state_json = dumps(state) if state else None
 
             await self._db.execute(
                 """
@@ -341,7 +446,7 @@ class StateStore:
                 """,
                 (device_id, event_type, state_json, now),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def get_device_history(
         self,
@@ -353,38 +458,37 @@ class StateStore:
         if not self._db:
             return []
 
-        async with self._lock:
-            if event_type:
-                query = """
-                    SELECT event_type, state_json, timestamp
-                    FROM device_history
-                    WHERE device_id = ? AND event_type = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """
-                params = (device_id, event_type, limit)
-            else:
-                query = """
-                    SELECT event_type, state_json, timestamp
-                    FROM device_history
-                    WHERE device_id = ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """
-                params = (device_id, limit)
+        if event_type:
+            query = """
+                SELECT event_type, state_json, timestamp
+                FROM device_history
+                WHERE device_id = ? AND event_type = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """
+            params = (device_id, event_type, limit)
+        else:
+            query = """
+                SELECT event_type, state_json, timestamp
+                FROM device_history
+                WHERE device_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """
+            params = (device_id, limit)
 
-            history = []
-            async with self._db.execute(query, params) as cursor:
-                async for row in cursor:
-                    event = {
-                        "event_type": row["event_type"],
-                        "timestamp": row["timestamp"],
-                    }
-                    if row["state_json"]:
-                        event["state"] = json.loads(row["state_json"])
-                    history.append(event)
+        history = []
+        async with self._db.execute(query, params) as cursor:
+            async for row in cursor:
+                event = {
+                    "event_type": row["event_type"],
+                    "timestamp": row["timestamp"],
+                }
+                if row["state_json"]:
+                    event["state"] = loads(row["state_json"])
+                history.append(event)
 
-            return history
+        return history
 
     async def record_presence_event(
         self,
@@ -396,7 +500,7 @@ class StateStore:
         if not self._db:
             return
 
-        async with self._lock:
+        async with self._write_lock:
             now = datetime.utcnow().isoformat()
 
             await self._db.execute(
@@ -407,7 +511,7 @@ class StateStore:
                 """,
                 (room_id, 1 if occupied else 0, confidence, now),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def get_presence_history(
         self,
@@ -418,25 +522,24 @@ class StateStore:
         if not self._db:
             return []
 
-        async with self._lock:
-            history = []
-            async with self._db.execute(
-                """
-                SELECT occupied, confidence, timestamp
-                FROM presence_events
-                WHERE room_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (room_id, limit),
-            ) as cursor:
-                async for row in cursor:
-                    history.append({
-                        "occupied": bool(row["occupied"]),
-                        "confidence": row["confidence"],
-                        "timestamp": row["timestamp"],
-                    })
-            return history
+        history = []
+        async with self._db.execute(
+            """
+            SELECT occupied, confidence, timestamp
+            FROM presence_events
+            WHERE room_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (room_id, limit),
+        ) as cursor:
+            async for row in cursor:
+                history.append({
+                    "occupied": bool(row["occupied"]),
+                    "confidence": row["confidence"],
+                    "timestamp": row["timestamp"],
+                })
+        return history
 
     # Scheduled actions methods
     async def create_scheduled_action(
@@ -469,7 +572,7 @@ class StateStore:
         schedule_id = str(uuid.uuid4())[:12]
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 INSERT INTO scheduled_actions
@@ -481,15 +584,15 @@ class StateStore:
                     schedule_id,
                     device_id,
                     action,
-                    json.dumps(action_params) if action_params else None,
+                    dumps(action_params) if action_params else None,
                     execute_at.isoformat(),
                     now,
-                    json.dumps(recurrence) if recurrence else None,
+                    dumps(recurrence) if recurrence else None,
                     created_by,
                     description,
                 ),
             )
-            await self._db.commit()
+            self._dirty.set()
 
         logger.info(f"Created scheduled action {schedule_id}: {action} on {device_id}")
         return schedule_id
@@ -499,14 +602,13 @@ class StateStore:
         if not self._db:
             return None
 
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT * FROM scheduled_actions WHERE id = ?",
-                (schedule_id,),
-            ) as cursor:
-                row = await cursor.fetchone()
-                if row:
-                    return self._row_to_schedule(row)
+        async with self._db.execute(
+            "SELECT * FROM scheduled_actions WHERE id = ?",
+            (schedule_id,),
+        ) as cursor:
+            row = await cursor.fetchone()
+            if row:
+                return self._row_to_schedule(row)
         return None
 
     async def get_due_actions(self) -> list[dict[str, Any]]:
@@ -517,17 +619,16 @@ class StateStore:
         now = datetime.utcnow().isoformat()
         actions = []
 
-        async with self._lock:
-            async with self._db.execute(
-                """
-                SELECT * FROM scheduled_actions
-                WHERE execute_at <= ? AND status = 'pending'
-                ORDER BY execute_at
-                """,
-                (now,),
-            ) as cursor:
-                async for row in cursor:
-                    actions.append(self._row_to_schedule(row))
+        async with self._db.execute(
+            """
+            SELECT * FROM scheduled_actions
+            WHERE execute_at <= ? AND status = 'pending'
+            ORDER BY execute_at
+            """,
+            (now,),
+        ) as cursor:
+            async for row in cursor:
+                actions.append(self._row_to_schedule(row))
 
         return actions
 
@@ -541,17 +642,16 @@ class StateStore:
         now = datetime.utcnow().isoformat()
         actions = []
 
-        async with self._lock:
-            async with self._db.execute(
-                """
-                SELECT * FROM scheduled_actions
-                WHERE device_id = ? AND status = 'pending' AND execute_at > ?
-                ORDER BY execute_at
-                """,
-                (device_id, now),
-            ) as cursor:
-                async for row in cursor:
-                    actions.append(self._row_to_schedule(row))
+        async with self._db.execute(
+            """
+            SELECT * FROM scheduled_actions
+            WHERE device_id = ? AND status = 'pending' AND execute_at > ?
+            ORDER BY execute_at
+            """,
+            (device_id, now),
+        ) as cursor:
+            async for row in cursor:
+                actions.append(self._row_to_schedule(row))
 
         return actions
 
@@ -564,25 +664,24 @@ class StateStore:
 
         actions = []
 
-        async with self._lock:
-            if device_id:
-                query = """
-                    SELECT * FROM scheduled_actions
-                    WHERE status = 'pending' AND device_id = ?
-                    ORDER BY execute_at
-                """
-                params = (device_id,)
-            else:
-                query = """
-                    SELECT * FROM scheduled_actions
-                    WHERE status = 'pending'
-                    ORDER BY execute_at
-                """
-                params = ()
+        if device_id:
+            query = """
+                SELECT * FROM scheduled_actions
+                WHERE status = 'pending' AND device_id = ?
+                ORDER BY execute_at
+            """
+            params = (device_id,)
+        else:
+            query = """
+                SELECT * FROM scheduled_actions
+                WHERE status = 'pending'
+                ORDER BY execute_at
+            """
+            params = ()
 
-            async with self._db.execute(query, params) as cursor:
-                async for row in cursor:
-                    actions.append(self._row_to_schedule(row))
+        async with self._db.execute(query, params) as cursor:
+            async for row in cursor:
+                actions.append(self._row_to_schedule(row))
 
         return actions
 
@@ -599,7 +698,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             if next_execute_at:
                 # Recurring: update next execution time
                 await self._db.execute(
@@ -620,14 +719,14 @@ class StateStore:
                     """,
                     (now, schedule_id),
                 )
-            await self._db.commit()
+            self._dirty.set()
 
     async def mark_action_failed(self, schedule_id: str, error: str) -> None:
         """Mark an action as failed."""
         if not self._db:
             return
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 UPDATE scheduled_actions
@@ -636,14 +735,14 @@ class StateStore:
                 """,
                 (schedule_id,),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def cancel_scheduled_action(self, schedule_id: str) -> bool:
         """Cancel a scheduled action."""
         if not self._db:
             return False
 
-        async with self._lock:
+        async with self._write_lock:
             cursor = await self._db.execute(
                 """
                 UPDATE scheduled_actions
@@ -652,7 +751,7 @@ class StateStore:
                 """,
                 (schedule_id,),
             )
-            await self._db.commit()
+            self._dirty.set()
             return cursor.rowcount > 0
 
     async def update_scheduled_action(
@@ -674,14 +773,14 @@ class StateStore:
 
         if recurrence is not None:
             updates.append("recurrence = ?")
-            params.append(json.dumps(recurrence) if recurrence else None)
+            params.append(dumps(recurrence) if recurrence else None)
 
         if not updates:
             return False
 
         params.append(schedule_id)
 
-        async with self._lock:
+        async with self._write_lock:
             cursor = await self._db.execute(
                 f"""
                 UPDATE scheduled_actions
@@ -690,7 +789,7 @@ class StateStore:
                 """,
                 params,
             )
-            await self._db.commit()
+            self._dirty.set()
             return cursor.rowcount > 0
 
     def _row_to_schedule(self, row: aiosqlite.Row) -> dict[str, Any]:
@@ -705,10 +804,10 @@ class StateStore:
         }
 
         if row["action_params"]:
-            schedule["action_params"] = json.loads(row["action_params"])
+            schedule["action_params"] = loads(row["action_params"])
 
         if row["recurrence"]:
-            schedule["recurrence"] = json.loads(row["recurrence"])
+            schedule["recurrence"] = loads(row["recurrence"])
 
         if row["last_executed_at"]:
             schedule["last_executed_at"] = row["last_executed_at"]
@@ -754,7 +853,7 @@ class StateStore:
         entry_id = str(uuid.uuid4())[:12]
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 INSERT INTO audit_log
@@ -769,13 +868,13 @@ class StateStore:
                     device_id,
                     source,
                     action,
-                    json.dumps(previous_state) if previous_state else None,
-                    json.dumps(new_state) if new_state else None,
+                    dumps(previous_state) if previous_state else None,
+                    dumps(new_state) if new_state else None,
                     schedule_id,
-                    json.dumps(metadata) if metadata else None,
+                    dumps(metadata) if metadata else None,
                 ),
             )
-            await self._db.commit()
+            self._dirty.set()
 
         return entry_id
 
@@ -816,39 +915,38 @@ class StateStore:
         params.append(limit)
 
         entries = []
-        async with self._lock:
-            async with self._db.execute(
-                f"""
-                SELECT * FROM audit_log
-                WHERE {' AND '.join(conditions)}
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                params,
-            ) as cursor:
-                async for row in cursor:
-                    entry = {
-                        "id": row["id"],
-                        "timestamp": row["timestamp"],
-                        "event_type": row["event_type"],
-                    }
-
-                    if row["device_id"]:
-                        entry["device_id"] = row["device_id"]
-                    if row["source"]:
-                        entry["source"] = row["source"]
-                    if row["action"]:
-                        entry["action"] = row["action"]
-                    if row["previous_state"]:
-                        entry["previous_state"] = json.loads(row["previous_state"])
-                    if row["new_state"]:
-                        entry["new_state"] = json.loads(row["new_state"])
-                    if row["schedule_id"]:
-                        entry["schedule_id"] = row["schedule_id"]
-                    if row["metadata"]:
-                        entry["metadata"] = json.loads(row["metadata"])
-
-                    entries.append(entry)
+        async with self._db.execute(
+            f"""
+            SELECT * FROM audit_log
+            WHERE {' AND '.join(conditions)}
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            params,
+        ) as cursor:
+            async for row in cursor:
+                entry = {
+                    "id": row["id"],
+                    "timestamp": row["timestamp"],
+                    "event_type": row["event_type"],
+                }
+
+                if row["device_id"]:
+                    entry["device_id"] = row["device_id"]
+                if row["source"]:
+                    entry["source"] = row["source"]
+                if row["action"]:
+                    entry["action"] = row["action"]
+                if row["previous_state"]:
+                    entry["previous_state"] = loads(row["previous_state"])
+                if row["new_state"]:
+                    entry["new_state"] = loads(row["new_state"])
+                if row["schedule_id"]:
+                    entry["schedule_id"] = row["schedule_id"]
+                if row["metadata"]:
+                    entry["metadata"] = loads(row["metadata"])
+
+                entries.append(entry)
 
         return entries
 
@@ -882,7 +980,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             cursor = await self._db.execute(
                 """
                 INSERT INTO viewing_history
@@ -903,7 +1001,7 @@ class StateStore:
                     now,
                 ),
             )
-            await self._db.commit()
+            self._dirty.set()
             return cursor.lastrowid or 0
 
     async def update_viewing_session(
@@ -918,7 +1016,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 UPDATE viewing_history
@@ -927,7 +1025,7 @@ class StateStore:
                 """,
                 (now, watched_duration, 1 if completed else 0, session_id),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def get_viewing_history(
         self,
@@ -956,45 +1054,44 @@ class StateStore:
         params.append(limit)
 
         history = []
-        async with self._lock:
-            async with self._db.execute(
-                f"""
-                SELECT * FROM viewing_history
-                WHERE {' AND '.join(conditions)}
-                ORDER BY started_at DESC
-                LIMIT ?
-                """,
-                params,
-            ) as cursor:
-                async for row in cursor:
-                    entry = {
-                        "id": row["id"],
-                        "device_id": row["device_id"],
-                        "app": row["app"],
-                        "started_at": row["started_at"],
-                    }
-
-                    if row["title"]:
-                        entry["title"] = row["title"]
-                    if row["series_name"]:
-                        entry["series_name"] = row["series_name"]
-                    if row["season"]:
-                        entry["season"] = row["season"]
-                    if row["episode"]:
-                        entry["episode"] = row["episode"]
-                    if row["media_type"]:
-                        entry["media_type"] = row["media_type"]
-                    if row["genre"]:
-                        entry["genre"] = row["genre"]
-                    if row["duration"]:
-                        entry["duration"] = row["duration"]
-                    if row["watched_duration"]:
-                        entry["watched_duration"] = row["watched_duration"]
-                    if row["ended_at"]:
-                        entry["ended_at"] = row["ended_at"]
-                    entry["completed"] = bool(row["completed"])
-
-                    history.append(entry)
+        async with self._db.execute(
+            f"""
+            SELECT * FROM viewing_history
+            WHERE {' AND '.join(conditions)}
+            ORDER BY started_at DESC
+            LIMIT ?
+            """,
+            params,
+        ) as cursor:
+            async for row in cursor:
+                entry = {
+                    "id": row["id"],
+                    "device_id": row["device_id"],
+                    "app": row["app"],
+                    "started_at": row["started_at"],
+                }
+
+                if row["title"]:
+                    entry["title"] = row["title"]
+                if row["series_name"]:
+                    entry["series_name"] = row["series_name"]
+                if row["season"]:
+                    entry["season"] = row["season"]
+                if row["episode"]:
+                    entry["episode"] = row["episode"]
+                if row["media_type"]:
+                    entry["media_type"] = row["media_type"]
+                if row["genre"]:
+                    entry["genre"] = row["genre"]
+                if row["duration"]:
+                    entry["duration"] = row["duration"]
+                if row["watched_duration"]:
+                    entry["watched_duration"] = row["watched_duration"]
+                if row["ended_at"]:
+                    entry["ended_at"] = row["ended_at"]
+                entry["completed"] = bool(row["completed"])
+
+                history.append(entry)
 
         return history
 
@@ -1015,53 +1112,52 @@ class StateStore:
             "total_watch_time": 0,
         }
 
-        async with self._lock:
-            # Count by app
-            async with self._db.execute(
-                """
-                SELECT app, COUNT(*) as count, SUM(watched_duration) as total_time
-                FROM viewing_history
-                WHERE started_at >= ?
-                GROUP BY app
-                ORDER BY count DESC
-                """,
-                (cutoff,),
-            ) as cursor:
-                async for row in cursor:
-                    stats["by_app"][row["app"]] = {
-                        "count": row["count"],
-                        "total_time": row["total_time"] or 0,
-                    }
-                    stats["total_sessions"] += row["count"]
-                    stats["total_watch_time"] += row["total_time"] or 0
-
-            # Count by genre
-            async with self._db.execute(
-                """
-                SELECT genre, COUNT(*) as count
-                FROM viewing_history
-                WHERE started_at >= ? AND genre IS NOT NULL
-                GROUP BY genre
-                ORDER BY count DESC
-                """,
-                (cutoff,),
-            ) as cursor:
-                async for row in cursor:
-                    stats["by_genre"][row["genre"]] = row["count"]
-
-            # Count by media type
-            async with self._db.execute(
-                """
-                SELECT media_type, COUNT(*) as count
-                FROM viewing_history
-                WHERE started_at >= ? AND media_type IS NOT NULL
-                GROUP BY media_type
-                ORDER BY count DESC
-                """,
-                (cutoff,),
-            ) as cursor:
-                async for row in cursor:
-                    stats["by_media_type"][row["media_type"]] = row["count"]
+        # Count by app
+        async with self._db.execute(
+            """
+            SELECT app, COUNT(*) as count, SUM(watched_duration) as total_time
+            FROM viewing_history
+            WHERE started_at >= ?
+            GROUP BY app
+            ORDER BY count DESC
+            """,
+            (cutoff,),
+        ) as cursor:
+            async for row in cursor:
+                stats["by_app"][row["app"]] = {
+                    "count": row["count"],
+                    "total_time": row["total_time"] or 0,
+                }
+                stats["total_sessions"] += row["count"]
+                stats["total_watch_time"] += row["total_time"] or 0
+
+        # Count by genre
+        async with self._db.execute(
+            """
+            SELECT genre, COUNT(*) as count
+            FROM viewing_history
+            WHERE started_at >= ? AND genre IS NOT NULL
+            GROUP BY genre
+            ORDER BY count DESC
+            """,
+            (cutoff,),
+        ) as cursor:
+            async for row in cursor:
+                stats["by_genre"][row["genre"]] = row["count"]
+
+        # Count by media type
+        async with self._db.execute(
+            """
+            SELECT media_type, COUNT(*) as count
+            FROM viewing_history
+            WHERE started_at >= ? AND media_type IS NOT NULL
+            GROUP BY media_type
+            ORDER BY count DESC
+            """,
+            (cutoff,),
+        ) as cursor:
+            async for row in cursor:
+                stats["by_media_type"][row["media_type"]] = row["count"]
 
         return stats
 
@@ -1078,90 +1174,88 @@ class StateStore:
             return []
 
         items = []
-        async with self._lock:
-            if unique_titles:
-                # Get unique titles by most recent viewing
-                async with self._db.execute(
-                    """
-                    SELECT app, title, series_name, season, episode, media_type, genre,
-                           MAX(started_at) as last_watched, COUNT(*) as watch_count
-                    FROM viewing_history
-                    WHERE title IS NOT NULL
-                    GROUP BY COALESCE(series_name, title)
-                    ORDER BY last_watched DESC
-                    LIMIT ?
-                    """,
-                    (limit,),
-                ) as cursor:
-                    async for row in cursor:
-                        item = {
-                            "app": row["app"],
-                            "last_watched": row["last_watched"],
-                            "watch_count": row["watch_count"],
-                        }
-                        if row["title"]:
-                            item["title"] = row["title"]
-                        if row["series_name"]:
-                            item["series_name"] = row["series_name"]
-                        if row["season"]:
-                            item["season"] = row["season"]
-                        if row["episode"]:
-                            item["episode"] = row["episode"]
-                        if row["media_type"]:
-                            item["media_type"] = row["media_type"]
-                        if row["genre"]:
-                            item["genre"] = row["genre"]
-
-                        items.append(item)
-            else:
-                # Get all recent viewing
-                history = await self.get_viewing_history(limit=limit)
-                items = history
-
-        return items
-
-    async def get_frequently_watched(
-        self, days: int = 90, limit: int = 10
-    ) -> list[dict[str, Any]]:
-        """Get most frequently watched shows/content."""
-        if not self._db:
-            return []
-
-        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-        items = []
-        async with self._lock:
+        if unique_titles:
+            # Get unique titles by most recent viewing
             async with self._db.execute(
                 """
-                SELECT app, title, series_name, media_type, genre,
-                       COUNT(*) as watch_count,
-                       SUM(watched_duration) as total_time,
-                       MAX(started_at) as last_watched
+                SELECT app, title, series_name, season, episode, media_type, genre,
+                       MAX(started_at) as last_watched, COUNT(*) as watch_count
                 FROM viewing_history
-                WHERE started_at >= ? AND title IS NOT NULL
+                WHERE title IS NOT NULL
                 GROUP BY COALESCE(series_name, title)
-                ORDER BY watch_count DESC, last_watched DESC
+                ORDER BY last_watched DESC
                 LIMIT ?
                 """,
-                (cutoff, limit),
+                (limit,),
             ) as cursor:
                 async for row in cursor:
                     item = {
                         "app": row["app"],
-                        "watch_count": row["watch_count"],
-                        "total_time": row["total_time"] or 0,
                         "last_watched": row["last_watched"],
+                        "watch_count": row["watch_count"],
                     }
                     if row["title"]:
                         item["title"] = row["title"]
                     if row["series_name"]:
                         item["series_name"] = row["series_name"]
+                    if row["season"]:
+                        item["season"] = row["season"]
+                    if row["episode"]:
+                        item["episode"] = row["episode"]
                     if row["media_type"]:
                         item["media_type"] = row["media_type"]
                     if row["genre"]:
                         item["genre"] = row["genre"]
 
                     items.append(item)
+        else:
+            # Get all recent viewing
+            history = await self.get_viewing_history(limit=limit)
+            items = history
+
+        return items
+
+    async def get_frequently_watched(
+        self, days: int = 90, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Get most frequently watched shows/content."""
+        if not self._db:
+            return []
+
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+        items = []
+        async with self._db.execute(
+            """
+            SELECT app, title, series_name, media_type, genre,
+                   COUNT(*) as watch_count,
+                   SUM(watched_duration) as total_time,
+                   MAX(started_at) as last_watched
+            FROM viewing_history
+            WHERE started_at >= ? AND title IS NOT NULL
+            GROUP BY COALESCE(series_name, title)
+            ORDER BY watch_count DESC, last_watched DESC
+            LIMIT ?
+            """,
+            (cutoff, limit),
+        ) as cursor:
+            async for row in cursor:
+                item = {
+                    "app": row["app"],
+                    "watch_count": row["watch_count"],
+                    "total_time": row["total_time"] or 0,
+                    "last_watched": row["last_watched"],
+                }
+                if row["title"]:
+                    item["title"] = row["title"]
+                if row["series_name"]:
+                    item["series_name"] = row["series_name"]
+                if row["media_type"]:
+                    item["media_type"] = row["media_type"]
+                if row["genre"]:
+                    item["genre"] = row["genre"]
+
+                items.append(item)
 
         return items
 
@@ -1183,7 +1277,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 INSERT INTO content_preferences
@@ -1208,7 +1302,7 @@ class StateStore:
                     now,
                 ),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def get_content_preferences(
         self, liked_only: bool = False
@@ -1218,29 +1312,28 @@ class StateStore:
             return []
 
         prefs = []
-        async with self._lock:
-            query = "SELECT * FROM content_preferences"
-            if liked_only:
-                query += " WHERE liked = 1"
-            query += " ORDER BY updated_at DESC"
-
-            async with self._db.execute(query) as cursor:
-                async for row in cursor:
-                    pref = {}
-                    if row["title"]:
-                        pref["title"] = row["title"]
-                    if row["series_name"]:
-                        pref["series_name"] = row["series_name"]
-                    if row["app"]:
-                        pref["app"] = row["app"]
-                    if row["genre"]:
-                        pref["genre"] = row["genre"]
-                    if row["rating"]:
-                        pref["rating"] = row["rating"]
-                    if row["liked"] is not None:
-                        pref["liked"] = bool(row["liked"])
-                    pref["updated_at"] = row["updated_at"]
-                    prefs.append(pref)
+        query = "SELECT * FROM content_preferences"
+        if liked_only:
+            query += " WHERE liked = 1"
+        query += " ORDER BY updated_at DESC"
+
+        async with self._db.execute(query) as cursor:
+            async for row in cursor:
+                pref = {}
+                if row["title"]:
+                    pref["title"] = row["title"]
+                if row["series_name"]:
+                    pref["series_name"] = row["series_name"]
+                if row["app"]:
+                    pref["app"] = row["app"]
+                if row["genre"]:
+                    pref["genre"] = row["genre"]
+                if row["rating"]:
+                    pref["rating"] = row["rating"]
+                if row["liked"] is not None:
+                    pref["liked"] = bool(row["liked"])
+                pref["updated_at"] = row["updated_at"]
+                prefs.append(pref)
 
         return prefs
 
@@ -1260,7 +1353,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 INSERT INTO followed_shows
@@ -1292,19 +1385,19 @@ class StateStore:
                     now,
                 ),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def unfollow_show(self, series_name: str) -> bool:
         """Stop following a show."""
         if not self._db:
             return False
 
-        async with self._lock:
+        async with self._write_lock:
             cursor = await self._db.execute(
                 "DELETE FROM followed_shows WHERE series_name = ?",
                 (series_name,),
             )
-            await self._db.commit()
+            self._dirty.set()
             return cursor.rowcount > 0
 
     async def get_followed_shows(self) -> list[dict[str, Any]]:
@@ -1313,26 +1406,25 @@ class StateStore:
             return []
 
         shows = []
-        async with self._lock:
-            async with self._db.execute(
-                "SELECT * FROM followed_shows ORDER BY updated_at DESC"
-            ) as cursor:
-                async for row in cursor:
-                    show = {
-                        "series_name": row["series_name"],
-                        "added_at": row["added_at"],
-                    }
-                    if row["tmdb_id"]:
-                        show["tmdb_id"] = row["tmdb_id"]
-                    if row["app"]:
-                        show["app"] = row["app"]
-                    if row["status"]:
-                        show["status"] = row["status"]
-                    if row["last_watched_season"]:
-                        show["last_watched_season"] = row["last_watched_season"]
-                    if row["last_watched_episode"]:
-                        show["last_watched_episode"] = row["last_watched_episode"]
-                    shows.append(show)
+        async with self._db.execute(
+            "SELECT * FROM followed_shows ORDER BY updated_at DESC"
+        ) as cursor:
+            async for row in cursor:
+                show = {
+                    "series_name": row["series_name"],
+                    "added_at": row["added_at"],
+                }
+                if row["tmdb_id"]:
+                    show["tmdb_id"] = row["tmdb_id"]
+                if row["app"]:
+                    show["app"] = row["app"]
+                if row["status"]:
+                    show["status"] = row["status"]
+                if row["last_watched_season"]:
+                    show["last_watched_season"] = row["last_watched_season"]
+                if row["last_watched_episode"]:
+                    show["last_watched_episode"] = row["last_watched_episode"]
+                shows.append(show)
 
         return shows
 
@@ -1345,7 +1437,7 @@ class StateStore:
 
         now = datetime.utcnow().isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             await self._db.execute(
                 """
                 UPDATE followed_shows
@@ -1354,7 +1446,7 @@ class StateStore:
                 """,
                 (season, episode, now, series_name),
             )
-            await self._db.commit()
+            self._dirty.set()
 
     async def seed_favorites(
         self, shows: list[dict[str, Any]]
@@ -1412,7 +1504,7 @@ class StateStore:
 
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
 
-        async with self._lock:
+        async with self._write_lock:
             cursor = await self._db.execute(
                 "DELETE FROM device_history WHERE timestamp < ?",
                 (cutoff,),
@@ -1451,7 +1543,7 @@ class StateStore:
             )
             viewing_deleted = cursor.rowcount
 
-            await self._db.commit()
+            self._dirty.set()
 
             total = device_deleted + presence_deleted + audit_deleted + schedules_deleted + viewing_deleted
             if total > 0:
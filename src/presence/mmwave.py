@@ -2,17 +2,33 @@
 
 import asyncio
 import logging
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any, Callable
 
 from config import SecretsConfig
+from models.base import monotonic_to_iso
 from models.presence import PresenceState
 
 logger = logging.getLogger(__name__)
 
+# Seconds to collect sensor changes before notifying, so flapping readings and
+# several sensors in one room produce a single callback with the final state
+PRESENCE_COALESCE_WINDOW = 0.05
 
-@dataclass
+# Raw payloads, after stripping and lowercasing, that report someone present
+_OCCUPIED_PAYLOADS = frozenset((b"on", b"true", b"1", b"occupied", b"detected"))
+
+# Lowercase ASCII and drop whitespace in one bytes.translate pass
+_LOWER_ASCII = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+_PAYLOAD_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+# Most distinct message topics remembered by the topic-to-sensor lookup
+TOPIC_MATCH_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True)
 class MmWaveSensor:
     """Represents an mmWave presence sensor."""
 
@@ -20,7 +36,18 @@ class MmWaveSensor:
     room_id: str
     mqtt_topic: str
     occupied: bool = False
-    last_update: datetime | None = None
+    last_update: float | None = None  # time.monotonic()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        last_update = self.last_update
+        return {
+            "id": self.id,
+            "room_id": self.room_id,
+            "mqtt_topic": self.mqtt_topic,
+            "occupied": self.occupied,
+            "last_update": monotonic_to_iso(last_update) if last_update is not None else None,
+        }
 
 
 @dataclass
@@ -36,15 +63,62 @@ class PresenceManager:
     _client: Any = field(default=None, repr=False)
     _task: asyncio.Task[Any] | None = field(default=None, repr=False)
     _on_presence_change: Callable[[str, bool], None] | None = None
+    coalesce_window: float = PRESENCE_COALESCE_WINDOW
+    # Rooms with sensor changes awaiting the next flush, in arrival order
+    _pending_rooms: dict[str, None] = field(default_factory=dict, repr=False)
+    _flush_handle: asyncio.TimerHandle | None = field(default=None, repr=False)
+    # Last occupancy passed to the callback, per room
+    _notified: dict[str, bool] = field(default_factory=dict, repr=False)
+    # Lookups for the per-message path, rebuilt whenever a sensor is added
+    _sensors_by_topic: dict[str, MmWaveSensor] = field(default_factory=dict, repr=False)
+    _sensors_by_room: dict[str, list[MmWaveSensor]] = field(default_factory=dict, repr=False)
+    # Resolved sensor per full message topic; sensors publish a fixed set of subtopics
+    _topic_matches: dict[str, MmWaveSensor | None] = field(default_factory=dict, repr=False)
 
     def add_sensor(self, sensor_id: str, room_id: str, mqtt_topic: str) -> None:
         """Add a sensor to monitor."""
-        self._sensors[sensor_id] = MmWaveSensor(
-            id=sensor_id,
-            room_id=room_id,
-            mqtt_topic=mqtt_topic,
-        )
-        logger.info(f"Added mmWave sensor {sensor_id} for room {room_id}")
+        self.add_sensors([(sensor_id, room_id, mqtt_topic)])
+
+    def _index_sensors(self) -> None:
+        """Rebuild the topic and room lookups from the sensor list."""
+        self._sensors_by_topic = {}
+        self._sensors_by_room = {}
+        self._topic_matches = {}
+        for sensor in self._sensors.values():
+            self._sensors_by_topic.setdefault(sensor.mqtt_topic, sensor)
+            self._sensors_by_room.setdefault(sensor.room_id, []).append(sensor)
+
+    def _find_sensor(self, topic: str) -> MmWaveSensor | None:
+        """Find the sensor for a topic, matching its longest subscribed prefix."""
+        try:
+            return self._topic_matches[topic]
+        except KeyError:
+            pass
+        prefix = topic
+        while True:
+            sensor = self._sensors_by_topic.get(prefix)
+            if sensor is not None or "/" not in prefix:
+                break
+            prefix = prefix.rsplit("/", 1)[0]
+        if len(self._topic_matches) >= TOPIC_MATCH_CACHE_SIZE:
+            self._topic_matches.clear()
+        self._topic_matches[topic] = sensor
+        return sensor
+
+    def add_sensors(self, sensors: Iterable[tuple[str, str, str]]) -> None:
+        """Add several sensors given as (sensor_id, room_id, mqtt_topic) tuples.
+
+        Lookups are rebuilt once for the whole batch; the MQTT loop subscribes
+        to every sensor topic in a single request.
+        """
+        for sensor_id, room_id, mqtt_topic in sensors:
+            self._sensors[sensor_id] = MmWaveSensor(
+                id=sensor_id,
+                room_id=room_id,
+                mqtt_topic=mqtt_topic,
+            )
+            logger.info(f"Added mmWave sensor {sensor_id} for room {room_id}")
+        self._index_sensors()
 
     def set_presence_callback(self, callback: Callable[[str, bool], None]) -> None:
         """Set callback to be called when presence changes.
@@ -77,6 +151,9 @@ class PresenceManager:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_presence()
         logger.info("Stopped MQTT presence listener")
 
     async def _mqtt_loop(self) -> None:
@@ -91,13 +168,16 @@ class PresenceManager:
                     username=self.mqtt_username,
                     password=self.mqtt_password,
                 ) as client:
-                    for sensor in self._sensors.values():
-                        await client.subscribe(f"{sensor.mqtt_topic}/#")
-                        await client.subscribe(sensor.mqtt_topic)
-                        logger.info(f"Subscribed to {sensor.mqtt_topic}")
+                    # One SUBSCRIBE packet for every sensor, with shared topics
+                    # listed once
+                    topics = sorted({sensor.mqtt_topic for sensor in self._sensors.values()})
+                    await client.subscribe(
+                        [(f"{topic}/#", 0) for topic in topics] + [(topic, 0) for topic in topics]
+                    )
+                    logger.info(f"Subscribed to {', '.join(topics)}")
 
                     async for message in client.messages:
-                        await self._handle_message(str(message.topic), message.payload)
+                        self._handle_message(str(message.topic), message.payload)
 
             except asyncio.CancelledError:
                 raise
@@ -105,34 +185,48 @@ class PresenceManager:
                 logger.error(f"MQTT connection error: {e}")
                 await asyncio.sleep(5)
 
-    async def _handle_message(self, topic: str, payload: bytes) -> None:
-        """Handle incoming MQTT message."""
-        sensor = None
-        for s in self._sensors.values():
-            if topic.startswith(s.mqtt_topic):
-                sensor = s
-                break
+    def _handle_message(self, topic: str, payload: bytes) -> None:
+        """Handle incoming MQTT message.
 
+        Runs synchronously; callbacks are deferred to the coalesced flush.
+        """
+        sensor = self._find_sensor(topic)
         if sensor is None:
             return
 
-        try:
-            payload_str = payload.decode("utf-8").strip().lower()
-            occupied = payload_str in ("on", "true", "1", "occupied", "detected")
-        except Exception as e:
-            logger.warning(f"Failed to parse presence payload: {e}")
-            return
+        if not isinstance(payload, bytes):
+            if not isinstance(payload, bytearray):
+                logger.warning("Ignoring non-binary presence payload on %s", topic)
+                return
+            payload = bytes(payload)
+        occupied = payload.translate(_LOWER_ASCII, _PAYLOAD_WHITESPACE) in _OCCUPIED_PAYLOADS
 
         old_occupied = sensor.occupied
         sensor.occupied = occupied
-        sensor.last_update = datetime.now()
+        sensor.last_update = time.monotonic()
 
         self._state.set_room_presence(sensor.room_id, occupied, sensor.id)
 
         if occupied != old_occupied and self._on_presence_change:
-            self._on_presence_change(sensor.room_id, occupied)
-
-        logger.debug(f"Presence update: {sensor.room_id} = {occupied}")
+            self._pending_rooms[sensor.room_id] = None
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.coalesce_window, self._flush_presence
+                )
+
+        logger.debug("Presence update: %s = %s", sensor.room_id, occupied)
+
+    def _flush_presence(self) -> None:
+        """Notify the callback once per changed room with its current occupancy."""
+        self._flush_handle = None
+        rooms, self._pending_rooms = self._pending_rooms, {}
+        if self._on_presence_change is None:
+            return
+        for room_id in rooms:
+            occupied = self.is_room_occupied(room_id)
+            if self._notified.get(room_id) != occupied:
+                self._notified[room_id] = occupied
+                self._on_presence_change(room_id, occupied)
 
     def get_presence_state(self) -> PresenceState:
         """Get current presence state."""
@@ -140,10 +234,7 @@ class PresenceManager:
 
     def is_room_occupied(self, room_id: str) -> bool:
         """Check if a specific room is occupied."""
-        for sensor in self._sensors.values():
-            if sensor.room_id == room_id and sensor.occupied:
-                return True
-        return False
+        return any(sensor.occupied for sensor in self._sensors_by_room.get(room_id, ()))
 
 
 def create_presence_manager(secrets: SecretsConfig) -> PresenceManager:
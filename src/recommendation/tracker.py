@@ -58,11 +58,8 @@ class ViewingTracker:
         return f"{np.app}|{np.title}|{np.series_name}|{np.season}|{np.episode}"
 
     async def _check_device(self, device: MediaDevice) -> None:
-        """Check a single device and update viewing history."""
+        """Update viewing history from a device's refreshed state."""
         try:
-            # Refresh device state
-            await device.refresh()
-
             device_id = device.id
             content_hash = self._get_content_hash(device)
             active_session = self._active_sessions.get(device_id)
@@ -170,6 +167,22 @@ class ViewingTracker:
         finally:
             del self._active_sessions[device_id]
 
+    async def _poll_once(self) -> None:
+        """Refresh every media device together, then check each one."""
+        media_devices = [
+            d for d in self.device_manager.get_all_devices()
+            if isinstance(d, MediaDevice)
+        ]
+        if not media_devices:
+            return
+
+        # One bounded, concurrent refresh pass instead of a refresh per device.
+        # Polling only reads state, so skip persistence and health bookkeeping.
+        await self.device_manager.refresh_devices(
+            (d.id for d in media_devices), record=False
+        )
+        await asyncio.gather(*(self._check_device(d) for d in media_devices))
+
     async def _poll_loop(self) -> None:
         """Main polling loop."""
         logger.info(
@@ -178,16 +191,7 @@ class ViewingTracker:
 
         while self._running:
             try:
-                # Get all media devices
-                media_devices = [
-                    d for d in self.device_manager.get_all_devices()
-                    if isinstance(d, MediaDevice)
-                ]
-
-                # Check each device
-                for device in media_devices:
-                    await self._check_device(device)
-
+                await self._poll_once()
             except Exception as e:
                 logger.error(f"Error in viewing tracker poll loop: {e}")
 
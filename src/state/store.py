@@ -1,7 +1,6 @@
 """State persistence for Burrow MCP."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -9,6 +8,8 @@ from typing import Any
 
 import aiosqlite
 
+from utils.serialization import dumps, loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,7 +67,7 @@ class StateStore:
                 INSERT OR REPLACE INTO device_state (device_id, state_json, updated_at)
                 VALUES (?, ?, ?)
                 """,
-                (device_id, json.dumps(state), now),
+                (device_id, dumps(state), now),
             )
             await self._db.commit()
 
@@ -82,7 +83,7 @@ class StateStore:
             )
             row = await cursor.fetchone()
             if row:
-                return json.loads(row[0])
+                return loads(row[0])
             return None
 
     async def save_room_state(
@@ -134,7 +135,7 @@ class StateStore:
                 INSERT OR REPLACE INTO kv_store (key, value_json, updated_at)
                 VALUES (?, ?, ?)
                 """,
-                (key, json.dumps(value), now),
+                (key, dumps(value), now),
             )
             await self._db.commit()
 
@@ -150,7 +151,7 @@ class StateStore:
             )
             row = await cursor.fetchone()
             if row:
-                return json.loads(row[0])
+                return loads(row[0])
             return default
 
     async def delete(self, key: str) -> bool:
@@ -110,6 +110,22 @@ def generate_request_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+# Longest exception text copied into a response
+MAX_ERROR_MESSAGE_LENGTH = 256
+
+
+def error_message(e: BaseException) -> str:
+    """Get an exception's text, truncated to MAX_ERROR_MESSAGE_LENGTH.
+
+    Some library exceptions (validation errors, HTTP errors carrying a body)
+    render very large messages that are no use to a client.
+    """
+    message = str(e)
+    if len(message) > MAX_ERROR_MESSAGE_LENGTH:
+        return message[: MAX_ERROR_MESSAGE_LENGTH - 3] + "..."
+    return message
+
+
 def classify_exception(e: Exception, device_id: str | None = None) -> ToolError:
     """Classify an exception into a structured error.
 
@@ -130,15 +146,15 @@ def classify_exception(e: Exception, device_id: str | None = None) -> ToolError:
             message = f"Device {device_id} operation timed out"
     elif isinstance(e, DeviceTimeoutError):
         category = ErrorCategory.TIMEOUT
-        message = str(e)
+        message = error_message(e)
         device_id = e.device_id
     elif isinstance(e, DeviceOfflineError):
         category = ErrorCategory.DEVICE_OFFLINE
-        message = str(e)
+        message = error_message(e)
         device_id = e.device_id
     elif isinstance(e, RateLimitedError):
         category = ErrorCategory.RATE_LIMITED
-        message = str(e)
+        message = error_message(e)
     elif isinstance(e, CircuitBreakerOpen):
         category = ErrorCategory.CIRCUIT_OPEN
         message = "Device temporarily unavailable due to repeated failures"
@@ -146,20 +162,20 @@ def classify_exception(e: Exception, device_id: str | None = None) -> ToolError:
             message = f"Device {device_id} temporarily unavailable due to repeated failures"
     elif isinstance(e, ValueError):
         category = ErrorCategory.INVALID_INPUT
-        message = str(e)
+        message = error_message(e)
     elif isinstance(e, RuntimeError):
-        error_str = str(e).lower()
+        error_str = error_message(e).lower()
         if "not connected" in error_str or "circuit breaker" in error_str:
             category = ErrorCategory.DEVICE_OFFLINE
         else:
             category = ErrorCategory.INTERNAL_ERROR
-        message = str(e)
+        message = error_message(e)
     elif isinstance(e, ConnectionError):
         category = ErrorCategory.API_ERROR
-        message = f"Connection error: {e}"
+        message = f"Connection error: {error_message(e)}"
     else:
         category = ErrorCategory.INTERNAL_ERROR
-        message = f"Unexpected error: {e}"
+        message = f"Unexpected error: {error_message(e)}"
 
     return ToolError(
         category=category,
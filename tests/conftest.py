@@ -23,7 +23,7 @@ from models.vacuum import Vacuum, VacuumState
 
 
 # Concrete test implementations of abstract device classes
-@dataclass
+@dataclass(slots=True)
 class TestLight(Light):
     """Concrete Light implementation for testing."""
 
@@ -43,7 +43,7 @@ class TestLight(Light):
         self.color_temp = kelvin
 
 
-@dataclass
+@dataclass(slots=True)
 class TestLock(Lock):
     """Concrete Lock implementation for testing."""
 
@@ -57,7 +57,7 @@ class TestLock(Lock):
         self.lock_state = LockState.UNLOCKED
 
 
-@dataclass
+@dataclass(slots=True)
 class TestPlug(Plug):
     """Concrete Plug implementation for testing."""
 
@@ -68,7 +68,7 @@ class TestPlug(Plug):
         self.is_on = on
 
 
-@dataclass
+@dataclass(slots=True)
 class TestVacuum(Vacuum):
     """Concrete Vacuum implementation for testing."""
 
@@ -0,0 +1,366 @@
+"""Tests for the AppleTV media device implementation."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import devices.appletv as appletv_module
+from devices.appletv import AppleTVDevice
+from models.base import DeviceStatus
+from models.media_device import PlaybackState
+
+
+def make_playing(title: str = "Severance", device_state: str = "DeviceState.Playing"):
+    """Create a stand-in for a pyatv Playing object."""
+    return SimpleNamespace(
+        device_state=device_state,
+        title=title,
+        artist=None,
+        album=None,
+        series_name="Severance",
+        season_number=1,
+        episode_number=2,
+        genre=None,
+        total_time=3000,
+        position=120,
+    )
+
+
+def make_atv() -> MagicMock:
+    """Create a mock pyatv AppleTV connection."""
+    atv = MagicMock()
+    atv.metadata.app = SimpleNamespace(identifier="com.apple.TVWatchList", name="TV")
+    atv.metadata.playing = AsyncMock(return_value=make_playing())
+    atv.apps.app_list = AsyncMock(
+        return_value=[
+            make_app("com.netflix.Netflix", "Netflix"),
+            make_app("com.apple.TVWatchList", "TV"),
+            make_app("com.amazon.aiv.AIVApp", "Prime Video"),
+        ]
+    )
+    atv.apps.launch_app = AsyncMock()
+    atv.close.return_value = set()
+    return atv
+
+
+def make_app(identifier: str, name: str):
+    """Create a stand-in for a pyatv App."""
+    return SimpleNamespace(identifier=identifier, name=name)
+
+
+def make_device(atv: MagicMock) -> AppleTVDevice:
+    """Create a connected AppleTV device around a mock connection."""
+    return AppleTVDevice(id="appletv_1", name="Living Room TV", _atv=atv, _connected=True)
+
+
+class TestAppleTVPushUpdates:
+    """Tests for push-driven AppleTV state."""
+
+    @pytest.mark.asyncio
+    async def test_push_update_applies_state(self):
+        """Test a pushed play status updates the cached state."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+
+        atv.push_updater.start.assert_called_once()
+        atv.push_updater.listener.playstatus_update(atv.push_updater, make_playing("Pilot"))
+
+        assert device.playback_state == PlaybackState.PLAYING
+        assert device.now_playing.title == "Pilot"
+        assert device.status == DeviceStatus.ONLINE
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_poll_while_pushing(self):
+        """Test refresh sends no request while push updates are running."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+
+        await device.refresh()
+
+        atv.metadata.playing.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_push_error_falls_back_to_polling(self):
+        """Test refresh polls again once the push stream fails."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+
+        atv.push_updater.listener.playstatus_error(atv.push_updater, OSError("gone"))
+        await device.refresh()
+
+        atv.metadata.playing.assert_awaited_once()
+        assert device.now_playing.title == "Severance"
+
+    @pytest.mark.asyncio
+    async def test_close_stops_push_updates(self):
+        """Test closing the device stops the push updater."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+
+        await device.close()
+
+        atv.push_updater.stop.assert_called_once()
+        assert device._push_listener is None
+
+    @pytest.mark.asyncio
+    async def test_same_content_reuses_now_playing(self):
+        """Test an unchanged title only moves the playback position."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+        listener = atv.push_updater.listener
+
+        listener.playstatus_update(atv.push_updater, make_playing("Pilot"))
+        now_playing = device.now_playing
+        paused = make_playing("Pilot", device_state="DeviceState.Paused")
+        paused.position = 300
+        listener.playstatus_update(atv.push_updater, paused)
+
+        assert device.now_playing is now_playing
+        assert device.now_playing.position == 300
+        assert device.playback_state == PlaybackState.PAUSED
+
+        listener.playstatus_update(atv.push_updater, make_playing("Episode 2"))
+        assert device.now_playing is not now_playing
+        assert device.now_playing.title == "Episode 2"
+
+    @pytest.mark.asyncio
+    async def test_later_metadata_is_applied(self):
+        """Test a second push for the same title picks up filled-in metadata."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._start_push_updates()
+        listener = atv.push_updater.listener
+
+        partial = make_playing("Song")
+        partial.series_name = partial.season_number = partial.episode_number = None
+        partial.total_time = None
+        listener.playstatus_update(atv.push_updater, partial)
+        assert device.now_playing.media_type == "unknown"
+
+        complete = make_playing("Song")
+        complete.series_name = complete.season_number = complete.episode_number = None
+        complete.artist = "Artist"
+        complete.album = "Album"
+        listener.playstatus_update(atv.push_updater, complete)
+
+        assert device.now_playing.duration == 3000
+        assert device.now_playing.artist == "Artist"
+        assert device.now_playing.media_type == "music"
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_wait_forever(self, monkeypatch):
+        """Test close gives up on a connection that never finishes closing."""
+        monkeypatch.setattr(appletv_module, "CLOSE_TIMEOUT", 0.01)
+        atv = make_atv()
+        hung = asyncio.create_task(asyncio.sleep(60))
+        atv.close.return_value = {hung}
+        device = make_device(atv)
+
+        await device.close()
+
+        assert device._connected is False
+        hung.cancel()
+
+
+class TestAppleTVApps:
+    """Tests for the AppleTV app list."""
+
+    @pytest.mark.asyncio
+    async def test_app_list_is_cached(self):
+        """Test repeated app list requests reuse one fetch."""
+        atv = make_atv()
+        device = make_device(atv)
+
+        first = await device.get_app_list()
+        second = await device.get_app_list()
+
+        assert first == second
+        atv.apps.app_list.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_drops_app_list(self):
+        """Test closing the device forces a fresh app list."""
+        atv = make_atv()
+        device = make_device(atv)
+
+        await device.get_app_list()
+        await device.close()
+        device._connected = True
+        await device.get_app_list()
+
+        assert atv.apps.app_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_launch_app_matches_exact_and_partial_names(self):
+        """Test launch_app finds apps by id, name, name word, or substring."""
+        atv = make_atv()
+        device = make_device(atv)
+
+        await device.launch_app("com.apple.tvwatchlist")
+        atv.apps.launch_app.assert_awaited_with("com.apple.TVWatchList")
+
+        await device.launch_app("netf")
+        atv.apps.launch_app.assert_awaited_with("com.netflix.Netflix")
+
+        await device.launch_app("Video")
+        atv.apps.launch_app.assert_awaited_with("com.amazon.aiv.AIVApp")
+        assert atv.apps.app_list.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_launch_unknown_app(self):
+        """Test launching an app that is not installed raises ValueError."""
+        device = make_device(make_atv())
+
+        with pytest.raises(ValueError):
+            await device.launch_app("Hulu")
+
+
+class TestAppleTVRetry:
+    """Tests for AppleTV command retries."""
+
+    @pytest.mark.asyncio
+    async def test_retry_calls_command_again(self, monkeypatch):
+        """Test a transient failure retries with a fresh command."""
+        monkeypatch.setattr("utils.retry.asyncio.sleep", AsyncMock())
+        atv = make_atv()
+        atv.remote_control.play = AsyncMock(side_effect=[OSError("reset"), None])
+        device = make_device(atv)
+
+        await device.play()
+
+        assert atv.remote_control.play.await_count == 2
+        assert device.playback_state == PlaybackState.PLAYING
+
+    @pytest.mark.asyncio
+    async def test_stop_clears_now_playing(self):
+        """Test stop records the stopped state and drops now playing."""
+        atv = make_atv()
+        atv.remote_control.stop = AsyncMock()
+        device = make_device(atv)
+        await device.force_refresh()
+
+        await device.stop()
+
+        assert device.playback_state == PlaybackState.STOPPED
+        assert device.now_playing is None
+
+    @pytest.mark.asyncio
+    async def test_command_failure_leaves_state(self):
+        """Test a failed command raises and keeps the previous state."""
+        atv = make_atv()
+        atv.remote_control.pause = AsyncMock(side_effect=ValueError("bad"))
+        device = make_device(atv)
+        device.playback_state = PlaybackState.PLAYING
+
+        with pytest.raises(ValueError):
+            await device.pause()
+
+        assert device.playback_state == PlaybackState.PLAYING
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_is_per_device(self, monkeypatch):
+        """Test one failing AppleTV does not block another."""
+        monkeypatch.setattr(appletv_module, "_appletv_circuit_breakers", {})
+        failing_atv = make_atv()
+        failing_atv.remote_control.pause = AsyncMock(side_effect=ValueError("bad"))
+        failing = AppleTVDevice(id="bedroom_tv", name="Bedroom TV", _atv=failing_atv)
+        healthy_atv = make_atv()
+        healthy_atv.remote_control.pause = AsyncMock()
+        healthy = make_device(healthy_atv)
+
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                await failing.pause()
+
+        with pytest.raises(RuntimeError, match="temporarily unavailable"):
+            await failing.pause()
+        await healthy.pause()
+        assert healthy.playback_state == PlaybackState.PAUSED
+
+
+class TestAppleTVReconnect:
+    """Tests for reconnecting after the connection drops."""
+
+    @pytest.mark.asyncio
+    async def test_connection_lost_reconnects_in_background(self, monkeypatch):
+        """Test a dropped connection is re-established without a command."""
+        atv = make_atv()
+        device = make_device(atv)
+        device._ip = "192.168.1.50"
+        device._start_push_updates()
+
+        async def fake_reconnect():
+            device._connected = True
+            device.status = DeviceStatus.ONLINE
+
+        monkeypatch.setattr(AppleTVDevice, "reconnect", lambda self: fake_reconnect())
+        atv.listener.connection_lost(OSError("network down"))
+
+        assert device.status == DeviceStatus.OFFLINE
+        assert device._push_listener is None
+        await device._reconnect_task
+        assert device.status == DeviceStatus.ONLINE
+
+    @pytest.mark.asyncio
+    async def test_scan_stops_at_first_hit(self, monkeypatch):
+        """Test reconnect scans start short and stop once the AppleTV answers."""
+        scan = AsyncMock(side_effect=[[], ["found"]])
+        monkeypatch.setitem(sys.modules, "pyatv", SimpleNamespace(scan=scan))
+
+        assert await appletv_module._scan_for_appletv("192.168.1.50", None) == ["found"]
+        assert [c.kwargs["timeout"] for c in scan.await_args_list] == [2.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_scan_gives_up(self, monkeypatch):
+        """Test an AppleTV that never answers yields no results."""
+        scan = AsyncMock(return_value=[])
+        monkeypatch.setitem(sys.modules, "pyatv", SimpleNamespace(scan=scan))
+
+        assert await appletv_module._scan_for_appletv(None, "ABC123") == []
+        assert scan.await_count == len(appletv_module.SCAN_TIMEOUTS)
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_pending_reconnect(self):
+        """Test closing the device stops a reconnect in progress."""
+        device = make_device(make_atv())
+        device._reconnect_task = asyncio.create_task(asyncio.sleep(60))
+        task = device._reconnect_task
+
+        await device.close()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert device._reconnect_task is None
+
+
+class TestMediaType:
+    """Tests for classifying what an AppleTV is playing."""
+
+    @pytest.mark.parametrize(
+        "overrides,expected",
+        [
+            ({}, "tvshow"),
+            ({"series_name": None, "season_number": None, "episode_number": None,
+              "artist": "Artist", "album": "Album"}, "music"),
+            ({"series_name": None, "season_number": None, "episode_number": None,
+              "media_type": "MediaType.Video"}, "movie"),
+            ({"series_name": None, "season_number": None, "episode_number": None,
+              "media_type": "MediaType.Music"}, "music"),
+            ({"series_name": None, "season_number": None, "episode_number": None}, "unknown"),
+        ],
+    )
+    def test_determine_media_type(self, overrides, expected):
+        """Test series, music, and pyatv media type hints are classified."""
+        playing = make_playing()
+        for name, value in overrides.items():
+            setattr(playing, name, value)
+
+        assert make_device(make_atv())._determine_media_type(playing) == expected
@@ -0,0 +1,93 @@
+"""Tests for configuration loading."""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+import config as config_module
+from config import BurrowConfig, DeviceConfig, find_config_dir, load_config, load_yaml
+
+
+class TestLoadYaml:
+    """Tests for YAML loading."""
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file loads as an empty dict."""
+        assert load_yaml(tmp_path / "missing.yaml") == {}
+
+    def test_reuses_parse_until_file_changes(self, tmp_path, monkeypatch):
+        """Test an unchanged file is parsed once and edits are picked up."""
+        path = tmp_path / "config.yaml"
+        path.write_text("house:\n  name: Burrow\n")
+        parses = 0
+        real_load = config_module.yaml.load
+
+        def counting_load(*args, **kwargs):
+            nonlocal parses
+            parses += 1
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(config_module.yaml, "load", counting_load)
+
+        first = load_yaml(path)
+        first["house"]["name"] = "mutated"
+        assert load_yaml(path) == {"house": {"name": "Burrow"}}
+        assert parses == 1
+
+        path.write_text("house:\n  name: Warren\n")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert load_config(tmp_path).house.name == "Warren"
+        assert parses == 2
+
+
+
+class TestFindConfigDir:
+    """Tests for config directory lookup."""
+
+    def test_found_directory_is_cached(self, tmp_path, monkeypatch):
+        """Test a located directory is reused without stat calls."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_module, "_config_dir_cache", {})
+        (tmp_path / "config").mkdir()
+
+        assert find_config_dir() == tmp_path / "config"
+        (tmp_path / "config").rmdir()
+        assert find_config_dir() == tmp_path / "config"
+
+    def test_missing_directory_not_cached(self, tmp_path, monkeypatch):
+        """Test a directory created after a failed lookup is found."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(config_module, "_config_dir_cache", {})
+        monkeypatch.setattr(config_module.Path, "home", lambda: tmp_path)
+
+        assert find_config_dir() == tmp_path / "config"
+        home_config = tmp_path / ".config" / "burrow"
+        home_config.mkdir(parents=True)
+
+        assert find_config_dir() == home_config
+
+
+class TestBurrowConfig:
+    """Tests for the main config model."""
+
+    def test_devices_by_type(self):
+        """Test device configs are grouped by type in config order."""
+        config = BurrowConfig(
+            devices=[
+                DeviceConfig(id="s1", name="Sensor 1", type="mmwave"),
+                DeviceConfig(id="lamp", name="Lamp", type="lifx"),
+                DeviceConfig(id="s2", name="Sensor 2", type="mmwave"),
+            ]
+        )
+        assert [d.id for d in config.devices_by_type["mmwave"]] == ["s1", "s2"]
+        assert [d.id for d in config.devices_by_type["lifx"]] == ["lamp"]
+        assert "tuya" not in config.devices_by_type
+
+    def test_frozen(self):
+        """Test loaded config objects cannot be reassigned."""
+        config = BurrowConfig(devices=[DeviceConfig(id="lamp", name="Lamp", type="lifx")])
+        with pytest.raises(ValidationError):
+            config.devices[0].room = "bedroom"
+        with pytest.raises(ValidationError):
+            config.refresh_ttl = 0
@@ -1,11 +1,20 @@
 """Tests for DeviceManager."""
 
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock
+
 import pytest
 
+from config import BurrowConfig, DeviceConfig, RoomConfig
 from devices.manager import DeviceManager
 from models.base import DeviceStatus, DeviceType
 from models.light import Light
 from models.plug import Plug
+from tests.conftest import TestLight as ConcreteLight
 
 
 class TestDeviceManager:
@@ -55,6 +64,102 @@ class TestDeviceManager:
         assert len(bedroom_lights) == 1
         assert bedroom_lights[0].id == "light_2"
 
+    @pytest.mark.asyncio
+    async def test_get_devices_combined_filters(self, device_manager):
+        """Test filtering devices by type, room and status together."""
+        devices = device_manager.get_devices(
+            device_type=DeviceType.LIGHT, room_id="living_room"
+        )
+        assert [d.id for d in devices] == ["light_1"]
+
+        devices = device_manager.get_devices(room_id="living_room")
+        assert {d.id for d in devices} == {"light_1", "plug_1"}
+
+        device_manager.get_light("light_2").status = DeviceStatus.OFFLINE
+        devices = device_manager.get_devices(
+            device_type=DeviceType.LIGHT, status=DeviceStatus.OFFLINE
+        )
+        assert [d.id for d in devices] == ["light_2"]
+
+        assert device_manager.get_devices(device_type=DeviceType.LOCK) == []
+        assert device_manager.get_devices(room_id="kitchen") == []
+
+    @pytest.mark.asyncio
+    async def test_devices_created_concurrently(self, sample_secrets, tmp_path):
+        """Test factories run concurrently and devices keep config order."""
+        config = BurrowConfig(
+            rooms=[RoomConfig(id="office", name="Office")],
+            devices=[
+                DeviceConfig(id=f"light_{i}", name=f"Light {i}", type="slow", room="office")
+                for i in range(3)
+            ],
+        )
+        manager = DeviceManager(config, sample_secrets, db_path=tmp_path / "state.db")
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_factory(device_config, secrets):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later devices finish first
+            await asyncio.sleep(0.01 * (3 - int(device_config.id[-1])))
+            in_flight -= 1
+            return ConcreteLight(id=device_config.id, name=device_config.name, room_id="office")
+
+        manager.register_device_factory("slow", slow_factory)
+        await manager.initialize()
+        await manager.stop_health_monitoring()
+
+        assert max_in_flight == 3
+        assert [d.id for d in manager.get_devices()] == ["light_0", "light_1", "light_2"]
+        assert manager.get_room("office").device_ids == ["light_0", "light_1", "light_2"]
+
+    @pytest.mark.asyncio
+    async def test_initialize_all_reports_failures(self, sample_secrets, tmp_path):
+        """Test failing or hanging factories are reported without blocking others."""
+        config = BurrowConfig(
+            rooms=[RoomConfig(id="office", name="Office")],
+            devices=[
+                DeviceConfig(id="ok", name="OK", type="ok", room="office"),
+                DeviceConfig(id="broken", name="Broken", type="broken", room="office"),
+                DeviceConfig(id="hung", name="Hung", type="hung", room="office"),
+                DeviceConfig(id="unknown", name="Unknown", type="unknown", room="office"),
+                DeviceConfig(id="slow", name="Slow", type="slow", room="office"),
+            ],
+        )
+        manager = DeviceManager(config, sample_secrets, db_path=tmp_path / "state.db")
+
+        async def ok_factory(device_config, secrets):
+            return ConcreteLight(id=device_config.id, name=device_config.name, room_id="office")
+
+        async def broken_factory(device_config, secrets):
+            raise OSError("unreachable")
+
+        async def hung_factory(device_config, secrets):
+            await asyncio.sleep(10)
+
+        async def slow_factory(device_config, secrets):
+            raise TimeoutError("connect timed out")
+
+        manager.register_device_factory("ok", ok_factory)
+        manager.register_device_factory("broken", broken_factory)
+        manager.register_device_factory("hung", hung_factory)
+        manager.register_device_factory("slow", slow_factory)
+        results = await manager.initialize_all(timeout=0.05)
+        await manager.stop_health_monitoring()
+
+        assert results[0] is manager.get_device("ok")
+        assert isinstance(results[1], OSError)
+        assert isinstance(results[2], TimeoutError)
+        assert str(results[2]) == "timed out after 0.05s"
+        assert isinstance(results[3], LookupError)
+        # A backend's own timeout is reported as raised, not as ours
+        assert isinstance(results[4], TimeoutError)
+        assert str(results[4]) == "connect timed out"
+        assert [d.id for d in manager.get_devices()] == ["ok"]
+        assert manager.get_room("office").device_ids == ["ok"]
+
     @pytest.mark.asyncio
     async def test_get_room_devices(self, device_manager):
         """Test getting all devices in a room."""
@@ -77,6 +182,29 @@ class TestDeviceManager:
         assert response["status"] == "online"
         assert "state" in response
 
+    @pytest.mark.asyncio
+    async def test_device_to_response_reflects_changes(self, device_manager):
+        """Test each response is built fresh from the current device state."""
+        light = device_manager.get_light("light_1")
+        first = device_manager.device_to_response(light)
+
+        first["state"]["is_on"] = "caller mutation"
+        second = device_manager.device_to_response(light)
+        assert second["state"]["is_on"] is light.is_on
+
+        await light.set_power(True)
+        assert device_manager.device_to_response(light)["state"]["is_on"] is True
+
+        light.status = DeviceStatus.OFFLINE
+        assert device_manager.device_to_response(light)["status"] == "offline"
+
+    @pytest.mark.asyncio
+    async def test_device_to_json(self, device_manager):
+        """Test serializing a device response to JSON bytes."""
+        light = device_manager.get_light("light_1")
+        data = json.loads(device_manager.device_to_json(light))
+        assert data == device_manager.device_to_response(light)
+
     @pytest.mark.asyncio
     async def test_room_to_response(self, device_manager):
         """Test converting room to response dict."""
@@ -108,6 +236,141 @@ class TestDeviceManager:
         count = device_manager.count_lights_on(room_id="bedroom")
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_count_lights_on_by_room(self, device_manager):
+        """Test per-room counts match the single-room count."""
+        assert device_manager.count_lights_on_by_room() == {}
+
+        device_manager.get_light("light_1").is_on = True
+        device_manager.get_light("light_2").is_on = True
+        counts = device_manager.count_lights_on_by_room()
+
+        assert counts == {"living_room": 1, "bedroom": 1}
+        assert counts["living_room"] == device_manager.count_lights_on("living_room")
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_skips_fresh_devices(self, device_manager, monkeypatch):
+        """Test refresh_all reuses state refreshed within the TTL."""
+        calls: list[str] = []
+
+        async def refresh(device):
+            calls.append(device.id)
+
+        for device_class in {type(d) for d in device_manager.get_devices()}:
+            monkeypatch.setattr(device_class, "refresh", refresh)
+
+        await device_manager.refresh_all()
+        assert len(calls) == 3
+
+        await device_manager.refresh_all()
+        assert len(calls) == 3
+
+        await device_manager.refresh_all(force=True)
+        assert len(calls) == 6
+
+        # Expire one device's cached state
+        device_manager._last_refresh["light_1"] -= device_manager.config.refresh_ttl
+        await device_manager.refresh_all()
+        assert calls[6:] == ["light_1"]
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_bounds_concurrency(self, device_manager, monkeypatch):
+        """Test refresh_all limits concurrent refreshes per device class."""
+        monkeypatch.setattr("devices.manager.DEFAULT_REFRESH_CONCURRENCY", 1)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def refresh(device):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        monkeypatch.setattr(ConcreteLight, "refresh", refresh)
+
+        await device_manager.refresh_all(force=True)
+        # Two lights share one semaphore; the plug has its own
+        assert max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_device_returns_device(self, device_manager, monkeypatch):
+        """Test refresh_device hands back the device it refreshed."""
+        light = device_manager.get_light("light_1")
+        assert await device_manager.refresh_device("light_1") is light
+        assert await device_manager.refresh_device("nonexistent") is None
+
+        async def failing_refresh(device):
+            raise OSError("unreachable")
+
+        monkeypatch.setattr(ConcreteLight, "refresh", failing_refresh)
+        assert await device_manager.refresh_device("light_1") is light
+        assert light.status == DeviceStatus.OFFLINE
+
+    @pytest.mark.asyncio
+    async def test_refresh_devices_subset(self, device_manager, monkeypatch):
+        """Test refresh_devices refreshes only the named devices."""
+        refreshed = []
+
+        async def refresh(device):
+            refreshed.append(device.id)
+
+        for device_class in {type(d) for d in device_manager.get_devices()}:
+            monkeypatch.setattr(device_class, "refresh", refresh)
+
+        await device_manager.refresh_devices(["light_2", "plug_1", "nonexistent"])
+        assert sorted(refreshed) == ["light_2", "plug_1"]
+
+        # Both are now within their TTL
+        await device_manager.refresh_devices(["light_2", "plug_1"])
+        assert len(refreshed) == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_devices_without_record(self, device_manager, monkeypatch):
+        """Test an unrecorded refresh skips persistence and offline marking."""
+        persist = AsyncMock()
+        monkeypatch.setattr(device_manager, "_persist_device_state", persist)
+        light = device_manager.get_light("light_1")
+
+        async def refresh(device):
+            if device.id == "light_1":
+                raise OSError("unreachable")
+
+        monkeypatch.setattr(ConcreteLight, "refresh", refresh)
+
+        await device_manager.refresh_devices(["light_1", "light_2"], record=False)
+
+        persist.assert_not_awaited()
+        assert light.status != DeviceStatus.OFFLINE
+
+    @pytest.mark.asyncio
+    async def test_refresh_device_skips_fresh(self, device_manager, monkeypatch):
+        """Test an unforced refresh is skipped within the TTL."""
+        light = device_manager.get_light("light_1")
+        calls = 0
+
+        async def refresh(device):
+            nonlocal calls
+            calls += 1
+
+        monkeypatch.setattr(ConcreteLight, "refresh", refresh)
+        await device_manager.refresh_device("light_1", force=False)
+        await device_manager.refresh_device("light_1", force=False)
+        assert calls == 1
+
+        assert await device_manager.refresh_device("light_1") is light
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_set_group_color(self, device_manager):
+        """Test setting one color on all lights in a room."""
+        results = await device_manager.set_group_color("living_room", "#00ff00")
+        assert results == {"light_1": True}
+        assert device_manager.get_light("light_1").color == "#00ff00"
+        assert device_manager.get_light("light_2").color is None
+
+        assert await device_manager.set_group_color("kitchen", "#00ff00") == {}
+
     @pytest.mark.asyncio
     async def test_room_presence(self, device_manager):
         """Test room presence updates."""
@@ -120,6 +383,21 @@ class TestDeviceManager:
         await device_manager.update_room_presence("living_room", False)
         assert room.occupied is False
 
+    @pytest.mark.asyncio
+    async def test_apply_presence(self, device_manager):
+        """Test sensor callbacks update the room now and persist in the background."""
+        room = device_manager.get_room("living_room")
+
+        device_manager.apply_presence("living_room", True)
+        assert room.occupied is True
+        assert room.last_presence_change is not None
+
+        await asyncio.gather(*device_manager._background_tasks)
+        assert not device_manager._background_tasks
+
+        device_manager.apply_presence("nonexistent", True)
+        assert not device_manager._background_tasks
+
     @pytest.mark.asyncio
     async def test_get_rooms_filters(self, device_manager):
         """Test room filtering."""
@@ -165,3 +443,58 @@ class TestDeviceManager:
 
         # Should not raise
         await device_manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_presence_updates(self, device_manager, monkeypatch):
+        """Test shutdown lets background presence writes finish first."""
+        finished = []
+
+        async def slow_update(room_id, occupied, confidence=1.0):
+            await asyncio.sleep(0.01)
+            finished.append(room_id)
+
+        monkeypatch.setattr(device_manager, "update_room_presence", slow_update)
+        device_manager.apply_presence("living_room", True)
+
+        await device_manager.shutdown()
+
+        assert finished == ["living_room"]
+
+
+class TestDeviceFactories:
+    """Tests for device factory registration."""
+
+    def test_vendor_sdks_imported_lazily(self):
+        """Test importing the device package loads no vendor SDK."""
+        vendors = ["lifxlan", "tinytuya", "yalexs", "roombapy", "irbt", "ring_doorbell", "pyatv"]
+        code = (
+            "import sys, devices; "
+            f"print([m for m in {vendors!r} if m in sys.modules])"
+        )
+        src = Path(__file__).resolve().parent.parent / "src"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_register_only_configured_backends(self):
+        """Test only the backends for configured device types are imported."""
+        code = (
+            "import sys; from unittest.mock import MagicMock; "
+            "from devices import register_all_factories; "
+            "manager = MagicMock(); register_all_factories(manager, ['lifx']); "
+            "print(sorted(m for m in sys.modules if m.startswith('devices.')), "
+            "list(manager.register_device_factories.call_args.args[0]))"
+        )
+        src = Path(__file__).resolve().parent.parent / "src"
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=src, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "['devices.lifx', 'devices.manager'] ['lifx']"
+
+    def test_lazy_exports(self):
+        """Test backend classes stay importable from the package."""
+        from devices import LifxLight as ExportedLifxLight
+        from devices.lifx import LifxLight
+
+        assert ExportedLifxLight is LifxLight
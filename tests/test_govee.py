@@ -0,0 +1,35 @@
+"""Tests for the Govee light implementation."""
+
+import pytest
+
+from devices.govee import GoveeLight
+
+
+class TestGoveeClient:
+    """Tests for the shared Govee HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_between_lights(self):
+        """Test lights reuse one client and the last close releases it."""
+        first = GoveeLight(id="govee_1", name="Strip", _api_key="key")
+        second = GoveeLight(id="govee_2", name="Lamp", _api_key="key")
+
+        client = await first._ensure_client()
+        assert await second._ensure_client() is client
+
+        await first.close()
+        assert not client.is_closed
+
+        await second.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_reconnect_gets_fresh_client(self):
+        """Test a closed shared client is replaced on next use."""
+        light = GoveeLight(id="govee_1", name="Strip", _api_key="key")
+
+        client = await light._ensure_client()
+        await light.close()
+
+        assert await light._ensure_client() is not client
+        await light.close()
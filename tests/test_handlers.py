@@ -4,7 +4,7 @@ import pytest
 
 from mcp_server.handlers.discovery import handle_discover_tools, handle_get_system_status
 from mcp_server.handlers.vacuum import VacuumHandlers
-from mcp_server.tools import TOOL_CATEGORIES
+from mcp_server.tools import TOOL_CATEGORIES, compile_argument_validator, get_all_tools
 from models.base import DeviceStatus
 from models.vacuum import VacuumState
 
@@ -81,6 +81,50 @@ class TestDiscoveryHandlers:
         assert result["devices_by_type"]["light"] == 2
         assert result["devices_by_type"]["plug"] == 1
 
+    def test_tool_definitions_cached(self):
+        """Test the static tool list is built once and shared."""
+        tools = get_all_tools()
+        assert get_all_tools() is tools
+        assert len({tool.name for tool in tools}) == len(tools)
+
+
+class TestArgumentValidation:
+    """Tests for schema-derived tool argument validation."""
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "device_id": {"type": "string"},
+            "brightness": {"type": "integer", "minimum": 0, "maximum": 100},
+            "on": {"type": "boolean"},
+            "mode": {"type": "string", "enum": ["auto", "manual"]},
+        },
+        "required": ["device_id"],
+    }
+
+    def test_valid_arguments(self):
+        """Test well-formed arguments pass."""
+        validate = compile_argument_validator(self.SCHEMA)
+        assert validate({"device_id": "light_1", "brightness": 50, "on": True}) is None
+        assert validate({"device_id": "light_1", "mode": None}) is None
+
+    def test_invalid_arguments(self):
+        """Test missing, mistyped and out-of-enum arguments are reported."""
+        validate = compile_argument_validator(self.SCHEMA)
+        assert validate({}) == "missing required argument 'device_id'"
+        assert validate({"device_id": 1}) == "'device_id' must be of type string"
+        assert validate({"device_id": "x", "brightness": True}) == (
+            "'brightness' must be of type integer"
+        )
+        assert validate({"device_id": "x", "mode": "eco"}) == (
+            "'mode' must be one of: auto, manual"
+        )
+
+    def test_range_left_to_handlers(self):
+        """Test range limits are not enforced by the validator."""
+        validate = compile_argument_validator(self.SCHEMA)
+        assert validate({"device_id": "x", "brightness": 150}) is None
+
 
 class TestQueryHandlers:
     """Tests for query handlers."""
@@ -153,6 +197,18 @@ class TestQueryHandlers:
 
         assert len(result["devices"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_devices_invalid_filters(self, device_manager):
+        """Test unknown type and status filters are rejected."""
+        from mcp_server.handlers.query import QueryHandlers
+
+        handlers = QueryHandlers(device_manager, None)
+
+        result = await handlers.list_devices({"device_type": "toaster"})
+        assert result == {"error": "Invalid device type: toaster"}
+        result = await handlers.list_devices({"status": "asleep"})
+        assert result == {"error": "Invalid status: asleep"}
+
     @pytest.mark.asyncio
     async def test_list_devices_filter_room(self, device_manager):
         """Test listing devices filtered by room."""
@@ -163,6 +219,26 @@ class TestQueryHandlers:
 
         assert len(result["devices"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_devices_refresh(self, device_manager, monkeypatch):
+        """Test list_devices refreshes the filtered devices when asked."""
+        from mcp_server.handlers.query import QueryHandlers
+
+        async def refresh(device):
+            if device.id == "light_1":
+                raise OSError("unreachable")
+
+        monkeypatch.setattr(type(device_manager.get_light("light_1")), "refresh", refresh)
+        handlers = QueryHandlers(device_manager)
+
+        result = await handlers.list_devices({"room_id": "living_room", "status": "online"})
+        assert len(result["devices"]) == 2
+
+        result = await handlers.list_devices(
+            {"room_id": "living_room", "status": "online", "refresh": True}
+        )
+        assert [d["id"] for d in result["devices"]] == ["plug_1"]
+
     @pytest.mark.asyncio
     async def test_get_device_state(self, device_manager):
         """Test getting device state."""
@@ -201,6 +277,82 @@ class TestLightHandlers:
 
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_set_light_brightness(self, device_manager):
+        """Test a brightness command reports the new state."""
+        from mcp_server.handlers.lights import LightHandlers
+
+        handlers = LightHandlers(device_manager)
+        result = await handlers.set_light_brightness({"device_id": "light_1", "brightness": 40})
+
+        assert result["success"] is True
+        assert result["device_id"] == "light_1"
+        assert result["brightness"] == 40
+        assert result["device_status"] == "online"
+
+    @pytest.mark.asyncio
+    async def test_set_light_brightness_checks(self, device_manager):
+        """Test offline lights and bad values are rejected before sending."""
+        from mcp_server.handlers.lights import LightHandlers
+
+        handlers = LightHandlers(device_manager)
+        result = await handlers.set_light_brightness({"device_id": "light_1", "brightness": 150})
+        assert result["error_category"] == "invalid_input"
+
+        device_manager.get_light("light_1").status = DeviceStatus.OFFLINE
+        result = await handlers.set_light_brightness({"device_id": "light_1", "brightness": 150})
+        assert result["error_category"] == "device_offline"
+        assert result["error"] == "Light light_1 is offline"
+
+    @pytest.mark.asyncio
+    async def test_set_room_lights_concurrent(self, sample_secrets, tmp_path):
+        """Test room lights are driven concurrently and failures are reported per light."""
+        import asyncio
+
+        from config import BurrowConfig, DeviceConfig, RoomConfig
+        from devices.manager import DeviceManager
+        from mcp_server.handlers.lights import LightHandlers
+        from tests.conftest import TestLight
+
+        in_flight = 0
+        peak = 0
+
+        class SlowLight(TestLight):
+            async def set_power(self, on: bool) -> None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                if self.id == "bulb":
+                    raise RuntimeError("bulb unreachable")
+                self.is_on = on
+
+        async def light_factory(config, secrets):
+            light = SlowLight(id=config.id, name=config.name, room_id=config.room)
+            light.status = DeviceStatus.ONLINE
+            return light
+
+        config = BurrowConfig(
+            rooms=[RoomConfig(id="living_room", name="Living Room", floor=1)],
+            devices=[
+                DeviceConfig(id="lamp", name="Lamp", type="lifx", room="living_room"),
+                DeviceConfig(id="bulb", name="Bulb", type="lifx", room="living_room"),
+            ],
+        )
+        manager = DeviceManager(config, sample_secrets, db_path=tmp_path / "state.db")
+        manager.register_device_factory("lifx", light_factory)
+        await manager.initialize()
+
+        handlers = LightHandlers(manager)
+        result = await handlers.set_room_lights({"room_id": "living_room", "on": True})
+
+        assert peak == 2
+        assert result["status"] == "partial"
+        assert [r["device_id"] for r in result["results"]] == ["lamp", "bulb"]
+        assert result["results"][1]["error"] == "bulb unreachable"
+        assert result["failed_devices"] == ["bulb"]
+
 
 class TestSceneHandlers:
     """Tests for scene handlers."""
@@ -227,6 +379,52 @@ class TestSceneHandlers:
 
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_activate_scene_all_rooms(self, device_manager, sample_config):
+        """Test an all-rooms light action sets every room and totals the results."""
+        from config import SceneAction, SceneConfig
+        from mcp_server.handlers.scenes import SceneHandlers
+
+        scene = SceneConfig(
+            id="evening",
+            name="Evening",
+            actions=[SceneAction(type="room_lights", room="all", on=True, brightness=30)],
+        )
+        config = sample_config.model_copy(update={"scenes": [scene]})
+        device_manager.get_light("light_2").status = DeviceStatus.OFFLINE
+
+        handlers = SceneHandlers(config, device_manager)
+        result = await handlers.activate_scene({"scene_id": "evening"})
+
+        action = result["results"][0]
+        assert action["total_success"] == 1
+        assert action["total_failed"] == 1
+        assert [r["room_id"] for r in action["results"]] == ["living_room", "bedroom", "kitchen"]
+        assert device_manager.get_light("light_1").brightness == 30
+
+    @pytest.mark.asyncio
+    async def test_activate_scene_device_actions(self, device_manager, sample_config):
+        """Test device actions are applied according to the device type."""
+        from config import SceneAction, SceneConfig
+        from mcp_server.handlers.scenes import SceneHandlers
+
+        scene = SceneConfig(
+            id="tv",
+            name="TV",
+            actions=[
+                SceneAction(type="device", device="light_1", on=True, brightness=20),
+                SceneAction(type="device", device="plug_1", on=True, brightness=20),
+            ],
+        )
+        config = sample_config.model_copy(update={"scenes": [scene]})
+
+        handlers = SceneHandlers(config, device_manager)
+        result = await handlers.activate_scene({"scene_id": "tv"})
+
+        assert result["status"] == "success"
+        assert device_manager.get_light("light_1").brightness == 20
+        assert device_manager.get_plug("plug_1").is_on is True
+
 
 class TestVacuumHandlers:
     """Tests for vacuum handlers."""
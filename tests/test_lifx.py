@@ -0,0 +1,220 @@
+"""Tests for the LIFX light implementation."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+import devices.lifx as lifx_module
+from config import DeviceConfig, SecretsConfig
+from devices.lifx import LifxLight, create_lifx_light, hex_to_hsbk, hsbk_to_hex
+from models.base import DeviceStatus, DeviceType
+
+
+def make_lifx_device(
+    color: tuple[int, int, int, int] = (0, 0, 65535, 3500), power: int = 65535
+) -> MagicMock:
+    """Create a mock lifxlan.Light."""
+    device = MagicMock()
+    device.power_level = power
+    device.get_color.return_value = list(color)
+    device.get_power.return_value = power
+    return device
+
+
+class TestColorConversion:
+    """Tests for hex <-> HSBK conversion."""
+
+    @pytest.mark.parametrize(
+        "hex_color,expected",
+        [
+            ("#FF0000", (0, 65535, 65535, 3500)),
+            ("#00FF00", (21845, 65535, 65535, 3500)),
+            ("#0000FF", (43690, 65535, 65535, 3500)),
+            ("#FFFFFF", (0, 0, 65535, 3500)),
+            ("#000000", (0, 0, 0, 3500)),
+        ],
+    )
+    def test_hex_to_hsbk(self, hex_color, expected):
+        """Test converting primary colors to HSBK."""
+        assert hex_to_hsbk(hex_color) == expected
+
+    def test_hex_to_hsbk_without_hash(self):
+        """Test that the leading # is optional."""
+        assert hex_to_hsbk("ff0000") == hex_to_hsbk("#ff0000")
+
+    @pytest.mark.parametrize("hex_color", ["#fff", "#ff00000", "#gg0000", "#ff_f00", ""])
+    def test_hex_to_hsbk_rejects_malformed(self, hex_color):
+        """Test colors that are not six hex digits raise ValueError."""
+        with pytest.raises(ValueError):
+            hex_to_hsbk(hex_color)
+
+    @pytest.mark.parametrize("hex_color", ["#ff0000", "#00ff00", "#0000ff", "#ffffff"])
+    def test_round_trip(self, hex_color):
+        """Test that pure colors survive a round trip."""
+        hue, saturation, brightness, _ = hex_to_hsbk(hex_color)
+        assert hsbk_to_hex(hue, saturation, brightness) == hex_color
+
+
+class TestLifxLight:
+    """Tests for LifxLight."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_single_request(self):
+        """Test refresh reads power from the get_color reply."""
+        device = make_lifx_device(color=(0, 65535, 32767, 3500), power=65535)
+        light = LifxLight(id="lifx_1", name="Lamp", _lifx_device=device)
+
+        await light.refresh()
+
+        device.get_color.assert_called_once()
+        device.get_power.assert_not_called()
+        assert light.is_on is True
+        assert light.brightness == 49
+        assert light.color == "#7f0000"
+        assert light.status == DeviceStatus.ONLINE
+
+    @pytest.mark.asyncio
+    async def test_setters_reuse_recent_color(self):
+        """Test brightness/temperature changes skip get_color after a refresh."""
+        device = make_lifx_device(color=(1000, 2000, 65535, 3500))
+        light = LifxLight(id="lifx_1", name="Lamp", _lifx_device=device)
+        await light.refresh()
+        device.get_color.reset_mock()
+
+        await light.set_brightness(50)
+        await light.set_color_temp(2700)
+
+        device.get_color.assert_not_called()
+        assert device.set_color.call_args_list[0].args[0] == [1000, 2000, 32767, 3500]
+        assert device.set_color.call_args_list[1].args[0] == [0, 0, 32767, 2700]
+
+    @pytest.mark.asyncio
+    async def test_setters_reread_stale_color(self):
+        """Test setters fetch the color again once the cached value expires."""
+        device = make_lifx_device(color=(1000, 2000, 65535, 3500))
+        light = LifxLight(id="lifx_1", name="Lamp", _lifx_device=device)
+        await light.refresh()
+        light._hsbk_ts -= 10
+        device.get_color.reset_mock()
+
+        await light.set_brightness(50)
+
+        device.get_color.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_zero_brightness_turns_off(self):
+        """Test brightness 0 powers the bulb off without reading its color."""
+        device = make_lifx_device()
+        light = LifxLight(id="lifx_1", name="Lamp", _lifx_device=device, is_on=True)
+
+        await light.set_brightness(0)
+
+        device.get_color.assert_not_called()
+        device.set_color.assert_not_called()
+        device.set_power.assert_called_once_with(0)
+        assert light.is_on is False
+        assert light.brightness == 0
+
+    @pytest.mark.asyncio
+    async def test_set_color_many(self):
+        """Test batch color change sends rapid packets and updates state."""
+        devices = [make_lifx_device(), make_lifx_device()]
+        lights = [
+            LifxLight(id=f"lifx_{i}", name="Lamp", _lifx_device=device)
+            for i, device in enumerate(devices)
+        ]
+        lights[1].is_on = True
+
+        await LifxLight.set_color_many(lights, "#ff0000")
+
+        for device in devices:
+            device.set_color.assert_called_once_with([0, 65535, 65535, 3500], 0, True)
+            device.get_color.assert_not_called()
+        devices[0].set_power.assert_called_once_with(65535, 0, True)
+        devices[1].set_power.assert_not_called()
+        assert all(light.color == "#ff0000" and light.is_on for light in lights)
+
+    def test_slotted(self):
+        """Test LIFX lights carry no per-instance __dict__."""
+        light = LifxLight(id="lifx_1", name="Lamp")
+        assert not hasattr(light, "__dict__")
+        assert light.device_type == DeviceType.LIGHT
+
+    @pytest.mark.asyncio
+    async def test_refresh_without_device(self):
+        """Test refresh marks an unconnected light offline."""
+        light = LifxLight(id="lifx_1", name="Lamp")
+        await light.refresh()
+        assert light.status == DeviceStatus.OFFLINE
+
+
+class TestCreateLifxLight:
+    """Tests for the LIFX factory."""
+
+    @pytest.fixture
+    def fake_lifxlan(self, monkeypatch):
+        """Install a fake lifxlan module with two discoverable bulbs."""
+        bulbs = []
+        for mac, label in [("aa:aa", "Desk"), ("bb:bb", "Floor Lamp")]:
+            bulb = make_lifx_device()
+            bulb.get_mac_addr.return_value = mac
+            bulb.get_label.return_value = label
+            bulbs.append(bulb)
+
+        module = MagicMock()
+        module.LifxLAN.return_value.get_lights.return_value = bulbs
+        monkeypatch.setitem(sys.modules, "lifxlan", module)
+        monkeypatch.setattr(lifx_module, "_discovered_at", None)
+        return module, bulbs
+
+    @pytest.mark.asyncio
+    async def test_find_by_mac(self, fake_lifxlan):
+        """Test locating a bulb by MAC probes every discovered bulb."""
+        _, bulbs = fake_lifxlan
+        config = DeviceConfig(id="lamp", name="Lamp", type="lifx", config={"mac": "BB:BB"})
+
+        light = await create_lifx_light(config, SecretsConfig())
+
+        assert light._lifx_device is bulbs[1]
+        assert all(b.get_mac_addr.called for b in bulbs)
+
+    @pytest.mark.asyncio
+    async def test_find_by_label_reuses_discovery(self, fake_lifxlan):
+        """Test discovery results are shared between factory calls."""
+        module, bulbs = fake_lifxlan
+        desk = DeviceConfig(id="desk", name="Desk", type="lifx")
+        floor = DeviceConfig(id="floor", name="Floor Lamp", type="lifx")
+
+        desk_light = await create_lifx_light(desk, SecretsConfig())
+        floor_light = await create_lifx_light(floor, SecretsConfig())
+
+        assert desk_light._lifx_device is bulbs[0]
+        assert floor_light._lifx_device is bulbs[1]
+        assert module.LifxLAN.return_value.get_lights.call_count == 1
+
+    def test_discovery_works_across_event_loops(self, fake_lifxlan, monkeypatch):
+        """Test contended discovery in one loop does not break the next loop."""
+
+        async def discover_twice():
+            monkeypatch.setattr(lifx_module, "_discovered_at", None)
+            module, _ = fake_lifxlan
+            return await asyncio.gather(
+                lifx_module._discover_lights(module), lifx_module._discover_lights(module)
+            )
+
+        for _ in range(2):
+            first, second = asyncio.run(discover_twice())
+            assert first is second
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_bulb_is_skipped(self, fake_lifxlan):
+        """Test a bulb that fails to answer does not abort the search."""
+        _, bulbs = fake_lifxlan
+        bulbs[0].get_label.side_effect = OSError("timeout")
+        config = DeviceConfig(id="floor", name="Floor Lamp", type="lifx")
+
+        light = await create_lifx_light(config, SecretsConfig())
+
+        assert light._lifx_device is bulbs[1]
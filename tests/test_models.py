@@ -1,7 +1,10 @@
 """Tests for device models."""
 
+import json
 import sys
+import time
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -12,13 +15,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from models.base import DeviceStatus, DeviceType
 from models.light import Light
 from models.lock import Lock, LockState
+from models.media_device import NowPlaying
 from models.plug import Plug
+from models.presence import PresenceState, RoomPresence
 from models.room import Room
 from models.vacuum import Vacuum, VacuumState
+from utils.serialization import dumps, loads
 
 
 # Concrete test implementations of abstract device classes
-@dataclass
+@dataclass(slots=True)
 class ConcreteLight(Light):
     """Concrete Light for testing."""
 
@@ -38,7 +44,7 @@ class ConcreteLight(Light):
         self.color_temp = kelvin
 
 
-@dataclass
+@dataclass(slots=True)
 class ConcreteLock(Lock):
     """Concrete Lock for testing."""
 
@@ -52,7 +58,7 @@ class ConcreteLock(Lock):
         self.lock_state = LockState.UNLOCKED
 
 
-@dataclass
+@dataclass(slots=True)
 class ConcretePlug(Plug):
     """Concrete Plug for testing."""
 
@@ -63,7 +69,7 @@ class ConcretePlug(Plug):
         self.is_on = on
 
 
-@dataclass
+@dataclass(slots=True)
 class ConcreteVacuum(Vacuum):
     """Concrete Vacuum for testing."""
 
@@ -125,6 +131,11 @@ class TestLockModel:
         state = mock_lock.to_state_dict()
         assert state["lock_state"] == "locked"
 
+    def test_lock_state_serializes_as_string(self, mock_lock):
+        """Test the enum in the state dict encodes as its plain value."""
+        assert loads(dumps(mock_lock.to_state_dict()))["lock_state"] == "locked"
+        assert json.dumps(mock_lock.to_state_dict()["lock_state"]) == '"locked"'
+
     def test_lock_states(self):
         """Test all lock states."""
         lock = ConcreteLock(id="test", name="Test")
@@ -206,6 +217,22 @@ class TestRoom:
         assert data["name"] == "Living Room"
         assert data["floor"] == 1
         assert data["occupied"] is False
+        assert data["last_presence_change"] is None
+
+    def test_room_to_dict_presence_time(self):
+        """Test the monotonic presence timestamp is reported as wall-clock time."""
+        room = Room(id="test", name="Test", last_presence_change=time.monotonic() - 60)
+        reported = datetime.fromisoformat(room.to_dict()["last_presence_change"])
+        assert abs((datetime.now() - reported).total_seconds() - 60) < 1
+
+    def test_room_presence_time_formatted_once(self):
+        """Test the presence time string is reused until the timestamp changes."""
+        room = Room(id="test", name="Test", last_presence_change=time.monotonic() - 60)
+        first = room.to_dict()["last_presence_change"]
+        assert room.to_dict()["last_presence_change"] is first
+
+        room.last_presence_change = time.monotonic()
+        assert room.to_dict()["last_presence_change"] != first
 
     def test_room_device_ids(self):
         """Test room device ID tracking."""
@@ -216,3 +243,21 @@ class TestRoom:
         assert len(room.device_ids) == 2
         assert "light_1" in room.device_ids
         assert "plug_1" in room.device_ids
+
+
+class TestSlottedModels:
+    """Tests that frequently created value models carry no instance dict."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Room(id="test", name="Test"),
+            RoomPresence(room_id="test"),
+            PresenceState(),
+            NowPlaying(title="Show"),
+        ],
+    )
+    def test_no_instance_dict(self, instance):
+        """Test the model is a slotted dataclass."""
+        assert not hasattr(instance, "__dict__")
+
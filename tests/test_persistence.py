@@ -2,7 +2,9 @@
 
 import asyncio
 from pathlib import Path
+from unittest.mock import AsyncMock
 
+import aiosqlite
 import pytest
 
 from persistence import StateStore
@@ -55,6 +57,28 @@ class TestStateStore:
         assert all_states["light_1"]["is_on"] is True
         assert all_states["plug_1"]["is_on"] is False
 
+    @pytest.mark.asyncio
+    async def test_save_device_states_bulk(self, store):
+        """Test saving many device states at once."""
+        await store.save_device_states([
+            ("light_1", "light", {"is_on": True}),
+            ("plug_1", "plug", {"is_on": False}),
+        ])
+
+        all_states = await store.load_all_device_states()
+
+        assert all_states == {"light_1": {"is_on": True}, "plug_1": {"is_on": False}}
+
+    @pytest.mark.asyncio
+    async def test_save_room_states_bulk(self, store):
+        """Test saving many room states at once."""
+        await store.save_room_states([("living_room", True), ("bedroom", False)])
+
+        assert await store.load_all_room_states() == {
+            "living_room": True,
+            "bedroom": False,
+        }
+
     @pytest.mark.asyncio
     async def test_update_device_state(self, store):
         """Test updating existing device state."""
@@ -191,3 +215,72 @@ class TestStateStore:
         # All states should be saved
         all_states = await store.load_all_device_states()
         assert len(all_states) == 3
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writes(self, store):
+        """Test reads proceed while a write holds the write lock."""
+        await store.save_device_state("light_1", "light", {"is_on": True})
+
+        async with store._write_lock:
+            loaded = await asyncio.wait_for(store.load_device_state("light_1"), timeout=1)
+
+        assert loaded == {"is_on": True}
+
+    @pytest.mark.asyncio
+    async def test_wal_mode_enabled(self, store):
+        """Test the database uses write-ahead logging."""
+        async with store._db.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+        assert row[0] == "wal"
+
+    @pytest.mark.asyncio
+    async def test_flush_commits_pending_writes(self, store):
+        """Test flush makes writes visible to other connections."""
+        await store.save_device_state("light_1", "light", {"is_on": True})
+        await store.flush()
+
+        async with aiosqlite.connect(str(store.db_path)) as db:
+            async with db.execute(
+                "SELECT device_id FROM device_state"
+            ) as cursor:
+                rows = await cursor.fetchall()
+        assert rows == [("light_1",)]
+
+    @pytest.mark.asyncio
+    async def test_close_commits_pending_writes(self, tmp_path: Path):
+        """Test closing the store commits writes the loop has not flushed."""
+        store = StateStore(tmp_path / "close.db")
+        await store.initialize()
+        await store.save_room_state("kitchen", True)
+        await store.close()
+
+        reopened = StateStore(tmp_path / "close.db")
+        await reopened.initialize()
+        try:
+            assert await reopened.load_room_state("kitchen") is True
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_commit_failures_back_off(self, store, monkeypatch):
+        """Test a commit that keeps failing is retried less and less often."""
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            if len(delays) >= 4:
+                store._commit_task.cancel()
+            await real_sleep(0)
+
+        monkeypatch.setattr("persistence.asyncio.sleep", record_sleep)
+        monkeypatch.setattr(store, "flush", AsyncMock(side_effect=OSError("disk full")))
+        store._commit_task.cancel()
+        store._commit_task = asyncio.create_task(store._commit_loop())
+        store._dirty.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await store._commit_task
+        store._commit_task = None
+
+        assert delays == [0.05, 0.1, 0.2, 0.4]
@@ -0,0 +1,194 @@
+"""Tests for mmWave presence detection."""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from presence import PresenceManager
+from presence.mmwave import MmWaveSensor
+
+
+class FakeMqttClient:
+    """Minimal stand-in for aiomqtt.Client that records subscriptions."""
+
+    def __init__(self, **kwargs):
+        self.subscribe = AsyncMock()
+        self.subscribed = asyncio.Event()
+        self.subscribe.side_effect = lambda *args, **kwargs: self.subscribed.set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    @property
+    def messages(self):
+        return self._messages()
+
+    async def _messages(self):
+        await asyncio.Event().wait()
+        yield  # pragma: no cover
+
+
+class TestPresenceManager:
+    """Tests for PresenceManager."""
+
+    @pytest.fixture
+    def fake_aiomqtt(self, monkeypatch):
+        """Install a fake aiomqtt module that hands out one client."""
+        client = FakeMqttClient()
+        module = MagicMock()
+        module.Client.return_value = client
+        monkeypatch.setitem(sys.modules, "aiomqtt", module)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_subscribes_in_one_request(self, fake_aiomqtt):
+        """Test all sensor topics are subscribed with a single call."""
+        manager = PresenceManager()
+        manager.add_sensor("s1", "living_room", "zigbee2mqtt/living")
+        manager.add_sensor("s2", "living_room", "zigbee2mqtt/living")
+        manager.add_sensor("s3", "bedroom", "zigbee2mqtt/bedroom")
+
+        await manager.start()
+        await asyncio.wait_for(fake_aiomqtt.subscribed.wait(), timeout=1)
+        await manager.stop()
+
+        fake_aiomqtt.subscribe.assert_awaited_once_with(
+            [
+                ("zigbee2mqtt/bedroom/#", 0),
+                ("zigbee2mqtt/living/#", 0),
+                ("zigbee2mqtt/bedroom", 0),
+                ("zigbee2mqtt/living", 0),
+            ]
+        )
+
+    @pytest.mark.asyncio
+    async def test_message_updates_room(self):
+        """Test a presence payload marks the room occupied and fires the callback."""
+        changes = []
+        manager = PresenceManager()
+        manager.add_sensor("s1", "living_room", "zigbee2mqtt/living")
+        manager.set_presence_callback(lambda room, occupied: changes.append((room, occupied)))
+
+        manager._handle_message("zigbee2mqtt/living/occupancy", b"ON")
+        assert manager.is_room_occupied("living_room")
+        assert changes == []
+
+        await asyncio.sleep(manager.coalesce_window * 2)
+        assert changes == [("living_room", True)]
+
+    @pytest.mark.asyncio
+    async def test_payload_parsing(self):
+        """Test payloads are matched case- and whitespace-insensitively."""
+        manager = PresenceManager()
+        manager.add_sensor("s1", "living_room", "zigbee2mqtt/living")
+
+        for payload, occupied in [
+            (b" Detected\n", True),
+            (b"\tTRUE\r\n", True),
+            (bytearray(b"ON"), True),
+            (b"off", False),
+            (b"\xff", False),
+        ]:
+            manager._handle_message("zigbee2mqtt/living", payload)
+            assert manager.is_room_occupied("living_room") is occupied
+
+        manager._handle_message("zigbee2mqtt/living", b"1")
+        manager._handle_message("zigbee2mqtt/living", 0)
+        assert manager.is_room_occupied("living_room")
+
+    @pytest.mark.asyncio
+    async def test_changes_coalesced(self):
+        """Test rapid changes in a room produce one callback with the final state."""
+        changes = []
+        manager = PresenceManager(coalesce_window=0.01)
+        manager.add_sensor("s1", "living_room", "zigbee2mqtt/living1")
+        manager.add_sensor("s2", "living_room", "zigbee2mqtt/living2")
+        manager.add_sensor("s3", "bedroom", "zigbee2mqtt/bedroom")
+        manager.set_presence_callback(lambda room, occupied: changes.append((room, occupied)))
+
+        manager._handle_message("zigbee2mqtt/living1", b"ON")
+        manager._handle_message("zigbee2mqtt/living2", b"ON")
+        manager._handle_message("zigbee2mqtt/living1", b"OFF")
+        manager._handle_message("zigbee2mqtt/bedroom", b"ON")
+        manager._handle_message("zigbee2mqtt/bedroom", b"OFF")
+        await asyncio.sleep(0.05)
+
+        # s2 still sees someone; the bedroom flapped back to empty
+        assert changes == [("living_room", True), ("bedroom", False)]
+
+        manager._handle_message("zigbee2mqtt/bedroom", b"ON")
+        manager._handle_message("zigbee2mqtt/bedroom", b"OFF")
+        await asyncio.sleep(0.05)
+        assert changes == [("living_room", True), ("bedroom", False)]
+
+    @pytest.mark.asyncio
+    async def test_message_routed_by_topic_prefix(self):
+        """Test messages reach the sensor whose topic is the longest prefix."""
+        manager = PresenceManager()
+        manager.add_sensor("hall", "hallway", "home/hall")
+        manager.add_sensor("hall_upper", "landing", "home/hall/upper")
+
+        manager._handle_message("home/hall/upper/occupancy", b"ON")
+        manager._handle_message("home/hallway", b"ON")
+        manager._handle_message("other/topic", b"ON")
+
+        assert manager.is_room_occupied("landing")
+        assert not manager.is_room_occupied("hallway")
+        assert not manager.is_room_occupied("unknown")
+
+    def test_topic_matches_cached(self):
+        """Test resolved topics are remembered and forgotten when sensors change."""
+        manager = PresenceManager()
+        manager.add_sensor("hall", "hallway", "home/hall")
+
+        assert manager._find_sensor("home/hall/occupancy").id == "hall"
+        assert manager._find_sensor("home/hall/upper/occupancy").id == "hall"
+        assert "home/hall/occupancy" in manager._topic_matches
+
+        manager.add_sensor("hall_upper", "landing", "home/hall/upper")
+        assert manager._find_sensor("home/hall/upper/occupancy").id == "hall_upper"
+
+    def test_add_sensors_indexes_once(self, monkeypatch):
+        """Test a batch of sensors rebuilds the lookups a single time."""
+        manager = PresenceManager()
+        calls = 0
+        index = manager._index_sensors
+
+        def counting_index():
+            nonlocal calls
+            calls += 1
+            index()
+
+        monkeypatch.setattr(manager, "_index_sensors", counting_index)
+        manager.add_sensors(
+            [("s1", "living_room", "home/living"), ("s2", "bedroom", "home/bedroom")]
+        )
+
+        assert calls == 1
+        assert manager._find_sensor("home/bedroom/occupancy").id == "s2"
+
+
+class TestMmWaveSensor:
+    """Tests for MmWaveSensor."""
+
+    def test_to_dict(self):
+        """Test serialization reports the update time as wall-clock ISO time."""
+        sensor = MmWaveSensor("s1", "living_room", "zigbee2mqtt/living")
+        assert sensor.to_dict()["last_update"] is None
+
+        sensor.occupied = True
+        sensor.last_update = time.monotonic()
+        data = sensor.to_dict()
+
+        assert data["occupied"] is True
+        last_update = datetime.fromisoformat(data["last_update"])
+        assert abs((datetime.now() - last_update).total_seconds()) < 1
+        assert not hasattr(sensor, "__dict__")
+
@@ -4,6 +4,7 @@ import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -17,10 +18,11 @@ from models.media_device import (
 )
 from persistence import StateStore
 from recommendation import RecommendationEngine
+from recommendation.tracker import ViewingTracker
 
 
 # Concrete test implementation of MediaDevice
-@dataclass
+@dataclass(slots=True)
 class TestMediaDevice(MediaDevice):
     """Concrete MediaDevice implementation for testing."""
 
@@ -325,6 +327,28 @@ class TestViewingHistory:
         assert frequent[1]["watch_count"] == 2
 
 
+class TestViewingTracker:
+    """Tests for the background viewing tracker."""
+
+    async def test_poll_refreshes_media_devices_together(
+        self, store: StateStore, test_media_device: TestMediaDevice
+    ):
+        """Test one poll refreshes all media devices in a single batch."""
+        other = TestMediaDevice(id="bedroom_appletv", name="Bedroom AppleTV")
+        device_manager = MagicMock()
+        device_manager.get_all_devices.return_value = [test_media_device, other]
+        device_manager.refresh_devices = AsyncMock()
+        tracker = ViewingTracker(device_manager, store)
+
+        await tracker._poll_once()
+
+        device_manager.refresh_devices.assert_awaited_once()
+        refreshed = list(device_manager.refresh_devices.await_args.args[0])
+        assert refreshed == ["test_appletv", "bedroom_appletv"]
+        assert device_manager.refresh_devices.await_args.kwargs == {"record": False}
+        assert set(tracker.get_active_sessions()) == {"test_appletv"}
+
+
 class TestContentPreferences:
     """Tests for content preferences/ratings."""
 
@@ -7,12 +7,14 @@ import pytest
 
 from utils.errors import (
     DEFAULT_DEVICE_TIMEOUT,
+    MAX_ERROR_MESSAGE_LENGTH,
     DeviceOfflineError,
     DeviceTimeoutError,
     ErrorCategory,
     RateLimitedError,
     ToolError,
     classify_exception,
+    error_message,
     execute_with_timeout,
     generate_request_id,
     get_recovery_suggestion,
@@ -83,6 +85,14 @@ class TestErrorClassification:
         assert error.device_id == "my-device"
         assert "my-device" in error.message
 
+    def test_long_messages_truncated(self):
+        """Test oversized exception text is cut down in the structured error."""
+        exc = ValueError("x" * 10_000)
+        error = classify_exception(exc)
+        assert len(error.message) == MAX_ERROR_MESSAGE_LENGTH
+        assert error.message.endswith("...")
+        assert error_message(ValueError("short")) == "short"
+
 
 class TestToolError:
     """Tests for ToolError class."""
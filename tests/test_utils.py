@@ -1,6 +1,7 @@
 """Tests for utility modules."""
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -14,6 +15,7 @@ from utils.retry import (
     with_circuit_breaker,
     with_retry,
 )
+from utils.serialization import dumps, dumps_bytes, loads
 
 
 class TestRetry:
@@ -313,3 +315,29 @@ class TestHealthMonitor:
 
         health = monitor.get_device_health("test_device")
         assert health is None
+
+
+class TestSerialization:
+    """Tests for JSON serialization helpers."""
+
+    def test_dumps_matches_stdlib(self):
+        """Test output parses back to the same value with either backend."""
+        data = {"id": "light_1", "state": {"is_on": True, "brightness": 50}, "tags": []}
+        assert json.loads(dumps(data)) == data
+        assert json.loads(dumps(data, indent=True)) == data
+        assert json.loads(dumps_bytes(data)) == data
+        assert loads(json.dumps(data)) == data
+        assert loads(dumps_bytes(data)) == data
+
+    def test_dumps_indent(self):
+        """Test indented output uses two spaces and plain output has none."""
+        assert dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test serialization works without orjson installed."""
+        monkeypatch.setattr("utils.serialization.orjson", None)
+        assert dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+        assert dumps_bytes({"name": "Café"}) == '{"name":"Café"}'.encode()
+        assert loads('{"name": "Café"}') == {"name": "Café"}